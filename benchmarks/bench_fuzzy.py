@@ -0,0 +1,39 @@
+"""FUZZY duplicate search: pairwise compare_entries vs batch rapidfuzz cdist
+
+    python benchmarks/bench_fuzzy.py [-n 10000 100000]
+
+The pairwise time is extrapolated from a random sample of pairs.
+"""
+from __future__ import print_function
+import argparse
+import os
+import sys
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from papers.bib import are_duplicates, fuzzy_duplicate_pairs
+from common import synthetic_entries, timeit
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--entries', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--sample', type=int, default=10000, help='pairs sampled for the pairwise estimate')
+    parser.add_argument('--repeat', type=int, default=1)
+    o = parser.parse_args()
+
+    print('{:>8} {:>20} {:>16} {:>10} {:>8}'.format('entries', 'pairwise (s, est.)', 'batch (s)', 'pairs', 'speedup'))
+    for n in o.entries:
+        entries = synthetic_entries(n)
+        rng = random.Random(0)
+        sample = [rng.sample(entries, 2) for _ in range(o.sample)]
+        t_pair = timeit(lambda: [are_duplicates(a, b, similarity='FUZZY') for a, b in sample], o.repeat)
+        t_pair *= n*(n-1)/2./o.sample
+        pairs = []
+        t_batch = timeit(lambda: pairs.append(len(fuzzy_duplicate_pairs(entries))), o.repeat)
+        print('{:>8} {:>20.1f} {:>16.1f} {:>10} {:>7.0f}x'.format(n, t_pair, t_batch, pairs[-1], t_pair/t_batch))
+
+
+if __name__ == '__main__':
+    main()
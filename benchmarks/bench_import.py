@@ -0,0 +1,40 @@
+"""import time of papers modules (python -X importtime), median over runs
+
+    python benchmarks/bench_import.py [--runs 20]
+
+Modules are byte-compiled first, so that timings do not include compilation.
+"""
+from __future__ import print_function
+import argparse
+import compileall
+import os
+
+from common import ROOT, importtime, median
+
+STATEMENTS = [
+    'import papers.latexenc',
+    'import papers.latexenc as l; l.latex_to_unicode(r"Garc{\\\'\\i}a")',
+    'import papers.bib',
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--modules', nargs='+', default=['papers.latexenc', 'papers.latextables'],
+        help='modules whose self time is reported')
+    o = parser.parse_args()
+
+    compileall.compile_dir(os.path.join(ROOT, 'papers'), quiet=1)
+
+    print('{:<70} {:>10} {:>10}'.format('statement', 'total (ms)', 'latex (ms)'))
+    for statement in STATEMENTS:
+        runs = [importtime(statement) for _ in range(o.runs)]
+        top = statement.split(';')[0].split()[1]
+        total = median([t[top][1] for t in runs])
+        selected = median([sum(t[m][0] for m in o.modules if m in t) for t in runs])
+        print('{:<70} {:>10.1f} {:>10.1f}'.format(statement, total*1e3, selected*1e3))
+
+
+if __name__ == '__main__':
+    main()
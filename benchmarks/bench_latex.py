@@ -0,0 +1,57 @@
+"""latex encoding of a library: per-character lookup vs str.translate batch
+
+    python benchmarks/bench_latex.py [-n 100000]
+
+Entries are synthetic, with unicode author names (about half are non-ascii).
+"""
+from __future__ import print_function
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from papers.latexenc import latex_to_unicode, unicode_to_latex_map
+from papers.encoding import encode_entries_latex
+from common import synthetic_entries, timeit
+
+
+def encode_latex_ref(string):
+    return ''.join(unicode_to_latex_map.get(c, c) if ord(c) >= 128 else c for c in string)
+
+
+def encode_entries_ref(entries):
+    for e in entries:
+        for k in e:
+            if k == k.lower() and k != 'abstract':
+                e[k] = encode_latex_ref(e[k])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--entries', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3)
+    o = parser.parse_args()
+
+    entries = synthetic_entries(o.entries)
+    for e in entries:
+        e['author'] = latex_to_unicode(e['author'])
+
+    def run(encode):
+        copies = [[dict(e) for e in entries] for _ in range(o.repeat)]
+        return timeit(lambda: encode(copies.pop()), o.repeat)
+
+    t_ref = run(encode_entries_ref)
+    t_new = run(encode_entries_latex)
+    ref, new = [dict(e) for e in entries], [dict(e) for e in entries]
+    encode_entries_ref(ref)
+    encode_entries_latex(new)
+    assert ref == new
+
+    print('{} entries'.format(len(entries)))
+    print('{:>12} {:>10} {:>10}'.format('', 'time (s)', 'speedup'))
+    for name, t in [('per-char', t_ref), ('translate', t_new)]:
+        print('{:>12} {:>10.2f} {:>9.0f}x'.format(name, t, t_ref/t))
+
+if __name__ == '__main__':
+    main()
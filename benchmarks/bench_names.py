@@ -0,0 +1,67 @@
+"""author name parsing: getnames-based standard_name / family_names vs memoized parser
+
+    python benchmarks/bench_names.py [-n 100000]
+
+Author fields are synthetic, with as many distinct strings as a real library
+(most authors appear in several entries).
+"""
+from __future__ import print_function
+import argparse
+import os
+import sys
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import bibtexparser
+from papers.encoding import standard_name, family_names, strip_outmost_brackets, _family_names
+from papers.latexenc import latex_to_unicode
+from common import synthetic_author, timeit
+
+
+def standard_name_ref(author):
+    names = []
+    for name in bibtexparser.customization.getnames([strip_outmost_brackets(nm) for nm in author.split(' and ')]):
+        family, given = name.split(',')
+        family = strip_outmost_brackets(family.strip())
+        names.append(', '.join([family.strip(), given.strip()]))
+    return ' and '.join(names)
+
+
+def family_names_ref(author_field):
+    authors = standard_name_ref(author_field).split(' and ')
+    return [latex_to_unicode(nm.split(',')[0]) for nm in authors]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--entries', type=int, default=100000)
+    parser.add_argument('--distinct', type=float, default=0.3, help='fraction of distinct author fields')
+    o = parser.parse_args()
+
+    rng = random.Random(0)
+    distinct = [synthetic_author(rng) for _ in range(max(1, int(o.entries*o.distinct)))]
+    authors = [rng.choice(distinct) for _ in range(o.entries)]
+
+    def run(standard_name, family_names):
+        for a in authors:
+            standard_name(a)
+            family_names(a)
+
+    def clear():
+        standard_name.cache_clear()
+        _family_names.cache_clear()
+
+    t_ref = timeit(lambda: run(standard_name_ref, family_names_ref), 1)
+    t_cold = timeit(lambda: (clear(), run(standard_name, family_names)), 1)
+    t_warm = timeit(lambda: run(standard_name, family_names), 1)
+    assert all(standard_name(a) == standard_name_ref(a) for a in distinct[:1000])
+
+    print('{} author fields ({} distinct)'.format(len(authors), len(distinct)))
+    print('{:>12} {:>10} {:>10}'.format('', 'time (s)', 'speedup'))
+    for name, t in [('reference', t_ref), ('cold cache', t_cold), ('warm cache', t_warm)]:
+        print('{:>12} {:>10.2f} {:>9.0f}x'.format(name, t, t_ref/t))
+
+
+if __name__ == '__main__':
+    main()
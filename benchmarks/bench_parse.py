@@ -0,0 +1,39 @@
+"""parse throughput (entries/second): bibtexparser.loads vs papers' fast parser
+
+    python benchmarks/bench_parse.py [-n 1000 10000]
+"""
+from __future__ import print_function
+import argparse
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import bibtexparser
+from papers.encoding import parse_bibtex_file
+from common import synthetic_bibtex, timeit
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--entries', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--repeat', type=int, default=3)
+    o = parser.parse_args()
+
+    print('{:>8} {:>22} {:>22} {:>8}'.format('entries', 'bibtexparser (e/s)', 'fast parser (e/s)', 'speedup'))
+    for n in o.entries:
+        bibtex = tempfile.mktemp(suffix='.bib')
+        with open(bibtex, 'w') as f:
+            f.write(synthetic_bibtex(n))
+        try:
+            t_ref = timeit(lambda: bibtexparser.loads(open(bibtex).read()), o.repeat)
+            t_new = timeit(lambda: parse_bibtex_file(bibtex), o.repeat)
+            assert bibtexparser.loads(open(bibtex).read()).entries == parse_bibtex_file(bibtex).entries
+        finally:
+            os.remove(bibtex)
+        print('{:>8} {:>22.0f} {:>22.0f} {:>7.1f}x'.format(n, n/t_ref, n/t_new, t_ref/t_new))
+
+
+if __name__ == '__main__':
+    main()
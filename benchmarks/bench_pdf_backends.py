@@ -0,0 +1,70 @@
+"""pdf text backends: header extraction throughput and DOI hit rate
+
+    python benchmarks/bench_pdf_backends.py [pdf or directory ...] [--backends poppler pypdf pdfminer]
+
+Defaults to the pdfs downloaded by the tests (tests/downloadedpapers).
+Backends that are not installed are skipped. The DOI hit rate is the fraction
+of pdfs where a DOI is found in the header, and where it agrees with the first backend.
+"""
+from __future__ import print_function
+import argparse
+import os
+import sys
+import subprocess as sp
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from papers import extract
+from common import ROOT, find_pdfs, timeit
+
+
+def header_doi(txt):
+    """like extract.parse_doi, without asking the user
+    """
+    matches = extract.REGEXP.findall(' '+txt.lower()+' ')
+    return matches[0].replace('\n','').strip('.') if matches else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('pdfs', nargs='*', default=[os.path.join(ROOT, 'tests', 'downloadedpapers')])
+    parser.add_argument('--backends', nargs='+', default=list(extract.PDF_BACKENDS))
+    parser.add_argument('--minwords', type=int, default=300)
+    parser.add_argument('--repeat', type=int, default=3)
+    o = parser.parse_args()
+
+    pdfs = list(find_pdfs(o.pdfs))
+    if not pdfs:
+        parser.error('no pdf found (run the tests first to download some)')
+
+    backends = []
+    for name in o.backends:
+        try:
+            backends.append(extract.pdf_backend(name))
+            if name == 'poppler':
+                sp.check_call(['pdftotext', '-v'], stdout=sp.PIPE, stderr=sp.PIPE)
+        except ValueError as error:
+            print('skip:', error)
+        except OSError:
+            backends.pop()
+            print('skip: pdftotext is not installed')
+    if not backends:
+        parser.error('no pdf backend available')
+
+    print('{} pdf(s)'.format(len(pdfs)))
+    print('{:>10} {:>10} {:>10} {:>10} {:>10}'.format('backend', 'ms/pdf', 'speedup', 'doi found', 'doi agree'))
+    reference = None
+    t_ref = None
+    for backend in backends:
+        t = timeit(lambda: [extract.pdfhead(pdf, minwords=o.minwords, backend=backend.name, cache=False) for pdf in pdfs], o.repeat)
+        dois = [header_doi(extract.pdfhead(pdf, minwords=o.minwords, backend=backend.name, cache=False)) for pdf in pdfs]
+        if reference is None:
+            reference, t_ref = dois, t
+        found = sum(doi is not None for doi in dois)
+        agree = sum(doi is not None and doi == ref for doi, ref in zip(dois, reference))
+        print('{:>10} {:>10.1f} {:>9.1f}x {:>9.0f}% {:>9.0f}%'.format(
+            backend.name, t*1000/len(pdfs), t_ref/t, 100.*found/len(pdfs), 100.*agree/len(pdfs)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""pdf header extraction: one pdftotext process per page vs one streamed process vs cache
+
+    python benchmarks/bench_pdfhead.py [pdf or directory ...] [--minwords 300]
+
+Defaults to the pdfs downloaded by the tests (tests/downloadedpapers).
+Requires pdftotext (poppler-utils). The cache directory is redirected to a
+temporary directory.
+"""
+from __future__ import print_function
+import argparse
+import os
+import sys
+import subprocess as sp
+import tempfile
+import shutil
+import functools
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from papers.config import config
+from papers import extract
+from common import ROOT, find_pdfs, timeit
+
+
+def pdfhead_per_page(pdf, maxpages=12, minwords=300):
+    """previous implementation: one pdftotext call (and temporary file) per page
+    """
+    i = 0
+    txt = ''
+    while len(txt.split()) < minwords and i < maxpages:
+        i += 1
+        tmptxt = tempfile.mktemp(suffix='.txt')
+        extract.stats['subprocesses'] += 1
+        sp.check_call(['pdftotext', '-f', str(i), '-l', str(i), pdf, tmptxt])
+        txt += open(tmptxt).read()
+        os.remove(tmptxt)
+    return txt
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('pdfs', nargs='*', default=[os.path.join(ROOT, 'tests', 'downloadedpapers')])
+    parser.add_argument('--minwords', type=int, default=300)
+    parser.add_argument('--repeat', type=int, default=3)
+    o = parser.parse_args()
+
+    pdfs = list(find_pdfs(o.pdfs))
+    if not pdfs:
+        parser.error('no pdf found (run the tests first to download some)')
+    try:
+        sp.check_call(['pdftotext', '-v'], stdout=sp.PIPE, stderr=sp.PIPE)
+    except OSError:
+        parser.error('pdftotext is not installed')
+
+    print('{} pdf(s)'.format(len(pdfs)))
+    print('{:>10} {:>14} {:>14} {:>8}'.format('', 'processes/pdf', 'ms/pdf', 'speedup'))
+    tmpdir = tempfile.mkdtemp()
+    config.cache = tmpdir
+    streamed = functools.partial(extract.pdfhead, cache=False)
+    results = []
+    try:
+        for name, func in [('per page', pdfhead_per_page), ('streamed', streamed), ('cached', extract.pdfhead)]:
+            extract.stats.clear()
+            t = timeit(lambda: [func(pdf, minwords=o.minwords) for pdf in pdfs], o.repeat)
+            processes = extract.stats['subprocesses'] / float(o.repeat * len(pdfs))
+            results.append((name, processes, t))
+        for name, processes, t in results:
+            print('{:>10} {:>14.1f} {:>14.1f} {:>7.1f}x'.format(name, processes, t*1000/len(pdfs), results[0][2]/t))
+        assert all(extract.pdfhead(pdf, minwords=o.minwords) == streamed(pdf, minwords=o.minwords)
+            == pdfhead_per_page(pdf, minwords=o.minwords) for pdf in pdfs)
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""saving a library after a few changes: full rewrite vs unchanged entries copied
+
+    python benchmarks/bench_save.py [-n 10000 100000] [--changes 10]
+
+The cache directory is redirected to a temporary directory.
+"""
+from __future__ import print_function
+import argparse
+import os
+import sys
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from papers.config import config
+from papers.cache import index_file
+from common import synthetic_bibtex, timeit
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--entries', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--changes', type=int, default=10, help='modified entries per save')
+    o = parser.parse_args()
+
+    from papers.bib import Biblio
+
+    tmpdir = tempfile.mkdtemp()
+    config.cache = os.path.join(tmpdir, 'cache')
+    bibtex = os.path.join(tmpdir, 'papers.bib')
+
+    def modify_and_save(full):
+        my = Biblio.load(bibtex, '')
+        for e in my.entries[::len(my.entries)//o.changes][:o.changes]:
+            e['note'] = str(int(e.get('note', 0)) + 1)
+        if full:
+            os.remove(index_file(bibtex))  # no index of a file written by save: format everything
+        return timeit(lambda: my.save(bibtex), 1)
+
+    print('{:>8} {:>14} {:>14} {:>8}'.format('entries', 'full (s)', 'incremental (s)', 'speedup'))
+    try:
+        for n in o.entries:
+            with open(bibtex, 'w') as f:
+                f.write(synthetic_bibtex(n))
+            t_full = min(modify_and_save(full=True) for _ in range(2))
+            t_incr = min(modify_and_save(full=False) for _ in range(2))
+            print('{:>8} {:>14.2f} {:>14.2f} {:>7.1f}x'.format(n, t_full, t_incr, t_full/t_incr))
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    main()
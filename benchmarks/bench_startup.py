@@ -0,0 +1,55 @@
+"""cold-start time of papers commands (python -X importtime), median over runs
+
+    python benchmarks/bench_startup.py [-n 10000] [--runs 10]
+
+Commands run in a fresh interpreter on a synthetic library. Reported: wall
+time of the process, import time of papers.bib, and which of the heavy
+dependencies got imported.
+"""
+from __future__ import print_function
+import argparse
+import compileall
+import os
+import shutil
+import tempfile
+import time
+
+from common import ROOT, importtime, median, synthetic_bibtex
+
+COMMANDS = ['status', 'list -k', 'list -k --key {key}']
+HEAVY = ['bibtexparser', 'crossref', 'requests', 'numpy', 'rapidfuzz', 'papers._version']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--entries', type=int, default=10000)
+    parser.add_argument('--runs', type=int, default=10)
+    o = parser.parse_args()
+
+    compileall.compile_dir(os.path.join(ROOT, 'papers'), quiet=1)
+    tmpdir = tempfile.mkdtemp()
+    try:
+        bibtex = synthetic_bibtex(o.entries)
+        key = bibtex.split('{', 2)[1].split(',')[0]
+        with open(os.path.join(tmpdir, 'papers.bib'), 'w') as f:
+            f.write(bibtex)
+
+        print('{:<28} {:>10} {:>14}  {}'.format('command', 'wall (ms)', 'import (ms)', 'heavy imports'))
+        for command in COMMANDS:
+            argv = ['papers'] + command.format(key=key).split() + ['--bibtex', 'papers.bib']
+            statement = 'import sys; sys.argv = {!r}; import papers.bib; papers.bib.main()'.format(argv)
+            walls, imports, heavy = [], [], set()
+            for _ in range(o.runs):
+                t0 = time.time()
+                times = importtime(statement, cwd=tmpdir)
+                walls.append(time.time() - t0)
+                imports.append(times['papers.bib'][1])
+                heavy.update(m for m in HEAVY if any(t == m or t.startswith(m+'.') for t in times))
+            print('{:<28} {:>10.0f} {:>14.0f}  {}'.format(command.format(key='KEY'), median(walls)*1e3,
+                median(imports)*1e3, ' '.join(sorted(heavy)) or '-'))
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    main()
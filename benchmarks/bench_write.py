@@ -0,0 +1,34 @@
+"""write throughput (entries/second): bibtexparser.dumps vs papers' writer
+
+    python benchmarks/bench_write.py [-n 1000 10000 100000]
+"""
+from __future__ import print_function
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import bibtexparser
+from papers.encoding import format_bibtex
+from common import synthetic_entries, timeit
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--entries', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--repeat', type=int, default=3)
+    o = parser.parse_args()
+
+    print('{:>8} {:>22} {:>22} {:>8}'.format('entries', 'bibtexparser (e/s)', 'papers writer (e/s)', 'speedup'))
+    for n in o.entries:
+        db = bibtexparser.bibdatabase.BibDatabase()
+        db.entries.extend(synthetic_entries(n))
+        t_ref = timeit(lambda: bibtexparser.dumps(db), o.repeat)
+        t_new = timeit(lambda: format_bibtex(db), o.repeat)
+        assert bibtexparser.dumps(db) == format_bibtex(db)
+        print('{:>8} {:>22.0f} {:>22.0f} {:>7.1f}x'.format(n, n/t_ref, n/t_new, t_ref/t_new))
+
+
+if __name__ == '__main__':
+    main()
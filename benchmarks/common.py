@@ -0,0 +1,105 @@
+"""helpers shared by the benchmark scripts (synthetic library, pdf corpus, timing)
+"""
+from __future__ import print_function
+import os
+import random
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+FAMILY = ['Perrette', 'Yool', 'Quartly', 'Popova', 'Landerer', 'Riva', 'Frieler',
+          'Meinshausen', 'M{\\"u}ller', 'van der Berg', 'de la Fuente', 'Garc{\\\'\\i}a',
+          'Smith', 'Nguyen', 'O\'Brien', 'Schr{\\"o}dinger', 'Dupont', 'Rossi']
+GIVEN = ['M.', 'A.', 'G. D.', 'E. E.', 'F.', 'R.', 'K.', 'Jean-Pierre', 'Mar{\\\'\\i}a', 'J. R. R.']
+WORDS = ['ice', 'edge', 'blooms', 'Arctic', 'sea', 'level', 'rise', 'regional',
+         'uncertainties', 'scaling', 'approach', 'ocean', 'model', 'climate', 'carbon',
+         'the', 'of', 'in', 'a', 'for', 'observations', 'satellite', 'variability']
+JOURNALS = ['Biogeosciences', 'Earth System Dynamics', 'Nature', 'Journal of Climate']
+
+
+def synthetic_author(rng):
+    n = rng.randint(1, 6)
+    return ' and '.join(rng.choice(GIVEN)+' '+rng.choice(FAMILY) for _ in range(n))
+
+
+def synthetic_entries(n, seed=0):
+    """generate n bibtex entries (dict) in the layout papers writes
+    """
+    rng = random.Random(seed)
+    entries = []
+    for i in range(n):
+        year = str(rng.randint(1950, 2020))
+        author = synthetic_author(rng)
+        e = {
+            'ENTRYTYPE': 'article',
+            'ID': '{}_{}_{}'.format(author.split(' and ')[0].split()[-1], year, i),
+            'author': author,
+            'title': ' '.join(rng.choice(WORDS) for _ in range(rng.randint(4, 14))).capitalize(),
+            'journal': rng.choice(JOURNALS),
+            'year': year,
+            'volume': str(rng.randint(1, 50)),
+            'pages': '{}--{}'.format(rng.randint(1, 100), rng.randint(101, 300)),
+            'doi': '10.{}/synthetic-{}'.format(rng.randint(1000, 9999), i),
+            'file': ':/home/user/papers/{}/{}.pdf:pdf'.format(year, i),
+        }
+        if rng.random() < 0.3:
+            e['abstract'] = ' '.join(rng.choice(WORDS) for _ in range(80))
+        if rng.random() < 0.2:
+            e['keywords'] = 'tag{}'.format(rng.randint(1, 5))
+        entries.append(e)
+    return entries
+
+
+def synthetic_bibtex(n, seed=0):
+    import bibtexparser
+    db = bibtexparser.bibdatabase.BibDatabase()
+    db.entries.extend(synthetic_entries(n, seed))
+    return bibtexparser.dumps(db)
+
+
+def find_pdfs(paths):
+    """pdf files given as arguments, or found in directories
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                for file in sorted(files):
+                    if file.endswith('.pdf'):
+                        yield os.path.join(root, file)
+        else:
+            yield path
+
+
+def timeit(func, repeat=3):
+    """best wall-clock time of `repeat` calls, in seconds
+    """
+    best = None
+    for _ in range(repeat):
+        t0 = time.time()
+        func()
+        dt = time.time() - t0
+        best = dt if best is None else min(best, dt)
+    return best
+
+
+def importtime(statement, cwd=None):
+    """run python -X importtime -c statement: {module: (self, cumulative)} in seconds
+    """
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    out = subprocess.check_output([sys.executable, '-X', 'importtime', '-c', statement],
+        stderr=subprocess.STDOUT, env=env, cwd=cwd).decode()
+    times = {}
+    for line in out.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(self_)*1e-6, int(cumulative)*1e-6)
+    return times
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values)//2]
@@ -1,9 +1,20 @@
+import sys
+import logging
+logging.basicConfig()
+logger = logging.getLogger(__name__)
 
 
-from ._version import get_versions
-__version__ = get_versions()['version']
-del get_versions
+def _get_version():
+    # may call git: only done when __version__ is needed
+    from ._version import get_versions
+    return get_versions()['version']
 
-import logging
-logging.basicConfig()
-logger = logging.getLogger(__name__)
\ No newline at end of file
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name == '__version__':
+            global __version__
+            __version__ = _get_version()
+            return __version__
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+else:
+    __version__ = _get_version()
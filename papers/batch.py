@@ -0,0 +1,103 @@
+"""papers batch: run many commands against libraries loaded once
+
+Commands are read one per line, in shell syntax (a leading `papers` is
+optional, `#` starts a comment):
+
+    check --keys Perrette_2011 --tag reviewed --force
+    list --duplicates -k
+
+Libraries are loaded on first use and kept in memory for the next commands.
+Modified libraries are saved (and committed) once, after the last command,
+along with the cache files of duplicate checks (see papers.cache.dump_pickle).
+If any command fails, nothing is saved.
+"""
+import os
+import shlex
+
+from papers import logger
+import papers.config
+
+EXCLUDED = ('install', 'undo', 'serve', 'batch', 'git')
+
+
+class BatchError(ValueError):
+    pass
+
+
+class BatchLibraries(object):
+    """libraries shared by the commands of a batch (see Biblio.load)
+    """
+    def __init__(self):
+        self.libraries = {}
+        self.modified = {}
+
+    def load(self, cls, bibtex, filesdir, snapshot=True):
+        path = os.path.realpath(bibtex)
+        if path not in self.libraries:
+            self.libraries[path] = cls._load(bibtex, filesdir, snapshot)
+        my = self.libraries[path]
+        my.filesdir = filesdir
+        return my
+
+    def defer_save(self, my, bibtex):
+        path = os.path.realpath(bibtex)
+        self.libraries[path] = my
+        self.modified[path] = bibtex
+        return True
+
+
+def read_commands(lines):
+    """[(line number, argv)]
+    """
+    commands = []
+    for lineno, line in enumerate(lines, 1):
+        argv = shlex.split(line, comments=True)
+        if argv and argv[0] == 'papers':
+            argv = argv[1:]
+        if argv:
+            commands.append((lineno, argv))
+    return commands
+
+
+def run_batch(commands):
+    """run the commands and save modified libraries at the end
+
+    raise BatchError (and save nothing) if a command fails
+    """
+    import papers.bib
+    import papers.cache
+
+    for lineno, argv in commands:
+        if argv[0] in EXCLUDED:
+            raise BatchError('line {}: {} is not allowed in batch mode'.format(lineno, argv[0]))
+
+    libraries = BatchLibraries()
+    papers.bib.library_cache = libraries
+    papers.cache.deferred = {}
+    try:
+        for lineno, argv in commands:
+            logger.info('batch: papers '+' '.join(argv))
+            try:
+                papers.bib.main(argv)
+            except SystemExit as error:
+                if error.code:
+                    raise BatchError('line {}: papers {}: exit status {}'.format(lineno, ' '.join(argv), error.code))
+            except Exception as error:
+                raise BatchError('line {}: papers {}: {}'.format(lineno, ' '.join(argv), error))
+    finally:
+        papers.bib.library_cache = None
+        deferred, papers.cache.deferred = papers.cache.deferred, None
+
+    config = papers.config.config
+    message = 'papers batch:\n\n' + '\n'.join('    papers '+' '.join(argv) for _, argv in commands)
+    for path, bibtex in libraries.modified.items():
+        my = libraries.libraries[path]
+        if not my.modified(bibtex):
+            logger.info(u'no change: '+bibtex+' not saved')
+            continue
+        logger.info(u'save {} ({} entries changed)'.format(bibtex, my.count_changes()))
+        my.save(bibtex)
+        if config.git and os.path.realpath(config.bibtex) == path:
+            config.bibtex = bibtex
+            config.gitcommit(message='save '+bibtex+' after '+message)
+    papers.cache.write_deferred(deferred)
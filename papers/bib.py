@@ -7,32 +7,39 @@ import subprocess as sp
 import shutil
 import bisect
 import itertools
+import collections
+import operator
 import six
 from six.moves import input as raw_input
 import re
+import hashlib
 import papers.boxea as boxea
 
-import bibtexparser
-
 import papers
 from papers import logger
 
 from papers.extract import extract_pdf_doi, isvaliddoi, parse_doi
-from papers.extract import extract_pdf_metadata
+from papers.extract import extract_pdf_metadata, pdf_backend
 from papers.extract import fetch_bibtex_by_fulltext_crossref, fetch_bibtex_by_doi
 
-from papers.encoding import latex_to_unicode, unicode_to_latex, unicode_to_ascii
+from papers.encoding import latex_to_unicode, encode_latex, encode_entries_latex, unicode_to_ascii
 from papers.encoding import parse_file, format_file, standard_name, family_names, format_entries
+from papers.encoding import parse_bibtex, bibtexparser, format_bibtex, format_entry, format_header
 
 
 # from papers.config import config, bcolors, checksum, move
 
 from papers.config import config, checksum, move
+from papers.cache import read_snapshot, write_snapshot, write_index, lookup_entries, count_entries, file_stamp
+from papers.cache import canonical_index, splice_index, journal_snapshot
+from papers.cache import duplicate_state_file, file_digest
 from papers.pretty import boxed_list, bcol, read_journal_abbrv
 from papers.parsercli import cli_parser
 
 from papers.duplicate import check_duplicates, resolve_duplicates, conflict_resolution_on_insert, entry_diff
 from papers.duplicate import search_duplicates, list_duplicates, list_uniques, merge_files, edit_entries
+from papers.duplicate import fuzzy_pairs, DuplicateState, EntryCache
+from papers.lsh import near_duplicate_pairs
 
 # DRYRUN = False
 
@@ -157,18 +164,26 @@ def entry_id(e):
     return (e.get('doi','').lower(), authortitle)
 
 
+def cached_entry_id(e, cache=None):
+    """entry_id, from an EntryCache if provided
+    """
+    if cache is None:
+        return entry_id(e)
+    return cache.get(e, entry_id, ('doi', 'author', 'title'))
+
 
 
 
 
-def compare_entries(e1, e2, fuzzy=False):
+
+def compare_entries(e1, e2, fuzzy=False, cache=None):
     """assess two entries' similarity
     """
     if e1 == e2:
         return settings['EXACT_DUPLICATES']
 
-    id1 = entry_id(e1)
-    id2 = entry_id(e2)
+    id1 = cached_entry_id(e1, cache)
+    id2 = cached_entry_id(e2, cache)
     
     logger.debug('{} ?= {}'.format(id1, id2))
 
@@ -179,7 +194,7 @@ def compare_entries(e1, e2, fuzzy=False):
         score = settings['FAIR_DUPLICATES']
 
     elif any([f1==f2 for f1, f2 in zip(id1, id2) if f1 and f2]): # some of the defined fields agree
-        score = PARTIAL_DUPLICATES
+        score = settings['PARTIAL_DUPLICATES']
 
     elif not fuzzy:
         score = 0
@@ -192,7 +207,22 @@ def compare_entries(e1, e2, fuzzy=False):
 
     return score
 
-def are_duplicates(e1, e2, similarity=settings['DEFAULT_SIMILARITY'], fuzzy_ratio=settings['FUZZY_RATIO']):
+def duplicate_blocks(e, cache=None):
+    """blocking keys for duplicate search (see papers.duplicate.groupby_equal)
+
+    Entries that share no key are not even PARTIAL duplicates. Without
+    author and title, an entry may match any other (returns None).
+    """
+    doi, authortitle = cached_entry_id(e, cache)
+    if not authortitle:
+        return None
+    keys = [('authortitle', authortitle)]
+    if doi:
+        keys.append(('doi', doi))
+    return keys
+
+
+def are_duplicates(e1, e2, similarity=settings['DEFAULT_SIMILARITY'], fuzzy_ratio=settings['FUZZY_RATIO'], cache=None):
     level = dict(
         EXACT = settings['EXACT_DUPLICATES'],
         GOOD = settings['GOOD_DUPLICATES'],
@@ -205,11 +235,30 @@ def are_duplicates(e1, e2, similarity=settings['DEFAULT_SIMILARITY'], fuzzy_rati
     except KeyError:
         raise ValueError('similarity must be one of EXACT, GOOD, FAIR, PARTIAL, FUZZY')
 
-    score = compare_entries(e1, e2, fuzzy=level==settings['FUZZY_DUPLICATES'])
+    fuzzy = target == settings['FUZZY_DUPLICATES']
+    score = compare_entries(e1, e2, fuzzy=fuzzy, cache=cache)
+    if fuzzy:
+        target = fuzzy_ratio  # scores below PARTIAL are fuzzy ratios
     logger.debug('score: {}, target: {}, similarity: {}'.format(score, target, similarity))
     return score >= target
 
 
+def fuzzy_duplicate_pairs(entries, fuzzy_ratio=settings['FUZZY_RATIO'], cache=None):
+    """index pairs of FUZZY duplicates by author-title ratio (batch compare_entries)
+
+    Other FUZZY duplicates are at least PARTIAL duplicates (see duplicate_blocks).
+    """
+    tags = [cached_entry_id(e, cache)[1] for e in entries]
+    return list(fuzzy_pairs(tags, fuzzy_ratio))
+
+
+
+# loaded libraries kept by `papers serve` (see papers.server.LibraryCache)
+library_cache = None
+
+# commands that parse pdfs (or save the pdf backend): --pdf-backend is checked
+PDF_COMMANDS = ('install', 'add', 'filecheck', 'doi', 'extract')
+
 
 def hidden_bibtex(direc):
     " save metadata for a bundle of files "
@@ -217,7 +266,32 @@ def hidden_bibtex(direc):
     return os.path.join(direc, '.'+dirname+'.bib')
 
 
-def read_entry_dir(self, direc, update_files=True):
+def scan_files(direc):
+    """ files to add from direc, in a deterministic order: [(kind, path)]
+
+    kind is 'pdf', 'bib' or 'entrydir' (directory with a hidden bibtex, see read_entry_dir)
+    """
+    for root, direcs, files in os.walk(direc):
+        direcs.sort()
+        dirname = os.path.basename(root)
+        if dirname.startswith('.'): continue
+        if dirname.startswith('_'): continue
+
+        # maybe a special entry directory?
+        if os.path.exists(hidden_bibtex(root)):
+            yield 'entrydir', root
+            continue
+
+        for file in sorted(files):
+            if file.startswith('.'):
+                continue
+            if file.endswith('.pdf'):
+                yield 'pdf', os.path.join(root, file)
+            elif file.endswith('.bib'):
+                yield 'bib', os.path.join(root, file)
+
+
+def read_entry_dir(direc, update_files=True):
     """add a directory that contain files from a single entry
     """
     dirname = os.path.basename(direc)
@@ -243,6 +317,33 @@ def read_entry_dir(self, direc, update_files=True):
 def backupfile(bibtex):
     return os.path.join(os.path.dirname(bibtex), '.'+os.path.basename(bibtex)+'.backup')
 
+
+def _encode(s):
+    return s.encode('utf-8') if isinstance(s, six.text_type) else s
+
+
+def write_atomic(path, data, backup=None):
+    """ write data to a temporary file renamed to path, so that path is never
+    left half-written; the previous version is kept as backup (hard link)
+    """
+    path = os.path.realpath(path)  # keep symbolic links
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    if os.path.exists(path):
+        shutil.copymode(path, tmp)
+        if backup:
+            if os.path.lexists(backup):
+                os.remove(backup)
+            try:
+                os.link(path, backup)
+            except (AttributeError, OSError):  # no hard links on this system
+                shutil.copy(path, backup)
+    getattr(os, 'replace', os.rename)(tmp, path)
+
+
 class DuplicateKeyError(ValueError):
     pass
 
@@ -258,10 +359,12 @@ class Biblio(object):
         elif not isinstance(db, bibtexparser.bibdatabase.BibDatabase):
             raise TypeError('db must of type BibDatabase')
         self.db = db
+        self.cache = EntryCache()  # entry ids for duplicate checks
         self.sort()
         self.nauthor = nauthor
         self.ntitle = ntitle
         self.similarity = similarity
+        self.mark_saved(None)
 
     @property
     def entries(self):
@@ -274,17 +377,131 @@ class Biblio(object):
 
     @classmethod
     def loads(cls, bibtex, filesdir):
-        db = bibtexparser.loads(bibtex)
+        db = parse_bibtex(bibtex)
         return cls(db, filesdir)
 
     def dumps(self):
-        return bibtexparser.dumps(self.db)
+        return format_bibtex(self.db)
 
     @classmethod
-    def load(cls, bibtex, filesdir):
+    def load(cls, bibtex, filesdir, snapshot=True):
+        if library_cache is not None:  # papers serve
+            return library_cache.load(cls, bibtex, filesdir, snapshot)
+        return cls._load(bibtex, filesdir, snapshot)
+
+    @classmethod
+    def _load(cls, bibtex, filesdir, snapshot=True):
         # self.bibtex = bibtex
-        bibtexs = open(bibtex).read()
-        return cls(bibtexparser.loads(bibtexs), filesdir)
+        if snapshot:
+            state = read_snapshot(bibtex)
+            if state is not None:
+                my = cls.from_snapshot(state, filesdir)
+                my._saved_file, my._saved_stamp = os.path.realpath(bibtex), file_stamp(bibtex)
+                return my
+        stamp = file_stamp(bibtex)
+        with open(bibtex, 'rb') as f:
+            bibtexs = f.read()
+        my = cls(parse_bibtex(bibtexs), filesdir)
+        my._saved_file, my._saved_stamp = os.path.realpath(bibtex), stamp  # as marked in __init__
+        if snapshot:
+            digest = hashlib.sha256(bibtexs).digest()
+            write_snapshot(bibtex, my.snapshot(), stamp, digest)
+            write_index(bibtex, bibtexs, stamp, digest)
+        return my
+
+    def snapshot(self):
+        """picklable state of the parsed library (see papers.cache)
+        """
+        return {'entries': self.db.entries,
+                'comments': self.db.comments,
+                'preambles': self.db.preambles,
+                'strings': list(self.db.strings.items())}
+
+    def _state(self):
+        return list(self.db.comments), list(self.db.preambles), list(self.db.strings.items())
+
+    def mark_saved(self, bibtex):
+        """ record the library as in sync with the bibtex file (None: no file)
+
+        Entry dicts are modified in place: changed_entries compares them to
+        copies made here (values are strings, a shallow copy is enough).
+        """
+        self._saved_file = bibtex and os.path.realpath(bibtex)
+        self._saved_stamp = file_stamp(bibtex) if bibtex and os.path.exists(bibtex) else None
+        self._saved_entries = list(self.db.entries)
+        self._saved_copies = [e.copy() for e in self.db.entries]
+        self._saved_state = self._state()
+
+    def changed_entries(self):
+        """ (new or modified entries, removed entries) since load or save
+        """
+        entries, saved = self.db.entries, self._saved_entries
+        if len(entries) == len(saved) and all(map(operator.is_, entries, saved)):
+            return [e for e, c in zip(entries, self._saved_copies) if e != c], []
+        index = {id(e): i for i, e in enumerate(saved)}
+        changed = []
+        kept = set()
+        for e in self.db.entries:
+            i = index.get(id(e))
+            if i is None or e != self._saved_copies[i]:
+                changed.append(e)
+            if i is not None:
+                kept.add(i)
+        removed = [e for i, e in enumerate(saved) if i not in kept]
+        return changed, removed
+
+    def _edits(self):
+        """ changes since load or save, as [(position, count, entries)] to apply
+        in turn to the saved entry list (see papers.cache.journal_snapshot)
+        """
+        index = {id(e): i for i, e in enumerate(self._saved_entries)}
+        edits = []
+
+        def edit(position, count, inserted):
+            if edits and edits[-1][0] + len(edits[-1][2]) == position:
+                edits[-1][1] += count
+                edits[-1][2].extend(inserted)
+            else:
+                edits.append([position, count, inserted])
+
+        j = 0  # next saved entry
+        for position, e in enumerate(self.db.entries):
+            i = index.get(id(e))
+            if i is not None and i >= j and e == self._saved_copies[i]:
+                if i > j:
+                    edit(position, i - j, [])
+                j = i + 1
+            else:
+                edit(position, 0, [e])
+        if j < len(self._saved_entries):
+            edit(len(self.db.entries), len(self._saved_entries) - j, [])
+        return edits
+
+    def count_changes(self):
+        """ number of entries added, modified or removed since load or save
+        """
+        changed, removed = self.changed_entries()
+        return len(changed) + len(removed)
+
+    def modified(self, bibtex=None):
+        """ True if the library differs from the file it was loaded from
+        (or last saved to), or if bibtex is another file
+        """
+        if bibtex is not None and os.path.realpath(bibtex) != self._saved_file:
+            return True
+        if self._saved_file is None or self._state() != self._saved_state:
+            return True
+        return self.count_changes() > 0
+
+    @classmethod
+    def from_snapshot(cls, state, filesdir):
+        db = bibtexparser.bibdatabase.BibDatabase()
+        db.entries = state['entries']
+        db.comments = state['comments']
+        db.preambles = state['preambles']
+        db.strings.clear()
+        db.strings.update(state['strings'])
+        return cls(db, filesdir)
 
     @classmethod
     def newbib(cls, bibtex, filesdir):
@@ -298,7 +515,7 @@ class Biblio(object):
         return e[self.key_field].lower()
 
     def eq(self, e1, e2):
-        return are_duplicates(e1, e2, similarity=self.similarity)
+        return are_duplicates(e1, e2, similarity=self.similarity, cache=self.cache)
 
     def __contains___(self, entry):
         return any({self.eq(entry, e) for e in self.entries})
@@ -306,10 +523,136 @@ class Biblio(object):
 
     def sort(self):
         self.db.entries = sorted(self.db.entries, key=self.key)
+        self._sync_keys()
+
+    def _sync_keys(self):
+        """ key index: sorted list of keys parallel to entries, and key count
+
+        It is maintained by insert_entry, remove_entry and set_key, and rebuilt
+        here if db.entries was replaced or resized directly.
+        """
+        if getattr(self, '_keys_of', None) is self.db.entries and len(self._keys) == len(self.db.entries):
+            return
+        self._keys = [self.key(e) for e in self.db.entries]
+        self._keycount = collections.Counter(self._keys)
+        self._keys_of = self.db.entries
+
+    def _sync_ids(self):
+        """ candidate-blocking index: entries by the components of entry_id
+        (normalized doi and author-title), built on first use
+
+        It is maintained by insert_entry and remove_entry, and rebuilt if
+        db.entries was replaced or resized directly, or after fix_entry.
+        """
+        if self._ids_valid():
+            return
+        self._by_doi = collections.defaultdict(list)
+        self._by_authortitle = collections.defaultdict(list)
+        self._ids_len = 0
+        for e in self.db.entries:
+            self._add_id(e)
+        self._ids_of = self.db.entries
+
+    def _ids_valid(self):
+        return getattr(self, '_ids_of', None) is self.db.entries and self._ids_len == len(self.db.entries)
+
+    def _add_id(self, entry):
+        doi, authortitle = cached_entry_id(entry, self.cache)
+        self._by_doi[doi].append(entry)
+        self._by_authortitle[authortitle].append(entry)
+        self._ids_len += 1
+
+    def _remove_id(self, entry):
+        for index, k in zip([self._by_doi, self._by_authortitle], cached_entry_id(entry, self.cache)):
+            group = [e for e in index.get(k, []) if e is not entry]
+            if len(group) == len(index.get(k, [])):
+                self._ids_of = None  # modified since indexed
+                return
+            if group:
+                index[k] = group
+            else:
+                del index[k]
+        self._ids_len -= 1
+
+    def duplicate_candidates(self, entry):
+        """ entries that may compare equal to entry (self.eq), in library order
+
+        Two entries are at least PARTIAL duplicates only if their entry_id
+        share a component, or if a component is empty on either side.
+        """
+        if self.similarity not in ('EXACT', 'GOOD', 'FAIR', 'PARTIAL'):
+            return list(self.entries)  # fuzzy matching: no blocking
+        self._sync_ids()
+        doi, authortitle = cached_entry_id(entry, self.cache)
+        if doi and authortitle:
+            both_empty = set(id(e) for e in self._by_doi.get('', []))
+            groups = [self._by_doi.get(doi, []), self._by_authortitle.get(authortitle, []),
+                [e for e in self._by_authortitle.get('', []) if id(e) in both_empty]]
+        elif authortitle:
+            groups = [self._by_authortitle.get(authortitle, []), self._by_authortitle.get('', [])]
+        elif doi:
+            groups = [self._by_doi.get(doi, []), self._by_doi.get('', [])]
+        else:
+            return list(self.entries)
+        candidates = {id(e): e for e in itertools.chain(*groups)}
+        positions = [(self._index_entry(e), e) for e in candidates.values()]
+        return [e for i, e in sorted([p for p in positions if p[0] is not None], key=lambda p: p[0])]
+
+    def find(self, keys=(), dois=()):
+        """ entries with any of these keys or dois (case-insensitive), in library order
+        """
+        self._sync_keys()
+        found = {}
+        for key in keys:
+            key = key.lower()
+            i = bisect.bisect_left(self._keys, key)
+            while i < len(self._keys) and self._keys[i] == key:
+                found[i] = self.db.entries[i]
+                i += 1
+        if dois:
+            dois = set(doi.lower() for doi in dois)
+            for i, e in enumerate(self.db.entries):
+                if e.get('doi', '').lower() in dois:
+                    found[i] = e
+        return [found[i] for i in sorted(found)]
 
     def index_sorted(self, entry):
-        keys = [self.key(ei) for ei in self.db.entries]
-        return bisect.bisect_left(keys, self.key(entry))
+        self._sync_keys()
+        return bisect.bisect_left(self._keys, self.key(entry))
+
+    def _index_entry(self, entry):
+        """ position of this very entry in the library, or None
+        """
+        self._sync_keys()
+        key = self.key(entry)
+        i = bisect.bisect_left(self._keys, key)
+        while i < len(self._keys) and self._keys[i] == key:
+            if self.db.entries[i] is entry:
+                return i
+            i += 1
+        return next((i for i, e in enumerate(self.db.entries) if e is entry), None)  # unsorted
+
+    def remove_entry(self, entry):
+        i = self._index_entry(entry)
+        if i is None:
+            raise ValueError('entry not in library: '+entry.get('ID',''))
+        if self._ids_valid():
+            self._remove_id(entry)
+        del self.db.entries[i]
+        key = self._keys.pop(i)
+        self._keycount[key] -= 1
+        if not self._keycount[key]:
+            del self._keycount[key]
+
+    def set_key(self, entry, key):
+        """ change entry ID, and move the entry to its sorted position
+        """
+        if self._index_entry(entry) is None:
+            entry['ID'] = key
+            return
+        self.remove_entry(entry)
+        entry['ID'] = key
+        self._insert(self.index_sorted(entry), entry)
 
 
     def insert_entry(self, entry, update_key=False, check_duplicate=False, **checkopt):
@@ -331,6 +674,7 @@ class Biblio(object):
                 newkey = self.append_abc_to_key(entry)  # add abc
                 logger.info('update key: {} => {}'.format(entry['ID'], newkey))
                 entry['ID'] = newkey
+                i = self.index_sorted(entry)
 
             else:
                 raise DuplicateKeyError('this error can be avoided if update_key is True')
@@ -338,12 +682,21 @@ class Biblio(object):
         else: 
             logger.info('new entry: '+self.key(entry))
         
+        self._insert(i, entry)
+
+    def _insert(self, i, entry):
+        key = self.key(entry)
+        update_ids = self._ids_valid()
         self.entries.insert(i, entry)
+        self._keys.insert(i, key)
+        self._keycount[key] += 1
+        if update_ids:
+            self._add_id(entry)
 
 
     def insert_entry_check(self, entry, update_key=False, mergefiles=True, on_conflict='i'):
         
-        duplicates = [e for e in self.entries if self.eq(e, entry)]
+        duplicates = [e for e in self.duplicate_candidates(entry) if self.eq(e, entry)]
 
         if not duplicates:
             logger.debug('not a duplicate')
@@ -357,7 +710,7 @@ class Biblio(object):
             # pick only the most similar duplicate, if more than one
             # the point of check_duplicate is to avoid increasing disorder, not to clean the existing mess
             if len(duplicates) > 1:
-                duplicates.sort(key=lambda e: compare_entries(entry, e), reverse=True)
+                duplicates.sort(key=lambda e: compare_entries(entry, e, cache=self.cache), reverse=True)
 
             candidate = duplicates[0]
 
@@ -381,22 +734,23 @@ class Biblio(object):
 
             logger.debug('conflict resolution: '+on_conflict)
             resolved = conflict_resolution_on_insert(candidate, entry, mode=on_conflict)
-            self.entries.remove(candidate) # maybe in resolved entries
+            self.remove_entry(candidate) # maybe in resolved entries
             for e in resolved:
                 self.insert_entry(e, update_key)
 
 
     def generate_key(self, entry):
         " generate a unique key not yet present in the record "
-        keys = set(self.key(e) for e in self.db.entries)
-        return generate_key(entry, keys=keys, nauthor=self.nauthor, ntitle=self.ntitle)
+        self._sync_keys()
+        return generate_key(entry, keys=self._keycount, nauthor=self.nauthor, ntitle=self.ntitle)
 
     def append_abc_to_key(self, entry):
-        return append_abc(entry['ID'], keys=set(self.key(e) for e in self.entries))
+        self._sync_keys()
+        return append_abc(entry['ID'], keys=self._keycount)
 
 
     def add_bibtex(self, bibtex, **kw):
-        bib = bibtexparser.loads(bibtex)
+        bib = parse_bibtex(bibtex)
         for e in bib.entries:
             self.insert_entry(e, **kw)
 
@@ -423,7 +777,12 @@ class Biblio(object):
 
         print(" **** Processing file ", pdf, " to be added to current library ... \n")
         bibtex = extract_pdf_metadata(pdf, search_doi, search_fulltext, scholar=scholar)
+        self.insert_pdf(pdf, bibtex, attachments, rename=rename, copy=copy, **kw)
+
 
+    def insert_pdf(self, pdf, bibtex, attachments=None, rename=False, copy=False, **kw):
+        """ insert the entry of pdf, from its metadata (bibtex)
+        """
         bib = bibtexparser.loads(bibtex)
         entry = bib.entries[0]
 
@@ -441,47 +800,96 @@ class Biblio(object):
 
         if rename:
             self.rename_entry_files(entry, copy=copy)
-            
 
-    def scan_dir(self, direc, search_doi=True, search_fulltext=True, **kw):
-        
-        for root, direcs, files in os.walk(direc):
-            dirname = os.path.basename(root)
-            if dirname.startswith('.'): continue
-            if dirname.startswith('_'): continue
-        
-            # maybe a special entry directory?
-            if os.path.exists(hidden_bibtex(root)):
-                logger.debug('read from hidden bibtex')
-                try:
-                    entry = read_entry_dir(root)
-                    self.insert_entry(entry, **kw)
-                except Exception:  
-                    logger.warn(root+'::'+str(error))
-                continue 
 
-            for file in files:
-                if file.startswith('.'):
-                    continue
-                path = os.path.join(root, file)
-                try:
-                    if file.endswith('.pdf'): 
-                        self.add_pdf(path, search_doi=search_doi, search_fulltext=search_fulltext, **kw)
-                    elif file.endswith('.bib'):
-                        self.add_bibtex_file(path, **kw)
-                except Exception as error:
-                    logger.warn(path+'::'+str(error))
-                    continue
+    def insert_entry_dir(self, root, **kw):
+        entry = read_entry_dir(root)
+        self.insert_entry(entry, **kw)
+
+
+    def scan_dir(self, direc, search_doi=True, search_fulltext=True, jobs=1, **kw):
+        """ add the pdf and bibtex files found in direc
+
+        jobs: pdfs are parsed and their metadata fetched in parallel if > 1 (see papers.ingest)
+        """
+        if jobs > 1:
+            from papers.ingest import ingest
+            return ingest(self, scan_files(direc), search_doi, search_fulltext, jobs, **kw)
+
+        for kind, path in scan_files(direc):
+            try:
+                if kind == 'pdf':
+                    self.add_pdf(path, search_doi=search_doi, search_fulltext=search_fulltext, **kw)
+                elif kind == 'bib':
+                    self.add_bibtex_file(path, **kw)
+                else:
+                    logger.debug('read from hidden bibtex')
+                    self.insert_entry_dir(path, **kw)
+            except Exception as error:
+                logger.warn(path+'::'+str(error))
+                continue
 
 
     def format(self):
-        return bibtexparser.dumps(self.db)
+        return format_bibtex(self.db)
+
+    def _canonical_index(self, bibtex):
+        """ index of bibtex if written by save and not modified since (or None)
+        """
+        if os.path.realpath(bibtex) != self._saved_file or self._state() != self._saved_state:
+            return None
+        return canonical_index(bibtex, self._saved_stamp)
 
-    def save(self, bibtex):
-        s = self.format()
-        if os.path.exists(bibtex):
-            shutil.copy(bibtex, backupfile(bibtex))
-        open(bibtex, 'w').write(s)
+    def _format_pieces(self, bibtex, index):
+        """ same as format, as [(bytes, offset)] for splice_index: unchanged
+        entries are copied from bibtex at offset (see _canonical_index)
+        """
+        changed = set(id(e) for e in self.changed_entries()[0])
+
+        pieces = [(_encode(format_header(self.db)), None)]
+
+        with open(bibtex, 'rb') as f:
+            data = f.read()
+        # same order and separator as format_bibtex
+        entries = sorted(self.db.entries, key=lambda e: e['ID'].lower())
+        for i, e in enumerate(entries):
+            sep = b'\n' if i < len(entries) - 1 else b''
+            spans = index['keys'].get(e['ID'].lower(), ())
+            if id(e) not in changed and len(spans) == 1:
+                offset, length = spans[0]
+                chunk = data[offset:offset+length]
+                if chunk.endswith(b'}\n\n'):
+                    chunk = chunk[:-1]
+                pieces.append((chunk + sep, offset))
+            else:
+                pieces.append((_encode(format_entry(e)) + sep, None))
+        return pieces
+
+    def save(self, bibtex, snapshot=True):
+        """ write the library to bibtex, unless unchanged: return True if written
+
+        Only modified entries are formatted when possible (see _format_pieces),
+        and then recorded in the snapshot journal. The file is replaced
+        atomically, the previous version is kept as backup.
+        """
+        if not self.modified(bibtex) and os.path.exists(bibtex):
+            return False
+        self.sort()  # snapshot and journal in the order load reproduces
+        index = self._canonical_index(bibtex) if snapshot else None
+        pieces = self._format_pieces(bibtex, index) if index is not None else None
+        s = _encode(self.format()) if pieces is None else b''.join(chunk for chunk, _ in pieces)
+        write_atomic(bibtex, s, backup=backupfile(bibtex))
+        if snapshot:
+            stamp, digest = file_stamp(bibtex), hashlib.sha256(s).digest()
+            if pieces is None:
+                write_snapshot(bibtex, self.snapshot(), stamp, digest)
+                write_index(bibtex, s, stamp, digest, canonical=True)
+            else:
+                if not journal_snapshot(bibtex, self._edits(), index['sha256'], stamp, digest):
+                    write_snapshot(bibtex, self.snapshot(), stamp, digest)
+                splice_index(bibtex, index, pieces, stamp, digest)
+        self.mark_saved(bibtex)
+        return True
 
     #def savebeautify(self, bibtex):
     #    s = self.format()
@@ -491,10 +899,30 @@ class Biblio(object):
 
 
 
-    def check_duplicates(self, key=None, eq=None, mode='i'):
+    def check_duplicates(self, key=None, eq=None, mode='i', near=False, bibtex=None):
         """remove duplicates, in some sensse (see papers.conflict.check_duplicates)
+
+        near: also near-duplicate titles (see papers.lsh)
+        bibtex: library file, to cache title signatures and the state of previous
+            checks in the cache directory (only pairs with new or modified entries
+            are compared, and pairs validated as distinct are not prompted again)
         """
-        self.entries = check_duplicates(self.entries, key=key, eq=eq or self.eq, issorted=key is self.key, mode=mode)
+        blocks, equal_pairs, state = None, [], None
+        if eq is None and key is None:
+            blocks = lambda e: duplicate_blocks(e, self.cache)
+            if bibtex:
+                state = DuplicateState.load(duplicate_state_file(bibtex), settings=(self.similarity, near))
+            if self.similarity == 'FUZZY':
+                equal_pairs = fuzzy_duplicate_pairs(self.entries, cache=self.cache)
+                eq = lambda a, b: are_duplicates(a, b, similarity='PARTIAL', cache=self.cache)
+        if near and key is None:
+            equal_pairs = equal_pairs + near_duplicate_pairs(self.entries, bibtex, prune=True)
+        self.entries = check_duplicates(self.entries, key=key, eq=eq or self.eq, issorted=key is self.key, mode=mode,
+                                        blocks=blocks, equal_pairs=equal_pairs, state=state, cache=self.cache)
+        self.cache.prune(self.entries)
+        if state is not None:
+            state.finish(self.entries)
+            state.save(duplicate_state_file(bibtex))
         self.sort() # keep sorted
 
 
@@ -543,11 +971,9 @@ class Biblio(object):
 
             # create hidden bib entry for special dir
             bibname = hidden_bibtex(newdir)
-            db = bibtexparser.bibdatabase.BibDatabase()
-            db.entries.append(e)
-            bibtex = bibtexparser.dumps(db)
-            with open(bibname,'w') as f:
-                f.write(bibtex)
+            bibtex = format_entry(e)
+            with open(bibname,'wb') as f:
+                f.write(_encode(bibtex))
 
             # remove old direc if empty?
             direcs = list(set([os.path.dirname(file) for file in files]))
@@ -577,6 +1003,7 @@ class Biblio(object):
         format_name=True, interactive=False):
 
         e_old = e.copy()
+        self._ids_of = None  # fields may change: rebuild duplicate index
 
         if format_name:
             for k in ['author','editor']:
@@ -596,7 +1023,7 @@ class Biblio(object):
                         if encoding == 'unicode':
                             e[k] = latex_to_unicode(e[k])
                         elif encoding == 'latex':
-                            e[k] = unicode_to_latex(e[k])
+                            e[k] = encode_latex(e[k])
                     # except KeyError as error:
                     except (KeyError, ValueError) as error:
                         logger.warn(e.get('ID','')+': '+k+': failed to encode: '+str(error))
@@ -654,10 +1081,10 @@ class Biblio(object):
                 key = self.generate_key(e)
                 if e.get('ID', '') != key:
                     logger.info('update key {} => {}'.format(e.get('ID', ''), key))
-                    e['ID'] = key
+                    self.set_key(e, key)
 
         if key_ascii:
-            e['ID'] = unicode_to_ascii(e['ID'])
+            self.set_key(e, unicode_to_ascii(e['ID']))
 
         if interactive and e_old != e:
             print('\n'+ bcol.BLUE+'*** UPDATE ***'+bcol.ENDC)
@@ -665,6 +1092,8 @@ class Biblio(object):
 
             if raw_input(' update ? [Y/n] or [Enter] ').lower() not in ('', 'y'):
                 logger.info(' cancel changes')
+                if e.get('ID') != e_old.get('ID'):
+                    self.set_key(e, e_old['ID'])
                 e.update(e_old)
                 for k in list(e.keys()):
                     if k not in e_old:
@@ -770,7 +1199,7 @@ def entry_filecheck(e, delete_broken=False, fix_mendeley=False,
 
         elif check_hash:
             # hash_ = hashlib.sha256(open(file, 'rb').read()).digest()
-            hash_ = checksum(file) # a litftle faster
+            hash_ = file_digest(file) # saved for unchanged files
             if hash_ in hashes:
                 logger.info(e['ID']+': file already exists (identical checksum): "{}"'.format(file))
                 continue
@@ -782,7 +1211,7 @@ def entry_filecheck(e, delete_broken=False, fix_mendeley=False,
 
 
 
-def main():
+def load_config():
 
     # Here it has loaded a module that defines a config object and now
     # we changed one of the values of the config object depending on the
@@ -800,6 +1229,18 @@ def main():
         logger.debug('load config from: '+config.file)
         config.load()
 
+    return global_config, local_config
+
+
+def parse_args(argv=None):
+    load_config()
+    return cli_parser(config, settings).parse_args(argv)
+
+
+def main(argv=None):
+
+    global_config, local_config = load_config()
+
     parser = cli_parser(config, settings)
 
 
@@ -876,11 +1317,19 @@ def main():
 
 
     def savebib(my, o):
-        logger.info(u'save '+o.bibtex)
+        if my is not None and not my.modified(o.bibtex):
+            logger.info(u'no change: '+o.bibtex+' not saved')
+            return
         if papers.config.DRYRUN:
+            logger.info(u'save '+o.bibtex)
             return
+        if library_cache is not None and library_cache.defer_save(my, o.bibtex):
+            return  # papers batch: saved once, at the end
         if my is not None:
+            logger.info(u'save {} ({} entries changed)'.format(o.bibtex, my.count_changes()))
             my.save(o.bibtex)
+        else:
+            logger.info(u'save '+o.bibtex)
         # commit when operated on the default bibtex file provided during installation
         # if config.git and os.path.samefile(config.bibtex, o.bibtex):
         if config.git and os.path.realpath(config.bibtex) == os.path.realpath(o.bibtex):
@@ -921,6 +1370,7 @@ def main():
                         my.scan_dir(file, rename=o.rename, copy=o.copy, 
                             search_doi=not o.no_query_doi,
                             search_fulltext=not o.no_query_fulltext,
+                            jobs=o.jobs,
                               **kw)
                     else:
                         raise ValueError(file+' is a directory, requires --recursive to explore')
@@ -955,16 +1405,22 @@ def main():
         #     o.fetch_all = True
         #     o.fix_key = True
 
-        for e in my.entries:
+        encoding = o.encoding
+        if encoding == 'latex' and o.force and not (o.fetch or o.fetch_all):
+            # no confirmation needed: encode the whole library at once
+            encode_entries_latex([e for e in my.entries if not o.keys or e.get('ID','') in o.keys])
+            encoding = None
+
+        for e in list(my.entries):  # fix_key moves entries
             if o.keys and e.get('ID','') not in o.keys:
                 continue
             my.fix_entry(e, fix_doi=o.fix_doi, fetch=o.fetch, fetch_all=o.fetch_all, fix_key=o.fix_key, 
-                auto_key=o.auto_key, format_name=o.format_name, encoding=o.encoding, 
+                auto_key=o.auto_key, format_name=o.format_name, encoding=encoding, 
                 key_ascii=o.key_ascii, interactive=not o.force)
 
 
-        if o.duplicates:
-            my.check_duplicates(mode=o.mode)
+        if o.duplicates or o.duplicates_near:
+            my.check_duplicates(mode=o.mode, near=o.duplicates_near, bibtex=o.bibtex)
 
         if o.tag != 'no-tag':
             for e in my.entries:
@@ -988,11 +1444,27 @@ def main():
 
         savebib(my, o)
 
+    def exact(patterns):
+        return patterns and not any(c in p for p in patterns for c in '*?[')
+
+    def lookup(o, keys=None, dois=None):
+        """entries with exact --key or --doi, parsed via the byte-offset index (or None)
+        """
+        if not os.path.exists(o.bibtex):
+            return None
+        if library_cache is not None:  # papers serve: the library is in memory
+            return Biblio.load(o.bibtex, o.filesdir).find(keys or (), dois or ())
+        entries = lookup_entries(o.bibtex, keys=keys or (), dois=dois or ())
+        if entries is not None:
+            entries.sort(key=lambda e: e['ID'].lower())
+        return entries
+
     def opencmd(o):
         import fnmatch                              # unix-like match
-        my = Biblio.load(o.bibtex, o.filesdir)
-        entries = my.db.entries
-        total_entries = len(entries)
+        entries = lookup(o, keys=o.key) if exact(o.key) else None
+        if entries is None:
+            my = Biblio.load(o.bibtex, o.filesdir)
+            entries = my.db.entries
 
         def match(word, target, fuzzy=False, substring=False):
             if isinstance(target, list):
@@ -1057,9 +1529,19 @@ def main():
 
     def listcmd(o):
         import fnmatch                              # unix-like match
-        my = Biblio.load(o.bibtex, o.filesdir)
-        entries = my.db.entries
-        total_entries = len(entries)
+        entries = None
+        if not (o.invert or o.edit or o.fetch or o.delete or o.duplicates_key):
+            # only parse the requested entries
+            if exact(o.key):
+                entries = lookup(o, keys=o.key)
+            elif exact(o.doi):
+                entries = lookup(o, dois=o.doi)
+        if entries is None:
+            my = Biblio.load(o.bibtex, o.filesdir)
+            entries = my.db.entries
+            total_entries = len(entries)
+        elif o.one_liner or o.one_liner_short:
+            total_entries = count_entries(o.bibtex)
         if o.fuzzy:
             from rapidfuzz import fuzz
 
@@ -1115,6 +1597,7 @@ def main():
             entries = [e for e in entries if 'abstract' in e and longmatch(e['abstract'], o.abstract)]
 
         _check_duplicates = lambda uniques, groups: uniques if o.invert else list(itertools.chain(*groups))
+        cache = EntryCache()  # entry ids shared by duplicate searches
 
         # if o.duplicates_key or o.duplicates_doi or o.duplicates_tit or o.duplicates or o.duplicates_fuzzy:
         list_dup = list_uniques if o.invert else list_duplicates
@@ -1124,10 +1607,21 @@ def main():
         if o.duplicates_doi:
             entries = list_dup(entries, key=lambda e:e.get('doi',''), filter_key=isvaliddoi)
         if o.duplicates_tit:
-            entries = list_dup(entries, key=title_id)
+            entries = list_dup(entries, key=lambda e: cache.get(e, title_id, ('title',)))
         if o.duplicates:
-            eq = lambda a, b: a['ID'] == b['ID'] or are_duplicates(a, b, similarity=level, fuzzy_ratio=o.fuzzy_ratio)
-            entries = list_dup(entries, eq=eq)
+            similarity, equal_pairs = o.similarity, ()
+            if similarity == 'FUZZY':
+                # batch fuzzy ratios, other pairs are at least PARTIAL duplicates
+                equal_pairs = fuzzy_duplicate_pairs(entries, o.fuzzy_ratio, cache=cache)
+                similarity = 'PARTIAL'
+            eq = lambda a, b: a['ID'] == b['ID'] or are_duplicates(a, b, similarity=similarity, cache=cache)
+            def blocks(e):
+                keys = duplicate_blocks(e, cache)
+                return keys and keys + [('ID', e['ID'])]
+            entries = list_dup(entries, eq=eq, blocks=blocks, equal_pairs=equal_pairs)
+        if o.duplicates_near:
+            entries = list_dup(entries, eq=operator.eq, blocks=lambda e: [],
+                               equal_pairs=near_duplicate_pairs(entries, o.bibtex))
 
         def nfiles(e):
             return len(parse_file(e.get('file','')))
@@ -1154,7 +1648,7 @@ def main():
 
         elif o.delete:
             for e in entries:
-                my.db.entries.remove(e)
+                my.remove_entry(e)
             savebib(my, o)
 
         elif o.field:
@@ -1242,7 +1736,26 @@ def main():
             gitp.error('failed to execute git command')
 
 
-    o = parser.parse_args()
+    def batchcmd(o):
+        from papers.batch import read_commands, run_batch, BatchError
+        lines = sys.stdin if o.file == '-' else open(o.file)
+        try:
+            run_batch(read_commands(lines))
+        except BatchError as error:
+            logger.error(str(error))
+            logger.error('batch failed: nothing saved')
+            parser.exit(1)
+
+    def servecmd(o):
+        from papers.server import serve, stop
+        if o.stop:
+            if not stop():
+                logger.warn('papers serve is not running')
+            return
+        serve(o.bibtex, o.filesdir)
+
+
+    o = parser.parse_args(argv)
 
     # verbosity
     if getattr(o,'logging_level',None):
@@ -1250,6 +1763,14 @@ def main():
     # modify disk state?
     if hasattr(o,'dry_run'):
         papers.config.DRYRUN = o.dry_run
+    if getattr(o,'pdf_backend',None):
+        if o.cmd in PDF_COMMANDS:
+            try:
+                pdf_backend(o.pdf_backend)
+            except ValueError as error:
+                print('papers: error: {} (see --pdf-backend)'.format(error))
+                parser.exit(1)
+        config.pdf_backend = o.pdf_backend
 
     if o.cmd == 'install':
         return installcmd(o)
@@ -1285,6 +1806,10 @@ def main():
         fetchcmd(o)
     elif o.cmd == 'extract':
         extractcmd(o)
+    elif o.cmd == 'serve':
+        servecmd(o)
+    elif o.cmd == 'batch':
+        batchcmd(o)
     else:
         print("\n Please run papers with an argument.\n For help use > papers -h \n")
         #raise ValueError('this is a bug')
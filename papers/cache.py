@@ -0,0 +1,491 @@
+"""Persistent caches of parsed bibtex libraries, stored in config.cache
+
+- snapshot of the parsed library, to skip parsing when the file did not change,
+  followed by a journal of the entries changed by later saves
+- byte-offset index of the entries, to parse only the entries looked up by key
+  (and to copy unchanged entries when the library is saved, see splice_index)
+- text, doi and metadata extracted from pdf files, by file content (see pdf_cache_get)
+
+A snapshot is only used if the bibtex file did not change since it was
+written: same size and modification time, or same content (sha256) when the
+time stamps cannot be trusted (file touched by git, or modified within the
+time stamp resolution of the last snapshot).
+
+Each journal record applies to the file content the previous record (or the
+snapshot) was made for: records that do not follow are ignored. The snapshot
+is rewritten (and the journal cleared) when the journal grows too large.
+"""
+import os
+import re
+import mmap
+import time
+import hashlib
+import pickle
+import tempfile
+
+import papers.config
+from papers.config import config, checksum, hash_bytestr_iter, file_as_blockiter
+from papers import logger
+from papers.encoding import STANDARD_TYPES, iter_bibtex, _bibtex_chunks
+
+SNAPSHOT_VERSION = 1
+
+# the snapshot is rewritten when the journal exceeds 1/JOURNAL_RATIO of its size
+JOURNAL_RATIO = 4
+
+# a file modified less than RACY_DELAY seconds before the snapshot was written
+# may have been modified again without changing its time stamp
+RACY_DELAY = 2
+
+
+def cache_file(bibtex, ext):
+    """ cache file for the bibtex file (by real path), with extension ext
+    """
+    path = os.path.realpath(bibtex)
+    name = os.path.basename(path) + '-' + hashlib.sha1(path.encode('utf-8')).hexdigest()[:10] + ext
+    return os.path.join(config.cache, 'library', name)
+
+
+def snapshot_file(bibtex):
+    return cache_file(bibtex, '.snapshot')
+
+
+def journal_file(bibtex):
+    return cache_file(bibtex, '.journal')
+
+
+def duplicate_state_file(bibtex):
+    return cache_file(bibtex, '.duplicates')
+
+
+def file_stamp(bibtex):
+    st = os.stat(bibtex)
+    return st.st_size, st.st_mtime
+
+
+# papers batch: {file: obj} written once all commands succeeded (see write_deferred)
+deferred = None
+
+
+def dump_pickle(obj, file, defer=False):
+    """ write pickle file atomically
+
+    defer: in a batch, keep obj in memory until the end of the batch
+    """
+    if defer and deferred is not None:
+        deferred[file] = obj
+        return
+    dirname = os.path.dirname(file)
+    if not os.path.exists(dirname):
+        try:
+            os.makedirs(dirname)
+        except OSError:  # created meanwhile by another process (see papers.ingest)
+            if not os.path.isdir(dirname):
+                raise
+    fd, tmp = tempfile.mkstemp(dir=dirname, prefix=os.path.basename(file)+'.', suffix='.tmp')
+    with os.fdopen(fd, 'wb') as f:
+        pickle.dump(obj, f, pickle.HIGHEST_PROTOCOL)
+    os.rename(tmp, file)
+
+
+def load_pickle(file):
+    """ load pickle file (None if missing or unreadable)
+    """
+    if deferred is not None and file in deferred:
+        return deferred[file]
+    if not os.path.exists(file):
+        return None
+    try:
+        with open(file, 'rb') as f:
+            return pickle.load(f)
+    except Exception as error:
+        logger.debug('failed to read '+file+': '+str(error))
+        return None
+
+
+def write_deferred(files):
+    """ write the files deferred by a batch (see dump_pickle)
+    """
+    for file, obj in files.items():
+        try:
+            dump_pickle(obj, file)
+        except (IOError, OSError) as error:
+            logger.warn('failed to write '+file+': '+str(error))
+
+
+def write_snapshot(bibtex, state, stamp, digest):
+    """ save the parsed library state
+
+    bibtex: bibtex file name
+    state: picklable state (see Biblio.snapshot)
+    stamp: (size, mtime) of the bibtex file at read or write time
+    digest: sha256 digest of the bibtex file content
+    """
+    if papers.config.DRYRUN:
+        return
+    size, mtime = stamp
+    snapshot = {'version': SNAPSHOT_VERSION, 'size': size, 'mtime': mtime,
+                'time': time.time(), 'sha256': digest, 'state': state}
+    try:
+        dump_pickle(snapshot, snapshot_file(bibtex))
+        if os.path.exists(journal_file(bibtex)):
+            os.remove(journal_file(bibtex))
+    except (IOError, OSError) as error:
+        logger.warn('failed to write library snapshot: '+str(error))
+
+
+def journal_snapshot(bibtex, edits, base, stamp, digest):
+    """ append entry changes to the snapshot journal
+
+    edits: [(position, count, entries)] to apply in turn to the entry list as
+        entries[position:position+count] = entries (see Biblio._edits)
+    base: sha256 digest of the bibtex file the edits apply to
+    stamp, digest: as in write_snapshot, after the edits
+
+    returns False if the snapshot must be rewritten instead (missing, or
+    journal too large)
+    """
+    if papers.config.DRYRUN:
+        return True
+    file, journal = snapshot_file(bibtex), journal_file(bibtex)
+    if not os.path.exists(file):
+        return False
+    if os.path.exists(journal) and os.path.getsize(journal) * JOURNAL_RATIO > os.path.getsize(file):
+        return False
+    size, mtime = stamp
+    record = {'base': base, 'size': size, 'mtime': mtime, 'time': time.time(),
+              'sha256': digest, 'edits': edits}
+    try:
+        with open(journal, 'ab') as f:
+            pickle.dump(record, f, pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+    except (IOError, OSError) as error:
+        logger.warn('failed to write library journal: '+str(error))
+        return False
+    return True
+
+
+def _replay(snapshot, journal):
+    """ apply the journal records that follow the snapshot, in place
+    """
+    entries = snapshot['state']['entries']
+    with open(journal, 'rb') as f:
+        while True:
+            try:
+                record = pickle.load(f)
+            except EOFError:
+                break
+            except Exception as error:  # interrupted write
+                logger.debug('failed to read '+journal+': '+str(error))
+                break
+            if record['base'] != snapshot['sha256']:
+                logger.debug('journal does not follow the snapshot: '+journal)
+                break
+            for position, count, inserted in record['edits']:
+                entries[position:position+count] = inserted
+            for k in ['size', 'mtime', 'time', 'sha256']:
+                snapshot[k] = record[k]
+    return snapshot
+
+
+def read_snapshot(bibtex):
+    """ return the saved library state, or None if missing or stale
+    """
+    file = snapshot_file(bibtex)
+    if not os.path.exists(file):
+        return None
+    snapshot = load_pickle(file)
+    if not snapshot or snapshot.get('version') != SNAPSHOT_VERSION:
+        return None
+    if os.path.exists(journal_file(bibtex)):
+        snapshot = _replay(snapshot, journal_file(bibtex))
+
+    size, mtime = file_stamp(bibtex)
+    if size != snapshot['size']:
+        logger.debug('snapshot is stale (size): '+bibtex)
+        return None
+
+    if mtime != snapshot['mtime'] or mtime > snapshot['time'] - RACY_DELAY:
+        if checksum(bibtex) != snapshot['sha256']:
+            logger.debug('snapshot is stale (content): '+bibtex)
+            return None
+        # same content: refresh time stamps so that next time is fast
+        if not journal_snapshot(bibtex, [], snapshot['sha256'], (size, mtime), snapshot['sha256']):
+            write_snapshot(bibtex, snapshot['state'], (size, mtime), snapshot['sha256'])
+
+    logger.debug('load snapshot: '+file)
+    return snapshot['state']
+
+
+# Byte-offset index of the entries in the bibtex file
+# ===================================================
+
+INDEX_VERSION = 1
+
+_type = re.compile(br'(?:\xef\xbb\xbf)?\s*@\s*([A-Za-z]+)')
+_key = re.compile(br'\s*[{(]\s*([^\s,]+)\s*,')
+_doi = re.compile(br'[\s,]doi\s*=\s*[{"]\s*([^{}"]+?)\s*[}"]', re.I)
+
+
+def index_file(bibtex):
+    return cache_file(bibtex, '.index')
+
+
+def _scan(data, index, start=0):
+    """ add entry chunks of data[start:] to index (offsets relative to data)
+    """
+    for offset, length in _bibtex_chunks(data[start:] if start else data):
+        offset += start
+        _scan_chunk(data[offset:offset+length], offset, index)
+    return index
+
+
+def _scan_chunk(chunk, offset, index):
+    m = _type.match(chunk)
+    if m is None:
+        return
+    index['last'] = offset
+    entrytype = m.group(1).decode('utf-8').lower()
+    if entrytype == 'string':
+        index['strings'] = True  # macros: entries cannot be parsed separately
+    m = _key.match(chunk, m.end())
+    if m is None or entrytype not in STANDARD_TYPES:
+        return
+    span = (offset, len(chunk))
+    index['keys'].setdefault(m.group(1).decode('utf-8').lower(), []).append(span)
+    m = _doi.search(chunk)
+    if m:
+        index['dois'].setdefault(m.group(1).decode('utf-8').lower(), []).append(span)
+
+
+def _drop_from(index, offset):
+    """ remove any span starting at or after offset
+    """
+    for name in ['keys', 'dois']:
+        for k in list(index[name]):
+            spans = [s for s in index[name][k] if s[0] < offset]
+            if spans:
+                index[name][k] = spans
+            else:
+                del index[name][k]
+
+
+def write_index(bibtex, data, stamp, digest, canonical=False):
+    """ build and save the index from the bibtex file content
+
+    canonical: the file was written by Biblio.save (see canonical_index)
+    """
+    index = {'version': INDEX_VERSION, 'keys': {}, 'dois': {}, 'last': 0, 'strings': False,
+             'canonical': canonical}
+    _scan(data, index)
+    _save_index(bibtex, index, stamp, digest)
+    return index
+
+
+def canonical_index(bibtex, stamp):
+    """ index of a file written by Biblio.save, unmodified since it had the
+    given (size, mtime) stamp: None otherwise
+
+    The chunks of such a file are the entries as formatted by format_entries.
+    """
+    if stamp is None or not os.path.exists(index_file(bibtex)):
+        return None
+    index = load_pickle(index_file(bibtex))
+    if not index or index.get('version') != INDEX_VERSION or not index.get('canonical'):
+        return None
+    if file_stamp(bibtex) != stamp or (index['size'], index['mtime']) != tuple(stamp):
+        return None
+    if stamp[1] > index['time'] - RACY_DELAY and checksum(bibtex) != index['sha256']:
+        return None
+    return index
+
+
+def splice_index(bibtex, index, pieces, stamp, digest):
+    """ build and save the index of a file written as a sequence of pieces
+
+    index: index of the previous version of the file
+    pieces: [(bytes, offset)], where offset is the position of the same chunk
+        in the previous version, or None for new content (scanned here)
+    """
+    new = {'version': INDEX_VERSION, 'keys': {}, 'dois': {}, 'last': 0, 'strings': False,
+           'canonical': True}
+    moved = {}  # old offset: new span
+    offset = 0
+    for chunk, old in pieces:
+        if old is None:
+            for start, length in _bibtex_chunks(chunk):
+                _scan_chunk(chunk[start:start+length], offset+start, new)
+        else:
+            moved[old] = (offset, len(chunk))
+            new['last'] = offset
+        offset += len(chunk)
+
+    for name in ['keys', 'dois']:
+        scanned, new[name] = new[name], {}
+        for k, spans in index[name].items():
+            spans = [moved[span[0]] for span in spans if span[0] in moved]
+            if spans:
+                new[name][k] = spans
+        for k, spans in scanned.items():
+            new[name][k] = sorted(new[name].get(k, []) + spans)
+    _save_index(bibtex, new, stamp, digest)
+    return new
+
+
+def _save_index(bibtex, index, stamp, digest):
+    index['size'], index['mtime'] = stamp
+    index['time'] = time.time()
+    index['sha256'] = digest
+    if papers.config.DRYRUN:
+        return
+    try:
+        dump_pickle(index, index_file(bibtex))
+    except (IOError, OSError) as error:
+        logger.warn('failed to write library index: '+str(error))
+
+
+def read_index(bibtex, data):
+    """ return an up-to-date index for the bibtex file
+
+    data: (memory-mapped) content of the bibtex file
+
+    A stale index is updated by scanning the appended part only, if the file
+    only grew since it was written, and rebuilt from scratch otherwise.
+    """
+    stamp = file_stamp(bibtex)
+    index = load_pickle(index_file(bibtex)) if os.path.exists(index_file(bibtex)) else None
+    if not index or index.get('version') != INDEX_VERSION:
+        logger.debug('build index: '+bibtex)
+        return write_index(bibtex, data, stamp, hashlib.sha256(data).digest())
+
+    size, mtime = stamp
+    if size == index['size'] and mtime == index['mtime'] and mtime <= index['time'] - RACY_DELAY:
+        return index
+
+    digest = hashlib.sha256(data).digest()
+    if size == index['size'] and digest == index['sha256']:
+        _save_index(bibtex, index, stamp, digest)
+
+    elif size > index['size'] and hashlib.sha256(data[:index['size']]).digest() == index['sha256']:
+        # append only: re-scan from the last entry (may have been extended)
+        logger.debug('update index: '+bibtex)
+        _drop_from(index, index['last'])
+        _scan(data, index, start=index['last'])
+        index['canonical'] = False
+        _save_index(bibtex, index, stamp, digest)
+
+    else:
+        logger.debug('rebuild index: '+bibtex)
+        index = write_index(bibtex, data, stamp, digest)
+
+    return index
+
+
+def lookup_entries(bibtex, keys=(), dois=()):
+    """ parse only the entries with given keys or dois (case-insensitive)
+
+    returns None if the index cannot be used (entries depend on @string macros)
+    """
+    with open(bibtex, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        index = read_index(bibtex, data)
+        if index['strings']:
+            return None
+        keys = set(k.lower() for k in keys)
+        dois = set(d.lower() for d in dois)
+        spans = set()
+        for k in keys:
+            spans.update(index['keys'].get(k, []))
+        for d in dois:
+            spans.update(index['dois'].get(d, []))
+        entries = []
+        for offset, length in sorted(spans):
+            for e in iter_bibtex(data[offset:offset+length]):
+                if e['ID'].lower() in keys or e.get('doi', '').lower() in dois:
+                    entries.append(e)
+        return entries
+    finally:
+        data.close()
+
+
+def count_entries(bibtex):
+    """ number of entries in the bibtex file, according to the index
+    """
+    with open(bibtex, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return sum(len(spans) for spans in read_index(bibtex, data)['keys'].values())
+    finally:
+        data.close()
+
+
+# Text, doi and metadata extracted from pdf files
+# ===============================================
+
+PDF_CACHE_VERSION = 1
+
+
+def _pdf_cache_dir():
+    return os.path.join(config.cache, 'pdf')
+
+
+def file_digest(path):
+    """ sha256 (hex) of the file content
+
+    The digest is saved with the (inode, size, mtime) of the file, and only
+    recomputed if they changed (or if they cannot be trusted, see RACY_DELAY).
+    """
+    realpath = os.path.realpath(path)
+    st = os.stat(realpath)
+    stamp = (st.st_ino, st.st_size, st.st_mtime)
+    file = os.path.join(_pdf_cache_dir(), 'stamps', hashlib.sha1(realpath.encode('utf-8')).hexdigest()[:16])
+    record = load_pickle(file) if os.path.exists(file) else None
+    if (record and record['path'] == realpath and record['stamp'] == stamp
+            and st.st_mtime <= record['time'] - RACY_DELAY):
+        return record['sha256']
+    digest = hash_bytestr_iter(file_as_blockiter(open(realpath, 'rb')), hashlib.sha256(), ashexstr=True)
+    if not papers.config.DRYRUN:
+        try:
+            dump_pickle({'path': realpath, 'stamp': stamp, 'time': time.time(), 'sha256': digest}, file)
+        except (IOError, OSError) as error:
+            logger.warn('failed to write pdf cache: '+str(error))
+    return digest
+
+
+def _pdf_record_file(digest):
+    return os.path.join(_pdf_cache_dir(), digest)
+
+
+def pdf_cache_get(pdf, field, key):
+    """ value extracted from a pdf with the same content, or None
+
+    field: 'text' (pdfhead), 'doi' (extract_pdf_doi) or 'metadata' (extract_pdf_metadata)
+    key: extraction parameters
+    """
+    file = _pdf_record_file(file_digest(pdf))
+    record = load_pickle(file) if os.path.exists(file) else None
+    if not record or record.get('version') != PDF_CACHE_VERSION:
+        return None
+    return record.get(field, {}).get(key)
+
+
+def pdf_cache_set(pdf, field, key, value):
+    """ save a value extracted from pdf (see pdf_cache_get)
+    """
+    if papers.config.DRYRUN:
+        return
+    file = _pdf_record_file(file_digest(pdf))
+    record = load_pickle(file) if os.path.exists(file) else None
+    if not record or record.get('version') != PDF_CACHE_VERSION:
+        record = {'version': PDF_CACHE_VERSION}
+    record.setdefault(field, {})[key] = value
+    try:
+        dump_pickle(record, file)
+    except (IOError, OSError) as error:
+        logger.warn('failed to write pdf cache: '+str(error))
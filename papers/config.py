@@ -4,11 +4,12 @@ import shutil
 import subprocess as sp
 import sys
 import hashlib
-import bibtexparser
+import threading
 import six
 from six.moves import input as raw_input
 from papers import logger
 from papers.pretty import boxed_status
+from papers.encoding import iter_bibtex
 
 
 # GIT = False
@@ -44,7 +45,8 @@ class Config(object):
 
     """
     def __init__(self, file=CONFIG_FILE, data=DATA_DIR, cache=CACHE_DIR,
-        bibtex=None, filesdir=None, gitdir=None, git=False, name=None, keygen=None):
+        bibtex=None, filesdir=None, gitdir=None, git=False, name=None, keygen=None,
+        pdf_backend='poppler'):
         """ Definition of the Config object 
 
 
@@ -58,6 +60,7 @@ class Config(object):
             git:
             name:     name of dataset (bibtex lib)
             keygen:
+            pdf_backend: pdf text extraction (poppler, pypdf, pdfminer or auto)
         """
 
         self.keygen   = keygen
@@ -69,6 +72,7 @@ class Config(object):
         self.git      = git
         self.filesdir = filesdir or os.path.join(data, 'files')
         self.bibtex   = bibtex  or os.path.join(data, 'papers.bib')
+        self.pdf_backend = pdf_backend
 
     def collections(self):
         files = []
@@ -84,6 +88,7 @@ class Config(object):
             "bibtex"  : self.bibtex,
             "git"     : self.git,
             "gitdir"  : self.gitdir,
+            "pdf_backend": self.pdf_backend,
             }, open(self.file, 'w'), sort_keys=True, indent=2, separators=(',', ': '))
 
 
@@ -95,6 +100,7 @@ class Config(object):
         self.gitdir   = js.get('gitdir'  , self.gitdir)
         self.cname    = js.get('name'    , self.cname)
         self.keygen   = js.get('keygen'  , self.keygen)
+        self.pdf_backend = js.get('pdf_backend', self.pdf_backend)
 
     def reset(self):
         cfg = type(self)()
@@ -152,6 +158,8 @@ class Config(object):
         lines.append(' * git-tracked: '+str(self.git))
         if self.git:
            lines.append(' * git path:    '+self.gitdir)
+        if verbose:
+            lines.append(' * pdf backend: '+self.pdf_backend)
 
         # CHECKING STATUS filesdir =================================
         if not os.path.exists(self.filesdir):
@@ -173,10 +181,10 @@ class Config(object):
             bstatus = ' (missing) '
         elif check_files:
             try:
-                bibtexstring = open(self.bibtex).read()
-                db = bibtexparser.loads(bibtexstring)
-                if len(db.entries):
-                    bstatus = ' ({} entries)'.format(len(db.entries))
+                bibtexstring = open(self.bibtex, 'rb').read()
+                nentries = sum(1 for e in iter_bibtex(bibtexstring))
+                if nentries:
+                    bstatus = ' ({} entries)'.format(nentries)
 
                 else:
                     bstatus = ' (empty) '
@@ -200,10 +208,9 @@ def cached(file, hashed_key=False):
     file = os.path.join(config.cache, file)
 
     def decorator(fun):
-        if os.path.exists(file):
-            cache = json.load(open(file))
-        else:
-            cache = {}
+        cache = {}
+        loaded = []  # the cache file is read on first call
+        lock = threading.Lock()  # concurrent lookups (see papers.ingest)
         def decorated(doi):
             if hashed_key: # use hashed parameter as key (for full text query)
                 if six.PY3:
@@ -212,11 +219,17 @@ def cached(file, hashed_key=False):
                     key = hashlib.sha256(doi).hexdigest()[:6]
             else:
                 key = doi
-            if key in cache:
-                logger.debug('load from cache: '+repr((file, key)))
-                return cache[key]
-            else:
-                res = cache[key] = fun(doi)
+            with lock:
+                if not loaded:
+                    if os.path.exists(file):
+                        cache.update(json.load(open(file)))
+                    loaded.append(True)
+                if key in cache:
+                    logger.debug('load from cache: '+repr((file, key)))
+                    return cache[key]
+            res = fun(doi)
+            with lock:
+                cache[key] = res
                 if not DRYRUN:
                     json.dump(cache, open(file,'w'))
             return res
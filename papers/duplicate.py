@@ -3,63 +3,125 @@ from __future__ import print_function
 import operator
 import os
 import itertools
+import hashlib
+import json
 import six
 from six.moves import input as raw_input
 import re
 import difflib
 
-import bibtexparser
-
 import logging
 logger = logging.getLogger(__name__)
 
 from papers.extract import isvaliddoi, fetch_entry
-from papers.encoding import parse_file, format_file, format_entries
+from papers.encoding import parse_file, format_file, format_entries, format_entry, bibtexparser
 
 from papers.pretty import bcol as bcolors
+from papers.cache import dump_pickle, load_pickle
+import papers.config
+
+DUPLICATE_STATE_VERSION = 1
 
 
 # SEARCH DUPLICATES
 # =================
 
 
-def _group_key(groups, check):
-    for k in groups:
-        for ee in groups[k]:
-            if check(ee):
-                return k
-    return None
+def _find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]  # path halving
+        i = parent[i]
+    return i
+
+
+def _candidate_pairs(entries, blocks):
+    """ (i, j) pairs with i > j that share a blocking key
+
+    blocks(e) returns a list of keys, or None to compare e with all entries
+    """
+    blocked = {}
+    unblocked = []
+    for i, e in enumerate(entries):
+        keys = blocks(e)
+        if keys is None:
+            unblocked.append(i)
+            for j in range(i):
+                yield i, j
+            continue
+        seen = set()
+        for k in keys:
+            for j in blocked.get(k, []):
+                if j not in seen:
+                    seen.add(j)
+                    yield i, j
+            blocked.setdefault(k, []).append(i)
+        for j in unblocked:
+            if j not in seen:
+                yield i, j
+
+
+def fuzzy_pairs(tags, ratio, block_size=1000, workers=-1):
+    """(i, j) pairs with i > j and token_set_ratio(tags[i], tags[j]) >= ratio
+
+    Computed by blocks of rows with rapidfuzz.process.cdist (multi-threaded),
+    so that memory stays within block_size * len(tags) bytes.
+    """
+    import numpy as np
+    from rapidfuzz.process import cdist
+    from rapidfuzz.fuzz import token_set_ratio
+
+    for start in range(0, len(tags), block_size):
+        stop = min(start+block_size, len(tags))
+        scores = cdist(tags[start:stop], tags[:stop], scorer=token_set_ratio,
+                       score_cutoff=ratio, dtype=np.uint8, workers=workers)
+        rows, cols = np.nonzero(np.tril(scores, k=start-1))
+        for i, j in zip(rows + start, cols):
+            yield int(i), int(j)
+
 
+def groupby_equal(entries, eq=None, blocks=None, equal_pairs=()):
+    """groupby based on full equality (transitive: union-find)
 
-def groupby_equal(entries, eq=None):
-    """groupby based on full equality (slow !)
+    blocks: optional function that returns blocking keys for an entry: eq is
+        only evaluated on pairs that share a key (None: compare with all)
+    equal_pairs: (i, j) index pairs known to be equal (e.g. fuzzy_pairs)
 
     >>> groupby_equal([(1,0),(1,1),(1,2),(2,0),(3,0),(2,1),(4,0)], lambda e1, e2: e1[0]==e2[0])
-    [(0, {(1, 0), (1, 1), (1, 2)}),
-     (1, {(2, 0), (2, 1)}),
-     (2, {(3, 0)}),
-     (3, {(4, 0)})]
+    [(0, [(1, 0), (1, 1), (1, 2)]),
+     (1, [(2, 0), (2, 1)]),
+     (2, [(3, 0)]),
+     (3, [(4, 0)])]
     """
     equal = eq or operator.eq
+    if blocks is None:
+        pairs = ((i, j) for i in range(len(entries)) for j in range(i))
+    else:
+        pairs = _candidate_pairs(entries, blocks)
+
+    parent = list(range(len(entries)))
+    for i, j in equal_pairs:
+        ri, rj = _find(parent, i), _find(parent, j)
+        parent[max(ri, rj)] = min(ri, rj)
+    for i, j in pairs:
+        ri, rj = _find(parent, i), _find(parent, j)
+        if ri != rj and equal(entries[j], entries[i]):
+            parent[max(ri, rj)] = min(ri, rj)
+
     groups = {}
-    for e in entries:
-        k = _group_key(groups, lambda ee: equal(ee,e))
-        if k is None:
-            group = []
-            groups[len(groups)] = group
-        else:
-            group = groups[k]
-        group.append(e)
-    return sorted(six.iteritems(groups)) 
+    for i, e in enumerate(entries):
+        groups.setdefault(_find(parent, i), []).append(e)
+    return [(k, groups[r]) for k, r in enumerate(sorted(groups))]
 
 
-def search_duplicates(entries, key=None, eq=None, issorted=False, filter_key=None):
+def search_duplicates(entries, key=None, eq=None, issorted=False, filter_key=None, blocks=None, equal_pairs=()):
     """search for duplicates
 
     entries: list elements
     key: key to check for equality
     eq: binary operator for equality check (slower)
     issorted: if True and key is provided, skip sort 
+    blocks: blocking keys to restrict eq checks (see groupby_equal)
+    equal_pairs: index pairs of entries known to be equal (see groupby_equal)
 
     returns:
     - unique_entries : list (entries for which no duplicates where found)
@@ -70,7 +132,7 @@ def search_duplicates(entries, key=None, eq=None, issorted=False, filter_key=Non
     ([(3, 0), (4, 0)], [[(1, 0), (1, 1), (1, 2)], [(2, 0), (2, 1)]])
 
     >>> search_duplicates([(1,0), (1,1), (1,2), (2,0), (3,0), (2,1), (4,0)], eq=lambda e1, e2: e1[0]==e2[0])
-    ([(3, 0), (4, 0)], [[(1, 2), (1, 0), (1, 1)], [(2, 0), (2, 1)]])
+    ([(3, 0), (4, 0)], [[(1, 0), (1, 1), (1, 2)], [(2, 0), (2, 1)]])
     """
     if key or eq is None:
         if not issorted:
@@ -78,7 +140,7 @@ def search_duplicates(entries, key=None, eq=None, issorted=False, filter_key=Non
         grouped = itertools.groupby(entries, key)
 
     else:
-        grouped = groupby_equal(entries, eq)
+        grouped = groupby_equal(list(entries), eq, blocks, equal_pairs)
 
     duplicates = []
     unique_entries = []
@@ -171,18 +233,18 @@ dummybcolors = DummyBcolors()
 
 def _colordiffline(line, sign=None):
     if sign == '+' or line.startswith('+'):
-        return bcolors.OKGREEN + line + bcolors.ENDC
+        return bcolors.GREEN + line + bcolors.ENDC
     elif sign == '-' or line.startswith('-'):
         return bcolors.FAIL + line + bcolors.ENDC
     elif sign == '?' or line.startswith('?'):
-        return bcolors.WARNING + line + bcolors.ENDC
+        return bcolors.WARN + line + bcolors.ENDC
     elif sign == '!' or line.startswith('!'):
-        return bcolors.BOLD + bcolors.WARNING + line + bcolors.ENDC
+        return bcolors.BOLD + bcolors.WARN + line + bcolors.ENDC
     elif sign == '*' or line.startswith('*'):
         return bcolors.BOLD + line + bcolors.ENDC
     # elif sign == '>' or line.startswith('>'):
         # return bcolors.BOLD + line + bcolors.ENDC    
-        # return bcolors.BOLD + bcolors.WARNING + line + bcolors.ENDC
+        # return bcolors.BOLD + bcolors.WARN + line + bcolors.ENDC
     else:
         return line
 
@@ -212,9 +274,7 @@ def entry_ndiff(entries, color=True):
             m[k] = SECRET_STRING.format(k)
         elif any(k not in e for e in entries):
             somemissing.append(k)
-    db = bibtexparser.bibdatabase.BibDatabase()
-    db.entries.append(m)
-    s = bibtexparser.dumps(db)
+    s = format_entry(m)
     lines = []
     for line in s.splitlines():
         matches = regex.findall(line)
@@ -249,9 +309,6 @@ def entry_sdiff(entries, color=True, bcolors=bcolors, best=None):
     if not color:
         bcolors = dummybcolors
 
-    db = bibtexparser.bibdatabase.BibDatabase()
-    db.entries.append(None)
-
     merged = merge_entries(entries)
     conflicting_fields = [k for k in merged if isinstance(merged[k], ConflictingField)]
     somemissing = [k for k in merged if any(k not in e for e in entries)]
@@ -259,15 +316,12 @@ def entry_sdiff(entries, color=True, bcolors=bcolors, best=None):
     entry_strings = []
 
     for i, entry in enumerate(entries):
-        db.entries[0] = entry
-        string = bibtexparser.dumps(db)
-        if six.PY2:
-            string = string.decode('utf-8') # decode to avoid failure in replace
+        string = format_entry(entry)
         # color the conflicting fields
         lines = []
         for line in string.splitlines():
             for k in conflicting_fields+somemissing:
-                fmt = lambda s : (bcolors.WARNING if k in conflicting_fields else bcolors.BOLD)+s+bcolors.ENDC
+                fmt = lambda s : (bcolors.WARN if k in conflicting_fields else bcolors.BOLD)+s+bcolors.ENDC
                 if k != k.lower() and '@' in line:
                     line = line.replace(entry[k], fmt(entry[k]))
                 elif line.strip().startswith('{} = {{'.format(k)):
@@ -275,11 +329,11 @@ def entry_sdiff(entries, color=True, bcolors=bcolors, best=None):
             lines.append(line)
         string = '\n'.join(lines)
         if best is None:
-            entry_strings.append(bcolors.OKBLUE+'* ('+str(i+1)+')'+bcolors.ENDC+'\n'+string)
+            entry_strings.append(bcolors.BLUE+'* ('+str(i+1)+')'+bcolors.ENDC+'\n'+string)
         elif entry == best:
-            entry_strings.append(bcolors.OKBLUE+'* ('+str(i+1)+')'+bcolors.ENDC+'\n'+string)
+            entry_strings.append(bcolors.BLUE+'* ('+str(i+1)+')'+bcolors.ENDC+'\n'+string)
         else:
-            entry_strings.append(bcolors.OKBLUE+'  ('+str(i+1)+')'+bcolors.ENDC+'\n'+string)
+            entry_strings.append(bcolors.BLUE+'  ('+str(i+1)+')'+bcolors.ENDC+'\n'+string)
 
     return '\n'.join(entry_strings)
 
@@ -358,9 +412,7 @@ def edit_entries(entries, diff=False, ndiff=False):
         else:
             entrystring = entry_diff(*entries, color=False)
     else:
-        db = bibtexparser.bibdatabase.BibDatabase()
-        db.entries.extend(entries)
-        entrystring = bibtexparser.dumps(db)
+        entrystring = format_entries(entries)
 
     if six.PY2:
         entrystring = entrystring.encode('utf-8')
@@ -385,8 +437,38 @@ def score(e):
     return (100*('doi' in e and isvaliddoi(e['doi'])) + 50*('title' in e) + 10*('author' in e) + 1*('file' in e))*100 + len(e)
 
 
-def bestentry(entries):
-    return sorted(entries, key=score)[-1]
+def bestentry(entries, cache=None):
+    return sorted(entries, key=cache.score if cache is not None else score)[-1]
+
+
+class EntryCache(object):
+    """derived fields of entries (entry id, score...), computed once
+
+    Values are keyed by entry identity and stored along with the raw fields
+    they derive from: entries modified in place (fix_entry, merge, edit) are
+    recomputed on next access.
+    """
+    def __init__(self):
+        self._values = {}
+
+    def get(self, e, func, fields):
+        raw = (len(e),) + tuple(e.get(k) for k in fields)
+        cached = self._values.get((id(e), func))
+        if cached is not None and cached[0] == raw:
+            return cached[1]
+        value = func(e)
+        self._values[(id(e), func)] = raw, value
+        return value
+
+    def score(self, e):
+        return self.get(e, score, ('doi', 'title', 'author', 'file'))
+
+    def prune(self, entries):
+        """forget entries not in the list
+        """
+        ids = set(id(e) for e in entries)
+        for k in [k for k in self._values if k[0] not in ids]:
+            del self._values[k]
 
 
 class DuplicateSkip(Exception):
@@ -398,8 +480,10 @@ class DuplicateSkipAll(Exception):
 
 class DuplicateHandler(object):
 
-    def __init__(self, entries):
+    def __init__(self, entries, cache=None):
         self.entries = entries
+        self.validated = False  # (n)ot a duplicate
+        self.cache = cache
 
     # view methods
     def viewdiff(self, color=True, update=False):
@@ -425,7 +509,7 @@ class DuplicateHandler(object):
         self.entries = []
     
     def best(self):
-        return bestentry(self.entries)
+        return bestentry(self.entries, self.cache)
 
     def fetch(self):
         # pick best entry to update from
@@ -476,11 +560,11 @@ class DuplicateHandler(object):
 (V)iew toggle for diff mode
 '''
             if not diffview:
-                msg = bcolors.OKBLUE + 'Pick entry or choose one of the following actions:'+bcolors.ENDC+txt
+                msg = bcolors.BLUE + 'Pick entry or choose one of the following actions:'+bcolors.ENDC+txt
                 e = choose_entry_interactive(self.entries, extra=choices, msg=msg, select=True, best=self.best())
             else:
                 print(entry_ndiff(self.entries))
-                print(bcolors.OKBLUE + 'Choose one of the following actions:'+bcolors.ENDC + txt)
+                print(bcolors.BLUE + 'Choose one of the following actions:'+bcolors.ENDC + txt)
 # .replace('(s)','('+_colordiffline('s','-')+')'))
                 ans = None
                 while ans not in choices:
@@ -508,6 +592,7 @@ class DuplicateHandler(object):
                 raise DuplicateSkip()
 
             elif e == 'n':
+                self.validated = True
                 break
 
             elif isinstance(e, dict):
@@ -533,15 +618,18 @@ class DuplicateHandler(object):
 
 
 
-def resolve_duplicates(duplicates, mode='i'):
-    conflict = DuplicateHandler(duplicates)
+def resolve_duplicates(duplicates, mode='i', state=None, cache=None):
+    conflict = DuplicateHandler(duplicates, cache)
     conflict.remove_duplicates()
 
     if len(conflict.entries) > 1:
         if mode == 'i':
             conflict.interactive_loop()
+            if state is not None and conflict.validated:
+                state.validate(conflict.entries)
         elif mode == 's':
-            pass
+            if state is not None:
+                state.unresolved(conflict.entries)
         else:
             print(conflict.format())
             raise ValueError('unresolved conflicts')
@@ -549,24 +637,108 @@ def resolve_duplicates(duplicates, mode='i'):
     return conflict.entries
     
 
-def check_duplicates(entries, key=None, eq=None, issorted=False, filter_key=None, mode='i'):
+def check_duplicates(entries, key=None, eq=None, issorted=False, filter_key=None, mode='i', blocks=None, equal_pairs=(),
+                     state=None, cache=None):
     """check duplicates, given a key or equality function
     !! resolved duplicates are appended to the list of entries
+
+    state: DuplicateState, to skip pairs checked in previous runs (with eq only)
+    cache: EntryCache (entry score)
     """
-    entries, duplicate_groups = search_duplicates(entries, key, eq, issorted, filter_key)
+    if state is not None and eq is not None and not key:
+        eq = state.wrap(eq)
+        equal_pairs = [(i, j) for i, j in equal_pairs if state.unknown(entries[i], entries[j])]
+    entries, duplicate_groups = search_duplicates(entries, key, eq, issorted, filter_key, blocks, equal_pairs)
     logger.info(str(len(duplicate_groups))+' duplicate(s)')
 
-    for duplicates in duplicate_groups:
+    for i, duplicates in enumerate(duplicate_groups):
         try:
-            entries.extend(resolve_duplicates(duplicates, mode))
+            entries.extend(resolve_duplicates(duplicates, mode, state, cache))
         except DuplicateSkip:
             entries.extend(duplicates)
+            if state is not None:
+                state.unresolved(duplicates)
         except DuplicateSkipAll:
-            entries.extend(itertools.chain(duplicates))        
+            for duplicates in duplicate_groups[i:]:
+                entries.extend(duplicates)
+                if state is not None:
+                    state.unresolved(duplicates)
             break
     return entries
 
 
+class DuplicateState(object):
+    """entries already checked for duplicates, and pairs validated as distinct
+
+    Persisted across runs (papers check --duplicates), so that only new or
+    modified entries are compared, and validated pairs never prompted again.
+    Entries are identified by a fingerprint of their content.
+    """
+    def __init__(self, checked=(), distinct=(), settings=None):
+        self.checked = set(checked)
+        self.distinct = set(distinct)  # frozenset pairs of fingerprints
+        self.settings = settings
+        self._unresolved = set()
+        self._fingerprints = {}
+
+    @classmethod
+    def load(cls, file, settings=None):
+        state = load_pickle(file)
+        if not state or state.get('version') != DUPLICATE_STATE_VERSION:
+            return cls(settings=settings)
+        if state['settings'] != settings:
+            # other similarity criteria: check everything again, keep user decisions
+            return cls(distinct=state['distinct'], settings=settings)
+        return cls(state['checked'], state['distinct'], settings)
+
+    def save(self, file):
+        if papers.config.DRYRUN:
+            return
+        try:
+            dump_pickle({'version': DUPLICATE_STATE_VERSION, 'settings': self.settings,
+                   'checked': self.checked, 'distinct': self.distinct}, file, defer=True)
+        except (IOError, OSError) as error:
+            logger.warn('failed to write duplicate state: '+str(error))
+
+    def fingerprint(self, e):
+        fp = self._fingerprints.get(id(e))
+        if fp is None:
+            fp = self._fingerprints[id(e)] = entry_fingerprint(e)
+        return fp
+
+    def unknown(self, e1, e2):
+        """pair not checked yet
+        """
+        fp1, fp2 = self.fingerprint(e1), self.fingerprint(e2)
+        if fp1 in self.checked and fp2 in self.checked:
+            return False
+        return frozenset((fp1, fp2)) not in self.distinct
+
+    def wrap(self, eq):
+        return lambda e1, e2: self.unknown(e1, e2) and eq(e1, e2)
+
+    def validate(self, entries):
+        """entries are not duplicates of each other
+        """
+        fps = [entry_fingerprint(e) for e in entries]
+        for fp1, fp2 in itertools.combinations(fps, 2):
+            self.distinct.add(frozenset((fp1, fp2)))
+
+    def unresolved(self, entries):
+        self._unresolved.update(entry_fingerprint(e) for e in entries)
+
+    def finish(self, entries):
+        """mark all entries but unresolved duplicates as checked
+        """
+        self.checked = set(entry_fingerprint(e) for e in entries) - self._unresolved
+        self._unresolved = set()
+        self._fingerprints = {}
+
+
+def entry_fingerprint(e):
+    return hashlib.sha1(json.dumps(e, sort_keys=True).encode('utf-8')).hexdigest()
+
+
 
 # SPECIAL CASE OF CONFLICT RESOLUTION: on insert
 # ==============================================
@@ -576,7 +748,7 @@ def conflict_resolution_on_insert(old, new, mode='i'):
     """
     if mode == 'i':
         print(entry_diff(old, new))
-        print(bcolors.OKBLUE + 'what to do? ')
+        print(bcolors.BLUE + 'what to do? ')
         print('''
 (u)pdate missing (discard conflicting fields in new entry)
 (U)pdate other (overwrite conflicting fields in old entry)
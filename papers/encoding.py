@@ -1,26 +1,304 @@
-
 import os
+import re
+import logging
+import collections
+import functools
 import six
-import bibtexparser
-from papers.latexenc import latex_to_unicode, unicode_to_latex
+from papers.latexenc import latex_to_unicode, encode_latex, is_ascii
 from unidecode import unidecode as unicode_to_ascii
 
-# fix bibtexparser issue
-if six.PY2:
-    _bloads = bibtexparser.loads 
-    _bdumps = bibtexparser.dumps
-    bibtexparser.loads = lambda s: (_bloads(s.decode('utf-8') if type(s) is str else s))
-    bibtexparser.dumps = lambda db: _bdumps(db).encode('utf-8')
+logger = logging.getLogger(__name__)
 
 
-# fix bibtexparser call on empty strings
-_bloads_orig = bibtexparser.loads
-def _bloads_fixed(s):
-    if s == '':
-        return bibtexparser.bibdatabase.BibDatabase()
-    else:
-        return _bloads_orig(s)
-bibtexparser.loads = _bloads_fixed
+class LazyModule(object):
+    """module imported on first attribute access
+
+    setup: called with the module once imported
+    """
+    def __init__(self, name, setup=None):
+        self._name = name
+        self._setup = setup
+
+    def __getattr__(self, attr):
+        module = __import__(self._name)
+        if self._setup is not None:
+            self._setup(module)
+            self._setup = None
+        self.__dict__.update(module.__dict__)  # next lookups bypass __getattr__
+        return getattr(module, attr)
+
+
+def _fix_bibtexparser(bibtexparser):
+    # fix bibtexparser issue
+    if six.PY2:
+        _bloads = bibtexparser.loads
+        _bdumps = bibtexparser.dumps
+        bibtexparser.loads = lambda s: (_bloads(s.decode('utf-8') if type(s) is str else s))
+        bibtexparser.dumps = lambda db: _bdumps(db).encode('utf-8')
+
+    # fix bibtexparser call on empty strings
+    _bloads_orig = bibtexparser.loads
+    def _bloads_fixed(s):
+        if s == '':
+            return bibtexparser.bibdatabase.BibDatabase()
+        else:
+            return _bloads_orig(s)
+    bibtexparser.loads = _bloads_fixed
+
+
+# bibtexparser (pyparsing) is slow to import: many commands never need it
+bibtexparser = LazyModule('bibtexparser', _fix_bibtexparser)
+
+# as bibtexparser.bibdatabase.STANDARD_TYPES
+STANDARD_TYPES = set(['article', 'book', 'booklet', 'conference', 'inbook', 'incollection',
+    'inproceedings', 'manual', 'mastersthesis', 'misc', 'phdthesis', 'proceedings',
+    'techreport', 'unpublished'])
+
+
+# Fast bibtex parser
+# ==================
+#
+# bibtexparser's pyparsing grammar is the main cost of loading a large library.
+# The parser below only understands the subset of bibtex that papers writes
+# (standard entry types, braced / quoted / integer values). Any other chunk of
+# the file (comments, @string, concatenation, macros...) is handed over to
+# bibtexparser, so that the result is identical to bibtexparser.loads.
+
+class FastParseError(ValueError):
+    pass
+
+
+_entry_start = re.compile(r'^[ \t]*@', re.M)
+_entry_start_bytes = re.compile(br'^[ \t]*@', re.M)
+_entry_head = re.compile(r'\s*@\s*([A-Za-z]+)\s*([{(])\s*([^\s,]+)\s*,')
+_field_name = re.compile(r'\s*([A-Za-z0-9_\-().+]+)\s*=\s*')
+_field_sep = re.compile(r'\s*(,?)\s*')
+_integer = re.compile(r'\d+')
+_braces = re.compile(r'[{}]')
+_quote_or_braces = re.compile(r'["{}]')
+
+
+def _strip_after_new_lines(s):
+    # as bibtexparser: remove leading whitespaces in all but first line
+    lines = s.splitlines()
+    if len(lines) > 1:
+        lines = [lines[0]] + [l.lstrip() for l in lines[1:]]
+    return '\n'.join(lines)
+
+
+def _scan_value(chunk, pos):
+    """ return content and end position of the braced or quoted value at pos
+    """
+    quoted = chunk[pos] == '"'
+    level = 0 if quoted else 1
+    for m in (_quote_or_braces if quoted else _braces).finditer(chunk, pos+1):
+        c = m.group()
+        if c == '{':
+            level += 1
+        elif c == '}':
+            level -= 1
+            if level < 0:
+                break
+            elif level == 0 and not quoted:
+                return chunk[pos+1:m.start()], m.end()
+        elif level == 0:  # closing quote
+            return chunk[pos+1:m.start()], m.end()
+    raise FastParseError('unbalanced value')
+
+
+def parse_entry_fast(chunk):
+    """ parse a single bibtex entry
+
+    raise FastParseError for anything but a standard entry with braced,
+    quoted or integer values.
+    """
+    head = _entry_head.match(chunk)
+    if head is None:
+        raise FastParseError('not an entry')
+    entrytype = head.group(1).lower()
+    if entrytype not in STANDARD_TYPES:
+        raise FastParseError('non-standard entry type: '+entrytype)
+    closing = '}' if head.group(2) == '{' else ')'
+    pos = head.end()
+
+    fields = []
+    while True:
+        m = _field_name.match(chunk, pos)
+        if m is None:
+            raise FastParseError('expected field name')
+        name, pos = m.group(1), m.end()
+        if chunk[pos:pos+1] in ('{', '"'):
+            value, pos = _scan_value(chunk, pos)
+        else:
+            m = _integer.match(chunk, pos)
+            if m is None:
+                raise FastParseError('string macro')
+            value, pos = m.group(), m.end()
+        fields.append((name, _strip_after_new_lines(value)))
+
+        m = _field_sep.match(chunk, pos)
+        pos = m.end()
+        if chunk.startswith(closing, pos):
+            break
+        elif not m.group(1):
+            raise FastParseError('expected "," or "'+closing+'"')
+
+    if chunk[pos+1:].strip():
+        raise FastParseError('trailing text after entry')
+
+    # same field precedence and ordering as bibtexparser
+    fields = {k: v for (k, v) in reversed(fields)}
+    entry = {}
+    for k in fields:
+        entry[k.lower()] = '' if fields[k] == '{}' else fields[k]
+    entry['ENTRYTYPE'] = entrytype
+    entry['ID'] = head.group(3)
+    return entry
+
+
+def _bibtex_chunks(data):
+    """ split bibtex data into chunks starting with '@' at the beginning of a line
+
+    yields (offset, length) in units of data (bytes if data is bytes or mmap)
+    """
+    text = isinstance(data, six.text_type)
+    pattern = _entry_start if text else _entry_start_bytes
+    lbrace, rbrace = ('{', '}') if text else (b'{', b'}')
+    start = last = level = 0
+    for m in pattern.finditer(data):
+        end = m.start()
+        piece = data[last:end]
+        level += piece.count(lbrace) - piece.count(rbrace)
+        last = end
+        if level > 0:
+            continue  # '@' inside a field value
+        if end > start:
+            yield start, end - start
+        start = end
+        level = 0
+    if len(data) > start:
+        yield start, len(data) - start
+
+
+def iter_bibtex_offsets(data, db=None):
+    """ generate (offset, length, entry) from bibtex data
+
+    data: unicode string, or utf-8 encoded bytes / mmap (offsets are then in bytes)
+    db: BibDatabase that receives whatever bibtexparser finds besides entries
+        in the chunks the fast parser does not understand (comments, strings...)
+    """
+    parser = None  # bibtexparser, created on first need
+
+    for offset, length in _bibtex_chunks(data):
+        chunk = data[offset:offset+length]
+        if not isinstance(chunk, six.text_type):
+            chunk = chunk.decode('utf-8')
+        if offset == 0:
+            chunk = chunk.lstrip(u'\ufeff')  # byte order mark
+        if not chunk.strip():
+            continue
+        try:
+            entry = parse_entry_fast(chunk)
+        except FastParseError as error:
+            logger.debug(u'fall back to bibtexparser ({}): {}'.format(error, chunk[:50]))
+            if parser is None:
+                parser = bibtexparser.bparser.BibTexParser()
+                parser.expect_multiple_parse = True
+                if db is not None:
+                    db.strings.update(parser.bib_database.strings)
+                    parser.bib_database = db
+                db = parser.bib_database
+            n = len(db.entries)
+            parser.parse(chunk, partial=True)
+            entries = db.entries[n:]
+            del db.entries[n:]
+            for e in entries:
+                yield offset, length, e
+        else:
+            yield offset, length, entry
+
+
+def iter_bibtex(data, db=None):
+    """ generate entries from bibtex data (see iter_bibtex_offsets)
+    """
+    for offset, length, e in iter_bibtex_offsets(data, db):
+        yield e
+
+
+def parse_bibtex(data):
+    """ drop-in replacement for bibtexparser.loads (also accepts utf-8 bytes)
+    """
+    if six.PY2 and type(data) is str:
+        data = data.decode('utf-8')
+    db = bibtexparser.bibdatabase.BibDatabase()
+    if not data:
+        return db  # as bibtexparser.loads (fixed)
+    db.entries = list(iter_bibtex(data, db))
+    return db
+
+
+def parse_bibtex_file(bibtex):
+    with open(bibtex, 'rb') as f:
+        return parse_bibtex(f.read())
+
+
+# Bibtex writer
+# =============
+#
+# The layout of bibtexparser's writer with default settings, which papers has
+# always written: entries sorted by key, then fields in alphabetical order,
+# one per line, indented by one space. Owning it keeps the files (and their
+# git diffs) stable across bibtexparser versions, and it is much faster.
+
+def _format_value(value):
+    if isinstance(value, six.string_types):
+        return '{' + value + '}'
+    from bibtexparser.bwriter import _str_or_expr_to_bibtex  # @string expressions
+    return _str_or_expr_to_bibtex(value)
+
+
+def format_entry(entry):
+    """ bibtex string of one entry (ends with a new line)
+    """
+    parts = ['@', entry['ENTRYTYPE'], '{', entry['ID']]
+    for k in sorted(entry):
+        if k != 'ENTRYTYPE' and k != 'ID':
+            parts += (',\n ', k, ' = {', entry[k], '}')
+    parts.append('\n}\n')
+    try:
+        return ''.join(parts)
+    except TypeError:
+        pass
+    try:  # @string expressions
+        return ''.join(['@', entry['ENTRYTYPE'], '{', entry['ID']]
+            + [',\n ' + k + ' = ' + _format_value(entry[k]) for k in sorted(entry) if k != 'ENTRYTYPE' and k != 'ID']
+            + ['\n}\n'])
+    except TypeError:
+        raise TypeError(u'The fields of entry {} must be strings'.format(entry['ID']))
+
+
+def format_header(db):
+    """ bibtex string of what comes before the entries: comments, preambles, strings
+    """
+    parts = ['@comment{' + c + '}\n\n' for c in db.comments]
+    parts.extend('@preamble{"' + p + '"}\n\n' for p in db.preambles)
+    if db.strings:
+        from bibtexparser.bibdatabase import COMMON_STRINGS  # not written unless redefined
+        parts.extend('@string{' + name + ' = ' + _format_value(value) + '}\n\n'
+            for name, value in db.strings.items() if COMMON_STRINGS.get(name) != value)
+    return ''.join(parts)
+
+
+def format_entries(entries):
+    """ bibtex string of the entries, sorted by key
+    """
+    return '\n'.join([format_entry(e) for e in sorted(entries, key=lambda e: e.get('ID', '').lower())])
+
+
+def format_bibtex(db):
+    """ same output as bibtexparser.dumps
+    """
+    return format_header(db) + format_entries(db.entries)
 
 
 # Parse / format bibtex file entry
@@ -63,10 +341,13 @@ def format_file(file_types):
     return ';'.join([_format_file(f) for f in file_types])
 
 
-def format_entries(entries):
-    db = bibtexparser.bibdatabase.BibDatabase()
-    db.entries.extend(entries)
-    return bibtexparser.dumps(db)
+def encode_entries_latex(entries):
+    """convert non-ascii characters of all fields (but ID, ENTRYTYPE, abstract) to latex, in place
+    """
+    for e in entries:
+        for k, value in e.items():
+            if k == k.lower() and k != 'abstract' and not is_ascii(value):
+                e[k] = encode_latex(value)
 
 # Parse name entry
 # ================
@@ -107,19 +388,111 @@ def strip_outmost_brackets(family):
     return family
 
 
+NAMES_CACHE_SIZE = 100000
+
+_VON = ['ben', 'van', 'der', 'de', 'la', 'le']
+_JR = ['jnr', 'jr', 'junior']
+
+
+def _lru_cache(maxsize):
+    """ bounded memoization of a one-argument function (functools.lru_cache is py3 only)
+    """
+    def decorator(func):
+        cache = collections.OrderedDict()
+
+        @functools.wraps(func)
+        def wrapper(arg):
+            try:
+                value = cache.pop(arg)
+            except KeyError:
+                value = func(arg)
+                if len(cache) >= maxsize:
+                    cache.popitem(last=False)
+            cache[arg] = value
+            return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+def _split_name(name):
+    """ split a name on spaces outside braces (as bibtexparser.customization.getnames)
+    """
+    if '{' not in name or '}' not in name:
+        return name.split()
+    try:
+        brackets = bibtexparser.customization.find_matching(name, '{', '}')
+    except IndexError:
+        raise ValueError('unbalanced braces in name: '+name)
+    words = []
+    start = i = 0
+    while True:
+        i = brackets[i] if i in brackets else i + 1
+        if i >= len(name):
+            break
+        if name[i] == ' ':
+            words.append(name[start:i])
+            start = i + 1
+        elif i == len(name) - 1:
+            words.append(name[start:])
+    return words
+
+
+def _parse_name(name):
+    """ (family, given, von, jr) of a single name, with the same (simple) rules
+    as bibtexparser.customization.getnames
+    """
+    if ',' in name:
+        family, given = name.split(',', 1)
+        family = family.strip()
+        firsts = given.split()
+    else:
+        words = _split_name(name)
+        family = words.pop()
+        firsts = [w.replace('.', '. ').strip() for w in words]
+    jr = ''
+    if family in _JR:
+        jr, family = family, firsts.pop()
+    von = []
+    for item in firsts:
+        if item in _VON:
+            von.insert(0, firsts.pop())
+    return family, ' '.join(firsts), ' '.join(von), jr
+
+
+@_lru_cache(NAMES_CACHE_SIZE)
+def parse_names(author):
+    """ tuple of (family, given, von, jr) for each name in the author field
+    """
+    names = []
+    for name in author.split(' and '):
+        name = strip_outmost_brackets(name).strip()
+        if name:
+            names.append(_parse_name(name))
+    return tuple(names)
+
+
+@_lru_cache(NAMES_CACHE_SIZE)
 def standard_name(author):
     names = []
-    for name in bibtexparser.customization.getnames([strip_outmost_brackets(nm) for nm in author.split(' and ')]):
-        family, given = name.split(',')
+    for family, given, von, jr in parse_names(author):
+        family = von + ' ' + family if von else family
+        if ',' in family or ',' in given:
+            raise ValueError('cannot format name: '+family+', '+given)
         family = strip_outmost_brackets(family.strip())
-        # given = strip_outmost_brackets(given.strip())
         names.append(', '.join([family.strip(), given.strip()]))
     return ' and '.join(names)
 
 
-def family_names(author_field):
+@_lru_cache(NAMES_CACHE_SIZE)
+def _family_names(author_field):
     authors = standard_name(author_field).split(' and ')
-    return [latex_to_unicode(nm.split(',')[0]) for nm in authors]
+    return tuple(latex_to_unicode(nm.split(',')[0]) for nm in authors)
+
+
+def family_names(author_field):
+    return list(_family_names(author_field))
 
 
 
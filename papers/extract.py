@@ -3,23 +3,34 @@ import os
 import json
 import six
 import subprocess as sp
-import six.moves.urllib.request
 import re
 import shutil
 import tempfile
+import time
 import uuid
-
-from crossref.restful import Works, Etiquette
-import bibtexparser
+import functools
+import threading
+import collections
 
 import papers
 from papers.config import cached
 from papers import logger
-from papers.encoding import family_names, latex_to_unicode
+from papers.cache import pdf_cache_get, pdf_cache_set
+from papers.encoding import family_names, latex_to_unicode, bibtexparser, format_entry
+
 
-my_etiquette = Etiquette('papers', papers.__version__,
-                         'https://github.com/rchg/papers',
-                         'r.checagarcia@gmail.com')
+my_etiquette = None
+
+def crossref_works():
+    """crossref Works client (crossref and requests are imported here: slow to import)
+    """
+    from crossref.restful import Works, Etiquette
+    global my_etiquette
+    if my_etiquette is None:
+        my_etiquette = Etiquette('papers', papers.__version__,
+                                 'https://github.com/rchg/papers',
+                                 'r.checagarcia@gmail.com')
+    return Works(etiquette=my_etiquette)
 
 
 class DOIParsingError(ValueError):
@@ -32,60 +43,279 @@ class DOIRequestError(ValueError):
 # PDF parsing / crossref requests
 # ===============================
 
-def readpdf(pdf, first=None, last=None):
+# external programs run (see pdfhead and benchmarks/bench_pdfhead.py)
+stats = collections.Counter()
+
+# title of the entry made up when the doi query fails
+PLACEHOLDER_TITLE = '-- check-entry --'
+
+
+def _split_pages(chunks):
+    """ pages of pdftotext output (each ends with a form feed), from chunks of bytes
+    """
+    rest = b''
+    for chunk in chunks:
+        pages = (rest + chunk).split(b'\f')
+        rest = pages.pop()
+        for page in pages:
+            yield page + b'\f'
+    if rest:
+        yield rest
+
+
+def iter_pdf_pages(pdf, first=None, last=None):
+    """ text of the pages of pdf, streamed from a single pdftotext process
 
+    The process is stopped if the iteration stops early.
+    """
     if not os.path.isfile(pdf):
         raise ValueError(repr(pdf) + ": not a file")
 
-    tmptxt = tempfile.mktemp(suffix='.txt')
-
     cmd = ['pdftotext']
     if first is not None: cmd.extend(['-f', str(first)])
     if last is not None: cmd.extend(['-l', str(last)])
-    cmd.extend([pdf, tmptxt])
+    cmd.extend([pdf, '-'])
+    logger.info(' '.join(cmd))
+    stats['subprocesses'] += 1
+    proc = sp.Popen(cmd, stdout=sp.PIPE)
+    complete = False
+    try:
+        chunks = iter(functools.partial(os.read, proc.stdout.fileno(), 65536), b'')
+        for page in _split_pages(chunks):
+            yield page.decode('utf-8', 'replace')
+        complete = True
+    finally:
+        if not complete and proc.poll() is None:
+            proc.kill()
+        proc.stdout.close()
+        status = proc.wait()
+    if status:
+        raise sp.CalledProcessError(status, cmd)
+
+
+class PdfBackend(object):
+    """ pdf text extraction backend: text of the pages, each ending with a form feed
+    """
+    name = None
+    module = None  # python module required by the backend
+
+    def available(self):
+        if self.module is None:
+            return True
+        try:
+            __import__(self.module)
+        except ImportError:
+            return False
+        return True
+
+    def iter_pages(self, pdf, first=None, last=None):
+        """ generator of page texts (first and last pages included, 1-based):
+        subclasses must override it
+        """
+        raise NotImplementedError()
+
+
+class PopplerBackend(PdfBackend):
+    """ pdftotext command (poppler-utils), one process per pdf
+    """
+    name = 'poppler'
+
+    def iter_pages(self, pdf, first=None, last=None):
+        return iter_pdf_pages(pdf, first, last)
+
+
+class PypdfBackend(PdfBackend):
+    """ pypdf, in-process
+    """
+    name = 'pypdf'
+    module = 'pypdf'
+
+    def iter_pages(self, pdf, first=None, last=None):
+        from pypdf import PdfReader
+        if not os.path.isfile(pdf):
+            raise ValueError(repr(pdf) + ": not a file")
+        reader = PdfReader(pdf)
+        for page in reader.pages[(first or 1)-1:last]:
+            yield (page.extract_text() or '') + '\f'
+
+
+class PdfminerBackend(PdfBackend):
+    """ pdfminer.six, in-process (slower than pypdf, closer to pdftotext layout)
+    """
+    name = 'pdfminer'
+    module = 'pdfminer'
+
+    def iter_pages(self, pdf, first=None, last=None):
+        from pdfminer.converter import TextConverter
+        from pdfminer.layout import LAParams
+        from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+        from pdfminer.pdfpage import PDFPage
+        if not os.path.isfile(pdf):
+            raise ValueError(repr(pdf) + ": not a file")
+        manager = PDFResourceManager()
+        with open(pdf, 'rb') as f:
+            for i, page in enumerate(PDFPage.get_pages(f), 1):
+                if first is not None and i < first:
+                    continue
+                if last is not None and i > last:
+                    break
+                out = six.StringIO()
+                device = TextConverter(manager, out, laparams=LAParams())
+                PDFPageInterpreter(manager, device).process_page(page)
+                device.close()
+                yield out.getvalue()  # ends with a form feed
+
+
+PDF_BACKENDS = collections.OrderedDict((b.name, b) for b in [PopplerBackend(), PypdfBackend(), PdfminerBackend()])
+
+
+def pdf_backend(name=None):
+    """ pdf text backend by name (default: config.pdf_backend)
+
+    'auto' is the first in-process backend installed, or poppler.
+    """
+    from papers.config import config
+    name = name or config.pdf_backend
+    if name == 'auto':
+        installed = [b for b in PDF_BACKENDS.values() if b.module and b.available()]
+        return installed[0] if installed else PDF_BACKENDS['poppler']
+    if name not in PDF_BACKENDS:
+        raise ValueError('unknown pdf backend: {} (choose among: {})'.format(name, ', '.join(list(PDF_BACKENDS)+['auto'])))
+    backend = PDF_BACKENDS[name]
+    if not backend.available():
+        raise ValueError('pdf backend {}: python package {} is not installed'.format(name, backend.module))
+    return backend
+
+
+def readpdf(pdf, first=None, last=None, backend=None):
+    return ''.join(pdf_backend(backend).iter_pages(pdf, first, last))
+
+
+# OCR of scanned pdfs (pdftoppm and tesseract)
+
+# fewer words in the text layer: the pdf header is read with OCR instead (0: never)
+OCR_MINWORDS = 30
+
+
+def pdf_page_count(pdf):
+    cmd = ['pdfinfo', pdf]
     logger.info(' '.join(cmd))
-    sp.check_call(cmd)
+    stats['subprocesses'] += 1
+    match = re.search(br'^Pages:\s*(\d+)', sp.check_output(cmd), re.M)
+    if not match:
+        raise ValueError(repr(pdf) + ": unknown number of pages")
+    return int(match.group(1))
 
-    txt = open(tmptxt).read()
-    os.remove(tmptxt)
 
+class OCRStopped(Exception):
+    pass
+
+
+class _OcrJob(object):
+    """ OCR of a pdf in progress: private temporary directory, and external
+    programs running, killed on stop
+    """
+    def __init__(self):
+        self.tmpdir = tempfile.mkdtemp(prefix='papers-ocr-')
+        self.procs = set()
+        self.lock = threading.Lock()
+        self.stopped = False
+
+    def call(self, cmd, **kw):
+        logger.info(' '.join(cmd))
+        with self.lock:
+            if self.stopped:
+                raise OCRStopped(' '.join(cmd))
+            stats['subprocesses'] += 1
+            proc = sp.Popen(cmd, **kw)
+            self.procs.add(proc)
+        try:
+            status = proc.wait()
+        finally:
+            with self.lock:
+                self.procs.discard(proc)
+        if status:
+            raise sp.CalledProcessError(status, cmd)
+
+    def stop(self):
+        with self.lock:
+            self.stopped = True
+            for proc in self.procs:
+                proc.kill()
+
+
+def _ocr_page(pdf, page, job):
+    """ rasterize one page and read it with tesseract
+    """
+    base = os.path.join(job.tmpdir, str(page))
+
+    job.call(['pdftoppm', '-singlefile', '-png', '-q', '-f', str(page), '-l', str(page), pdf, base])
+
+    # pages are read in parallel already: one thread per tesseract process
+    job.call(["tesseract", base+'.png', base, "-l", "eng", "quiet"], env=dict(os.environ, OMP_THREAD_LIMIT='1'))
+
+    with open(base+'.txt') as f:
+        txt = f.read()
+    os.remove(base+'.png')
+    os.remove(base+'.txt')
     return txt
 
 
-def readpdf_image(pdf, first=None, last=None):
+def iter_ocr_pages(pdf, pages, jobs=None):
+    """ OCR text of the pages of pdf (page numbers), in order
+
+    jobs: pages rasterized and read concurrently (default: number of cpus).
+    One page is read first, then more pages at a time (up to jobs) as long as
+    the iteration goes on. When it stops, the pages in progress are killed
+    before the temporary directory is removed.
+    """
+    from multiprocessing import cpu_count
+    from multiprocessing.pool import ThreadPool
+    from papers.parallel import ordered_map
 
     if not os.path.isfile(pdf):
         raise ValueError(repr(pdf) + ": not a file")
 
-    tmpbase = tempfile.mktemp()
-    tmppng = tmpbase + '.png'
-    tmptxt = tmpbase + '.txt'
+    jobs = jobs or cpu_count()
+    job = _OcrJob()
+    pool = ThreadPool(jobs)
+    try:
+        for txt in ordered_map(pool, functools.partial(_ocr_page, pdf, job=job), pages, jobs, start=1):
+            yield txt
+    finally:
+        job.stop()
+        pool.close()
+        pool.join()
+        shutil.rmtree(job.tmpdir, ignore_errors=True)
 
-    # 1st create a .png image from the uniq pdf file
-    cmd = ['pdftoppm', '-singlefile', '-png', '-q']
-    if first is not None: cmd.extend(['-f', str(first)])
-    if last is not None: cmd.extend(['-l', str(last)])
-    cmd.extend([pdf, tmpbase])
-    logger.info(' '.join(cmd))
-    # print(' '.join(cmd))
-    sp.check_call(cmd)
 
-    # 2nd extract text from .png using tesseract
-    cmd = ["tesseract", tmppng, tmpbase, "-l", "eng", "quiet"]
-    logger.info(' '.join(cmd))
-    # print(' '.join(cmd))
-    sp.check_call(cmd)
+def readpdf_image(pdf, first=None, last=None, jobs=None):
+    if last is None:
+        last = pdf_page_count(pdf)
+    return ''.join(iter_ocr_pages(pdf, range(first or 1, last+1), jobs))
 
-    txt = open(tmptxt).read()
 
-    os.remove(tmptxt)
-    os.remove(tmppng)
+def _ocr_head(pdf, maxpages, minwords, jobs, npages=None):
+    """ (text, pages read) of the first pages, until minwords words are read
+    """
+    if npages is None:
+        npages = pdf_page_count(pdf)
+    i = 0
+    txt = ''
+    pages = iter_ocr_pages(pdf, range(1, min(npages, maxpages)+1), jobs)
+    try:
+        for i, page in enumerate(pages, 1):
+            txt += page
+            if len(txt.split()) >= minwords:
+                break
+    finally:
+        pages.close()
+    return txt, i
 
-    return txt
 
 REGEXP = re.compile(r'[doi,doi.org/][\s\.\:]{0,2}(10\.\d{4}[\d\:\.\-\/a-z]+)[A-Z\s,\n]')
 
-def parse_doi(txt):
+def parse_doi(txt, interactive=True):
     # based on: https://doeidoei.wordpress.com/2009/10/22/regular-expression-to-match-a-doi-digital-object-identifier/
     # doi = r'[doi|DOI][\s\.\:]{0,2}(10\.\d{4}[\d\:\.\-\/a-z]+)[A-Z\s]'
 
@@ -101,6 +331,8 @@ def parse_doi(txt):
 
     # print("Parse doi")
     if not matches:
+        if not interactive:
+            raise DOIParsingError('parse_doi::no matches')
         print(             "     ** Problem to find DOI in text of input file.")
         custom_doi = input("     >>  please enter the DOI  (N to avoid) :")
         if custom_doi=="N" or custom_doi=="n" or len(custom_doi)<=2:
@@ -120,6 +352,8 @@ def parse_doi(txt):
 
     # quality check 
     if len(doi) <= 10:
+        if not interactive:
+            raise DOIParsingError('failed to extract doi: '+doi)
         print(             "     ** Problem to find DOI in text of input file.")
         custom_doi = input("     >> please enter the DOI (N to avoid) :")
         if custom_doi=="N" or custom_doi=="n" or len(custom_doi)<=2:
@@ -138,23 +372,69 @@ def isvaliddoi(doi):
     return doi.lower() == doi2.lower()
 
 
-def pdfhead(pdf, maxpages=12, minwords=300, image=False):
-    """ read pdf header
+def _pdfhead_key(maxpages, minwords, image, backend):
+    return maxpages, minwords, image, None if image else pdf_backend(backend).name
+
+
+def pdfhead(pdf, maxpages=12, minwords=300, image=False, backend=None, cache=True, ocr_jobs=None):
+    """ read pdf header: the first pages, until minwords words are read
+
+    image: read with OCR (otherwise, only if the text layer has less than OCR_MINWORDS words)
+    cache: reuse the text read earlier from a file with the same content (see papers.cache)
+    ocr_jobs: pages read concurrently with OCR (default: number of cpus)
     """
+    key = _pdfhead_key(maxpages, minwords, image, backend)
+    if cache and os.path.isfile(pdf):
+        txt = pdf_cache_get(pdf, 'text', key)
+        if txt is not None:
+            stats['cached'] += 1
+            logger.debug('pdfhead: from cache')
+            return txt
+
+    start, subprocesses = time.time(), stats['subprocesses']
     i = 0
     txt = ''
-    while len(txt.strip().split()) < minwords and i < maxpages:
-        i += 1
-        logger.debug('read pdf page: '+str(i))
-        if image:
-            txt += readpdf_image(pdf, first=i, last=i)
-        else:
-            txt += readpdf(pdf, first=i, last=i)
+    if image:
+        txt, i = _ocr_head(pdf, maxpages, minwords, ocr_jobs)
+    elif maxpages > 0:
+        pages = pdf_backend(backend).iter_pages(pdf, last=maxpages)
+        npages = None
+        try:
+            for i, page in enumerate(pages, 1):
+                txt += page
+                if len(txt.split()) >= minwords:
+                    break
+            else:
+                npages = i or None  # all pages read (up to maxpages)
+        finally:
+            pages.close()
+
+        if len(txt.split()) < OCR_MINWORDS:
+            # scanned pdf?
+            logger.info('{}: {} word(s) in the text layer, read with OCR'.format(pdf, len(txt.split())))
+            try:
+                txt, i = _ocr_head(pdf, maxpages, minwords, ocr_jobs, npages=npages)
+                stats['ocr'] += 1
+            except (OSError, ValueError, sp.CalledProcessError) as error:
+                logger.warn('{}: OCR failed (pdftoppm and tesseract installed?): {}'.format(pdf, error))
+                cache = False  # maybe next time
+
+    stats['pdfs'] += 1
+    stats['seconds'] += time.time() - start
+    logger.debug('pdfhead: {} page(s), {} subprocess(es), {:.0f} ms'.format(
+        i, stats['subprocesses'] - subprocesses, (time.time() - start)*1000))
+    if cache:
+        pdf_cache_set(pdf, 'text', key, txt)
     return txt
 
 
-def extract_pdf_doi(pdf, image=False):
-    return parse_doi(pdfhead(pdf, image=image))
+def extract_pdf_doi(pdf, image=False, backend=None):
+    key = _pdfhead_key(12, 300, image, backend)
+    doi = pdf_cache_get(pdf, 'doi', key) if os.path.isfile(pdf) else None
+    if doi is None:
+        doi = parse_doi(pdfhead(pdf, image=image, backend=backend))
+        pdf_cache_set(pdf, 'doi', key, doi)
+    return doi
 
 
 def query_text(txt, max_query_words=300):
@@ -177,8 +457,10 @@ def query_text(txt, max_query_words=300):
     return query_txt
 
 
-def extract_txt_metadata(txt, search_doi=True, search_fulltext=False, max_query_words=200, scholar=False):
+def extract_txt_metadata(txt, search_doi=True, search_fulltext=False, max_query_words=200, scholar=False, interactive=True):
     """extract metadata from text, by parsing and doi-query, or by fulltext query in google scholar
+
+    interactive: ask the user for the doi if none is found in the text
     """
     assert search_doi or search_fulltext, 'no search criteria specified for metadata'
 
@@ -187,7 +469,7 @@ def extract_txt_metadata(txt, search_doi=True, search_fulltext=False, max_query_
     if search_doi:
         try:
             logger.debug('parse doi')
-            doi = parse_doi(txt)
+            doi = parse_doi(txt, interactive)
             logger.info('found doi:'+doi)
             print(" -- Found DOI    ", doi)
             logger.debug('query bibtex by doi')
@@ -198,9 +480,9 @@ def extract_txt_metadata(txt, search_doi=True, search_fulltext=False, max_query_
                 return '''@misc{{{doi},
                 doi = {{{doi}}},
                 author = {{{author}}},
-                title = "-- check-entry --",
+                title = "{title}",
                 url = {{http://dx.doi.org/{doi}}},
-                }}'''.format(doi=doi, author=str(uuid.uuid4())[0:10])
+                }}'''.format(doi=doi, author=str(uuid.uuid4())[0:10], title=PLACEHOLDER_TITLE)
 
             logger.debug('doi query successful')
 
@@ -232,16 +514,38 @@ def extract_txt_metadata(txt, search_doi=True, search_fulltext=False, max_query_
     return bibtex
 
 
-def extract_pdf_metadata(pdf, search_doi=True, search_fulltext=True, maxpages=12, minwords=300, image=False, **kw):
-    txt = pdfhead(pdf, maxpages, minwords, image=image)
-    return extract_txt_metadata(txt, search_doi, search_fulltext, **kw)
+def _is_placeholder(bibtex):
+    """ entry made up by extract_txt_metadata when the doi query failed
+    """
+    entries = bibtexparser.loads(bibtex).entries
+    return not entries or entries[0].get('title', PLACEHOLDER_TITLE) == PLACEHOLDER_TITLE
+
+
+def extract_pdf_metadata(pdf, search_doi=True, search_fulltext=True, maxpages=12, minwords=300, image=False,
+    backend=None, txt=None, **kw):
+    """ txt: header text if already read (see pdfhead)
+
+    The metadata is saved for files with the same content, unless the query failed.
+    """
+    key = (search_doi, search_fulltext) + _pdfhead_key(maxpages, minwords, image, backend) + tuple(
+        sorted((k, v) for k, v in kw.items() if k != 'interactive'))
+    bibtex = pdf_cache_get(pdf, 'metadata', key) if os.path.isfile(pdf) else None
+    if bibtex is not None:
+        logger.debug('pdf metadata: from cache')
+        return bibtex
+    if txt is None:
+        txt = pdfhead(pdf, maxpages, minwords, image=image, backend=backend)
+    bibtex = extract_txt_metadata(txt, search_doi, search_fulltext, **kw)
+    if not _is_placeholder(bibtex):
+        pdf_cache_set(pdf, 'metadata', key, bibtex)
+    return bibtex
 
 
 
 @cached('crossref-bibtex.json')
 def fetch_bibtex_by_doi(doi):
     url = "http://api.crossref.org/works/"+doi+"/transform/application/x-bibtex"
-    work = Works(etiquette=my_etiquette)
+    work = crossref_works()
     response = work.do_http_request('get', url, custom_header=str(work.etiquette))
     if response.ok:
         bibtex = response.text.strip()
@@ -252,7 +556,7 @@ def fetch_bibtex_by_doi(doi):
 @cached('crossref.json')
 def fetch_json_by_doi(doi):
     url = "http://api.crossref.org/works/"+doi+"/transform/application/json"
-    work = Works(etiquette=my_etiquette)
+    work = crossref_works()
     jsontxt = work.do_http_request('get', url, custom_header=str(work.etiquette)).text
     return jsontxt.dumps(json)
 
@@ -363,14 +667,12 @@ def crossref_to_bibtex(r):
         # ID = str(''.join([c if ord(c) < 128 else '_' for c in ID]))  # make sure the resulting string is ASCII
     bib['ID'] = ID
 
-    db = bibtexparser.bibdatabase.BibDatabase()
-    db.entries.append(bib)
-    return bibtexparser.dumps(db)
+    return format_entry(bib)
 
 
 # @cached('crossref-bibtex-fulltext.json', hashed_key=True)
 def fetch_bibtex_by_fulltext_crossref(txt, **kw):
-    work = Works(etiquette=my_etiquette)
+    work = crossref_works()
     logger.debug(six.u('crossref fulltext seach:\n')+six.u(txt))
 
     # get the most likely match of the first results
@@ -0,0 +1,81 @@
+"""papers add --recursive --jobs N: add a directory of pdfs in parallel
+
+Files go through three stages, each with a bounded number of files in flight:
+
+1. pdf header text (pdftotext or another pdf backend, OCR for scanned pdfs):
+   pool of N processes
+2. metadata lookup (crossref or google scholar): at most MAX_LOOKUPS threads
+3. insertion into the library: the calling thread, in scan order
+
+Keys, conflicts and renaming are resolved by the last stage only, so the
+library does not depend on the order in which pdfs complete. The user is
+never asked for a missing doi (see parse_doi): such pdfs fall back to a
+fulltext search, or are skipped with a warning. Unchanged pdfs added before
+are read from the pdf cache (see papers.cache).
+"""
+import functools
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+
+from papers import logger
+import papers.config
+from papers.extract import pdfhead, extract_pdf_metadata
+from papers.parallel import ordered_map
+
+MAX_LOOKUPS = 4  # concurrent requests to crossref
+
+
+def read_header(file, backend=None):
+    """ stage 1, in a worker process: (kind, path) -> (kind, path, text, error)
+    """
+    kind, path = file
+    if kind != 'pdf':
+        return kind, path, None, None
+    try:
+        return kind, path, pdfhead(path, backend=backend, ocr_jobs=1), None  # one process per cpu already
+    except Exception as error:
+        return kind, path, None, str(error)
+
+
+def lookup_metadata(task, **kw):
+    """ stage 2, in a thread: (kind, path, text, error) -> (kind, path, bibtex, error)
+    """
+    kind, path, txt, error = task
+    if kind != 'pdf' or error:
+        return task
+    try:
+        return kind, path, extract_pdf_metadata(path, txt=txt, interactive=False, **kw), None
+    except Exception as error:
+        return kind, path, None, str(error)
+
+
+def ingest(my, files, search_doi=True, search_fulltext=True, jobs=2, scholar=False, **kw):
+    """ add files [(kind, path)] to the library my (see scan_files and Biblio.scan_dir)
+    """
+    window = 2*jobs
+    backend = papers.config.config.pdf_backend
+    processes = multiprocessing.Pool(jobs)
+    threads = ThreadPool(min(jobs, MAX_LOOKUPS))
+    try:
+        tasks = ordered_map(processes, functools.partial(read_header, backend=backend), files, window)
+        tasks = ordered_map(threads, functools.partial(lookup_metadata, backend=backend,
+            search_doi=search_doi, search_fulltext=search_fulltext, scholar=scholar), tasks, window)
+
+        for kind, path, bibtex, error in tasks:
+            try:
+                if error:
+                    raise ValueError(error)
+                if kind == 'pdf':
+                    logger.info('add '+path)
+                    my.insert_pdf(path, bibtex, **kw)
+                elif kind == 'bib':
+                    my.add_bibtex_file(path, **kw)
+                else:
+                    logger.debug('read from hidden bibtex')
+                    my.insert_entry_dir(path, **kw)
+            except Exception as error:
+                logger.warn(path+'::'+str(error))
+                continue
+    finally:
+        processes.terminate()
+        threads.terminate()
@@ -0,0 +1,137 @@
+"""Near-duplicate titles: MinHash signatures of title shingles, LSH buckets
+
+Titles are normalized (latex to unicode, ascii, lower case, punctuation
+removed) and cut into character shingles. Entries whose signatures share an
+LSH band are candidates, confirmed by the Jaccard similarity of their shingles.
+
+Signatures are persisted in the cache directory, keyed by normalized title,
+so that only new or modified titles are hashed on the next run.
+"""
+import os
+import re
+import zlib
+import itertools
+
+from papers import logger
+from papers.latexenc import latex_to_unicode
+from papers.encoding import unicode_to_ascii
+from papers.cache import cache_file, dump_pickle, load_pickle
+import papers.config
+
+LSH_VERSION = 1
+NUM_PERM = 64
+BANDS = 16  # 4 rows per band: pairs with Jaccard 0.5 are candidates with ~65% chance
+SHINGLE = 3
+THRESHOLD = 0.6
+
+_PRIME = (1 << 31) - 1
+
+
+def lsh_file(bibtex):
+    return cache_file(bibtex, '.lsh')
+
+
+def normalize_title(title):
+    title = unicode_to_ascii(latex_to_unicode(title)).lower()
+    return ' '.join(re.findall(r'[a-z0-9]+', title))
+
+
+def shingles(norm, k=SHINGLE):
+    if len(norm) <= k:
+        return {norm}
+    return {norm[i:i+k] for i in range(len(norm)-k+1)}
+
+
+def jaccard(s1, s2):
+    return len(s1 & s2) / float(len(s1 | s2))
+
+
+class TitleIndex(object):
+    """MinHash signatures of normalized titles
+    """
+    def __init__(self, signatures=None):
+        import numpy as np
+        rng = np.random.RandomState(LSH_VERSION)
+        self._a = rng.randint(1, _PRIME, NUM_PERM).astype(np.uint64)[:, None]
+        self._b = rng.randint(0, _PRIME, NUM_PERM).astype(np.uint64)[:, None]
+        self.signatures = signatures or {}
+        self.modified = False
+
+    @classmethod
+    def load(cls, bibtex):
+        state = load_pickle(lsh_file(bibtex))
+        if not state or state.get('version') != LSH_VERSION:
+            return cls()
+        return cls(state['signatures'])
+
+    def save(self, bibtex):
+        if papers.config.DRYRUN or not self.modified:
+            return
+        try:
+            dump_pickle({'version': LSH_VERSION, 'signatures': self.signatures}, lsh_file(bibtex), defer=True)
+        except (IOError, OSError) as error:
+            logger.warn('failed to write title index: '+str(error))
+
+    def signature(self, norm):
+        sig = self.signatures.get(norm)
+        if sig is None:
+            import numpy as np
+            h = np.array([zlib.crc32(s.encode('utf-8')) & 0xffffffff for s in shingles(norm)], dtype=np.uint64)
+            sig = ((self._a * (h % _PRIME) + self._b) % _PRIME).min(axis=1).astype(np.uint32).tobytes()
+            self.signatures[norm] = sig
+            self.modified = True
+        return sig
+
+    def update(self, titles, prune=False):
+        """compute missing signatures (and forget titles no longer present if prune)
+        """
+        titles = set(titles)
+        if prune:
+            for norm in list(self.signatures):
+                if norm not in titles:
+                    del self.signatures[norm]
+                    self.modified = True
+        for norm in titles:
+            self.signature(norm)
+
+    def pairs(self, titles, threshold=THRESHOLD, prune=False):
+        """(i, j) index pairs (i > j) of near-duplicate normalized titles
+        """
+        self.update([t for t in titles if t], prune=prune)
+        width = 4*NUM_PERM // BANDS  # uint32
+        buckets = {}
+        for i, norm in enumerate(titles):
+            if not norm:
+                continue
+            sig = self.signature(norm)
+            for band in range(BANDS):
+                buckets.setdefault((band, sig[band*width:(band+1)*width]), []).append(i)
+
+        candidates = set()
+        for members in buckets.values():
+            candidates.update(itertools.combinations(members, 2))
+
+        cache = {}
+        def shingles_(i):
+            if i not in cache:
+                cache[i] = shingles(titles[i])
+            return cache[i]
+
+        for j, i in sorted(candidates):
+            if titles[i] == titles[j] or jaccard(shingles_(i), shingles_(j)) >= threshold:
+                yield i, j
+
+
+def near_duplicate_pairs(entries, bibtex=None, threshold=THRESHOLD, prune=False):
+    """index pairs of entries with near-duplicate titles
+
+    bibtex: library file, to reuse and update the signatures in the cache directory
+    prune: entries is the whole library: forget other titles
+    """
+    index = TitleIndex.load(bibtex) if bibtex else TitleIndex()
+    titles = [normalize_title(e.get('title', '')) for e in entries]
+    pairs = list(index.pairs(titles, threshold, prune))
+    if bibtex:
+        index.save(bibtex)
+    logger.debug('{} near-duplicate title pairs'.format(len(pairs)))
+    return pairs
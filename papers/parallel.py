@@ -0,0 +1,22 @@
+"""helpers to run tasks concurrently (see papers.ingest and the OCR in papers.extract)
+"""
+import collections
+
+
+def ordered_map(pool, func, items, window, start=None):
+    """ like pool.imap, with at most `window` items in flight
+
+    (pool.imap reads all items at once: the whole directory would be in memory)
+
+    start: initial number of items in flight, doubled (up to window) each time
+        a result is used, for consumers that often stop after the first results
+    """
+    size = start or window
+    pending = collections.deque()
+    for item in items:
+        pending.append(pool.apply_async(func, (item,)))
+        if len(pending) >= size:
+            yield pending.popleft().get()
+            size = min(2*size, window)
+    while pending:
+        yield pending.popleft().get()
@@ -20,7 +20,12 @@ def cli_parser(config, settings):
     egrp.add_argument('--warn' , action='store_const', dest='logging_level', const=logging.WARN)
     egrp.add_argument('--error', action='store_const', dest='logging_level', const=logging.ERROR)
 
-    cfg = argparse.ArgumentParser(add_help=False, parents=[loggingp])
+    pdfp     = argparse.ArgumentParser(add_help=False)
+    grp      = pdfp.add_argument_group('pdf parsing')
+    grp.add_argument('--pdf-backend', default=config.pdf_backend, choices=['poppler', 'pypdf', 'pdfminer', 'auto'],
+        help='pdf text extraction: pdftotext command or in-process python package (default: %(default)s)')
+
+    cfg = argparse.ArgumentParser(add_help=False, parents=[loggingp, pdfp])
     grp = cfg.add_argument_group('config')
     grp.add_argument('--filesdir', default=config.filesdir, help='files directory (default: %(default)s)')
     grp.add_argument('--bibtex'  , default=config.bibtex,   help='bibtex database (default: %(default)s)')
@@ -94,6 +99,9 @@ def cli_parser(config, settings):
         of .pdf files (bibtex files are ignored in this mode')
     grp.add_argument('--ignore-errors', action='store_true', 
         help='ignore errors when adding multiple files')
+    grp.add_argument('-j', '--jobs', type=int, default=1, metavar='N',
+        help='parse pdfs and fetch their metadata in parallel, with N processes \
+        (with --recursive; the doi is not asked when missing) (default: %(default)s)')
 
     grp = addp.add_argument_group('pdf metadata')
     grp.add_argument('--no-query-doi'     , action='store_true', help='do not attempt to parse and query doi')
@@ -136,6 +144,7 @@ def cli_parser(config, settings):
 
     grp = checkp.add_argument_group('merge/conflict')
     grp.add_argument('--duplicates',action='store_true', help='solve duplicates')
+    grp.add_argument('--duplicates-near',action='store_true', help='solve duplicates, including near-duplicate titles')
     grp.add_argument('-m', '--mode', default='i', choices=list('ims'), help='''(i)interactive mode by default, otherwise (m)erge or (s)kip failed''')
     # grp.add_argument('--ignore', action='store_true', help='ignore unresolved conflicts')
     # checkp.add_argument('--merge-keys', nargs='+', help='only merge remove / merge duplicates')
@@ -205,6 +214,7 @@ def cli_parser(config, settings):
     grp.add_argument('--duplicates-doi' , action='store_true', help='list doi duplicates only')
     grp.add_argument('--duplicates-tit' , action='store_true', help='list tit duplicates only')
     grp.add_argument('--duplicates'     , action='store_true', help='list all duplicates (see --similarity)')
+    grp.add_argument('--duplicates-near', action='store_true', help='list near-duplicate titles (punctuation, latex, subtitles)')
     grp.add_argument('--has-file'       , action='store_true')
     grp.add_argument('--no-file'        , action='store_true')
     grp.add_argument('--broken-file'    , action='store_true')
@@ -227,9 +237,9 @@ def cli_parser(config, settings):
     # doi
     # ===
 
-    doip = subparsers.add_parser('doi', description='parse DOI from PDF')
+    doip = subparsers.add_parser('doi', description='parse DOI from PDF', parents=[pdfp])
     doip.add_argument('pdf')
-    doip.add_argument('--image', action='store_true', help='convert to image and use tesseract instead of pdftotext')
+    doip.add_argument('--image', action='store_true', help='convert to image and use tesseract instead of pdftotext (automatic for pdfs without text)')
     
     # fetch
     # =====   
@@ -238,12 +248,12 @@ def cli_parser(config, settings):
 
     # extract
     # ========
-    extractp = subparsers.add_parser('extract', description='extract pdf metadata', parents=[loggingp])
+    extractp = subparsers.add_parser('extract', description='extract pdf metadata', parents=[loggingp, pdfp])
     extractp.add_argument('pdf')
     extractp.add_argument('-n', '--word-count', type=int, default=200)
     extractp.add_argument('--fulltext', action='store_true', help='fulltext only (otherwise DOI-based)')
     extractp.add_argument('--scholar' , action='store_true', help='use google scholar instead of default crossref for fulltext search')
-    extractp.add_argument('--image'   , action='store_true', help='convert to image and use tesseract instead of pdftotext')
+    extractp.add_argument('--image'   , action='store_true', help='convert to image and use tesseract instead of pdftotext (automatic for pdfs without text)')
 
     # *** Pure OS related file checks ***
 
@@ -251,6 +261,18 @@ def cli_parser(config, settings):
     # ====
     undop = subparsers.add_parser('undo', parents=[cfg])
 
+    # batch
+    # =====
+    batchp = subparsers.add_parser('batch', description='run commands (one per line) against libraries loaded once, '
+        'saved once at the end (nothing is saved if a command fails)', parents=[loggingp])
+    batchp.add_argument('file', nargs='?', default='-', help='commands file (default: stdin)')
+
+    # serve
+    # =====
+    servep = subparsers.add_parser('serve', description='keep the library in memory in a background process: '
+        'list and open commands are then answered by it (unix socket in the cache directory)', parents=[cfg])
+    servep.add_argument('--stop', action='store_true', help='stop the running server')
+
     # git
     # ===
     gitp = subparsers.add_parser('git', description='git subcommand')
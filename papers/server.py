@@ -0,0 +1,239 @@
+"""papers serve: keep libraries loaded in a background process
+
+The server listens on a unix socket in the cache directory. The CLI sends
+it read-only commands (list, open) along with the working directory, and
+prints back their output. When no server answers, the command runs
+in-process as usual.
+
+Libraries are loaded once and kept in memory with their indexes; a library
+is reloaded when its file changes on disk (size or modification time, and
+content if modified shortly before it was loaded, as for snapshots).
+"""
+from __future__ import print_function
+import os
+import sys
+import json
+import socket
+import time
+import logging
+import contextlib
+import traceback
+import six
+
+from papers import logger
+import papers.config
+
+DELEGATED = ('list', 'open')
+TIMEOUT = 60
+
+
+def socket_file():
+    return os.path.join(papers.config.config.cache, 'serve.sock')
+
+
+def readonly(o):
+    """command that can be answered by the server (no change, no prompt)
+    """
+    if o.cmd == 'open':
+        return True
+    if o.cmd == 'list':
+        return not (o.edit or o.fetch or o.delete or o.review_required)
+    return False
+
+
+class LibraryCache(object):
+    """loaded libraries, by path (see Biblio.load)
+    """
+    def __init__(self):
+        self.libraries = {}
+
+    def load(self, cls, bibtex, filesdir, snapshot=True):
+        from papers.cache import file_stamp, RACY_DELAY
+        path = os.path.realpath(bibtex)
+        loaded = self.libraries.get(path)
+        if loaded is None or not self.unchanged(loaded, bibtex):
+            logger.info(('reload ' if loaded else 'load ')+bibtex)
+            stamp, now = file_stamp(bibtex), time.time()
+            digest = papers.config.checksum(bibtex) if stamp[1] > now - RACY_DELAY else None
+            loaded = self.libraries[path] = [stamp, now, digest, cls._load(bibtex, filesdir, snapshot)]
+        my = loaded[3]
+        my.filesdir = filesdir
+        return my
+
+    def unchanged(self, loaded, bibtex):
+        """same test as papers.cache.read_snapshot: a file modified less than
+        RACY_DELAY seconds before it was loaded is compared by content
+        """
+        from papers.cache import file_stamp, RACY_DELAY
+        stamp, loadtime, digest, _ = loaded
+        if file_stamp(bibtex) != stamp:
+            return False
+        if stamp[1] > loadtime - RACY_DELAY:
+            now = time.time()
+            if papers.config.checksum(bibtex) != digest:
+                return False
+            loaded[1] = now  # same content: no check once the delay has passed
+        return True
+
+    def defer_save(self, my, bibtex):
+        return False  # only read-only commands are served
+
+
+# client
+# ======
+
+def _send(message, path=None, timeout=TIMEOUT):
+    """send a json message to the server and return its answer (or None if no server)
+    """
+    path = path or socket_file()
+    if not hasattr(socket, 'AF_UNIX') or not os.path.exists(path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(path)
+        sock.sendall(json.dumps(message).encode('utf-8'))
+        sock.shutdown(socket.SHUT_WR)
+        return json.loads(_recvall(sock).decode('utf-8'))
+    except (socket.error, socket.timeout, ValueError) as error:
+        logger.debug('papers serve: no answer: '+str(error))
+        return None
+    finally:
+        sock.close()
+
+
+def _recvall(sock):
+    chunks = []
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            return b''.join(chunks)
+        chunks.append(chunk)
+
+
+def delegate(argv, path=None):
+    """run a papers command in the server: exit status, or None if not done
+    """
+    if not argv or argv[0] not in DELEGATED:
+        return None
+    answer = _send({'argv': list(argv), 'cwd': os.getcwd()}, path)
+    if not answer or answer.get('status') is None:
+        return None
+    sys.stdout.write(answer['stdout'])
+    sys.stderr.write(answer['stderr'])
+    return answer['status']
+
+
+def stop(path=None):
+    """stop the running server (False if none)
+    """
+    return _send({'stop': True}, path) is not None
+
+
+# server
+# ======
+
+@contextlib.contextmanager
+def _captured():
+    """redirect stdout, stderr and logging output to strings
+    """
+    out, err = six.StringIO(), six.StringIO()
+    handlers = [h for h in logging.getLogger().handlers if isinstance(h, logging.StreamHandler)]
+    streams = [h.stream for h in handlers]
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = out, err
+    for h in handlers:
+        h.stream = err
+    try:
+        yield out, err
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+        for h, stream in zip(handlers, streams):
+            h.stream = stream
+
+
+def _run(argv):
+    """run a command as papers.bib.main would: (exit status, stdout, stderr)
+    status is None if the command must run in the client
+    """
+    import papers.bib
+    with _captured() as (out, err):
+        try:
+            if not readonly(papers.bib.parse_args(argv)):
+                return None, '', ''
+            papers.bib.main(argv)
+            status = 0
+        except SystemExit as error:
+            status = error.code if isinstance(error.code, int) else (0 if error.code is None else 1)
+        except Exception:
+            traceback.print_exc()
+            status = 1
+    return status, out.getvalue(), err.getvalue()
+
+
+def handle(conn):
+    """answer one request: returns False to stop the server
+    """
+    message = json.loads(_recvall(conn).decode('utf-8'))
+    if message.get('stop'):
+        conn.sendall(json.dumps({'status': 0}).encode('utf-8'))
+        return False
+
+    config = papers.config.config
+    state = dict(config.__dict__), logger.level, papers.config.DRYRUN, os.getcwd()
+    try:
+        logger.setLevel(logging.NOTSET)  # as in a new process
+        os.chdir(message['cwd'])
+        status, out, err = _run(message['argv'])
+    finally:
+        config.__dict__.clear()
+        config.__dict__.update(state[0])
+        logger.setLevel(state[1])
+        papers.config.DRYRUN = state[2]
+        os.chdir(state[3])
+    logger.info('{} => {}'.format(' '.join(message['argv']), 'in client' if status is None else status))
+    conn.sendall(json.dumps({'status': status, 'stdout': out, 'stderr': err}).encode('utf-8'))
+    return True
+
+
+def serve(bibtex=None, filesdir=None, path=None):
+    """serve requests until stopped (papers serve --stop, or interrupted)
+
+    bibtex: library to load right away
+    """
+    import papers.bib
+    path = path or socket_file()
+    if not hasattr(socket, 'AF_UNIX'):
+        raise ValueError('papers serve requires unix sockets')
+    if os.path.exists(path):
+        if _send({'argv': [], 'cwd': os.getcwd()}, path, timeout=5) is not None:
+            raise ValueError('papers serve is already running: '+path)
+        os.remove(path)  # stale socket
+    if not os.path.exists(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(path)
+    os.chmod(path, 0o600)
+    sock.listen(16)
+    papers.bib.library_cache = LibraryCache()
+    try:
+        if bibtex and os.path.exists(bibtex):
+            papers.bib.Biblio.load(bibtex, filesdir)
+        logger.info('papers serve: listening on '+path)
+        running = True
+        while running:
+            conn, _ = sock.accept()
+            try:
+                running = handle(conn)
+            except Exception as error:
+                logger.error('papers serve: '+repr(error))
+            finally:
+                conn.close()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        papers.bib.library_cache = None
+        sock.close()
+        if os.path.exists(path):
+            os.remove(path)
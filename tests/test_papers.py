@@ -2,11 +2,31 @@ from __future__ import print_function, absolute_import
 
 import unittest
 import os, subprocess as sp
-import tempfile, shutil
+import tempfile, shutil, time
+import hashlib
+import threading
+import io
 import difflib
-
-from papers.extract import extract_pdf_metadata
-from papers.bib import Biblio, bibtexparser, parse_file, format_file
+from multiprocessing.pool import ThreadPool
+
+from papers.extract import extract_pdf_metadata, _split_pages, pdf_backend, PDF_BACKENDS, parse_doi, DOIParsingError
+from papers.extract import pdfhead, extract_pdf_doi, _pdfhead_key, _is_placeholder, PdfBackend
+from papers.extract import stats as extract_stats, iter_ocr_pages
+import papers.extract
+from papers.parallel import ordered_map
+from papers.bib import Biblio, bibtexparser, parse_file, format_file, are_duplicates, duplicate_blocks
+from papers.bib import fuzzy_duplicate_pairs, entry_id, cached_entry_id, backupfile, scan_files
+from papers.duplicate import groupby_equal, EntryCache, bestentry, score, DuplicateState, entry_fingerprint
+from papers.lsh import near_duplicate_pairs, lsh_file
+from papers.encoding import format_bibtex, format_entry, format_entries
+from papers.encoding import encode_entries_latex, parse_bibtex, parse_names, standard_name, family_names, strip_outmost_brackets
+from papers.latexenc import latex_to_unicode, _replace_latex, _replace_latex_each, unicode_to_crappy_latex1, unicode_to_latex
+from papers.latexenc import string_to_latex, encode_latex, encode_latex_strings, unicode_to_latex_map
+from papers.cache import read_snapshot, snapshot_file, index_file, lookup_entries, count_entries
+from papers.cache import duplicate_state_file, journal_file, write_snapshot, read_index, write_index, file_stamp
+from papers.cache import file_digest, pdf_cache_get, pdf_cache_set
+from papers.config import checksum, config, Config
+from papers.server import LibraryCache
 from download import downloadpdf
 
 def run(cmd):
@@ -88,6 +108,987 @@ class TestBibtexFileEntry(unittest.TestCase):
 
 
 
+class TestFastParser(unittest.TestCase):
+
+    bibtex = """% implicit comment
+@Article{Perrette_2011,
+  Author = {M. Perrette and {van der} Berg, J.},
+  title = "Near-ubiquity of {ice-edge} blooms",
+  year = 2011,
+  month = feb,
+  abstract = {line one
+     line two},
+  note = {a} # {b},
+}
+
+@misc{Misc, title={x}}
+@weird{NonStandard, title={y}}
+@inproceedings(Parens, title={z}, year={2000})
+@article{Fields,
+ title = {first},
+ Title = {second},
+ empty = {{}},
+ quoted = "a {"} b",
+}
+@string{foo = {Foo}}
+@article{Macro, journal = foo}
+@comment{explicit comment}
+@article{Trailing, title={t}} trailing text
+@article{AtSign, title={ok},
+  abstract = {
+@ at line start in value}
+}
+"""
+
+    def assertSameAsBibtexparser(self, bibtex):
+        db1 = bibtexparser.loads(bibtex)
+        for data in [bibtex, bibtex.encode('utf-8')]:
+            db2 = parse_bibtex(data)
+            self.assertEqual([list(e.items()) for e in db1.entries], [list(e.items()) for e in db2.entries])
+            self.assertEqual(db1.comments, db2.comments)
+            self.assertEqual(db1.strings, db2.strings)
+            self.assertEqual(bibtexparser.dumps(db1), bibtexparser.dumps(db2))
+
+    def test_same_as_bibtexparser(self):
+        self.assertSameAsBibtexparser(self.bibtex)
+
+    def test_empty(self):
+        self.assertSameAsBibtexparser('')
+
+    def test_roundtrip(self):
+        db = parse_bibtex(self.bibtex)
+        self.assertSameAsBibtexparser(bibtexparser.dumps(db))
+
+
+class TestWriter(unittest.TestCase):
+
+    def assertSameAsBibtexparser(self, db):
+        self.assertEqual(format_bibtex(db), bibtexparser.dumps(db))
+
+    def test_same_as_bibtexparser(self):
+        db = parse_bibtex(TestFastParser.bibtex)
+        db.entries.append({'ENTRYTYPE': 'article', 'ID': 'unicode', 'title': u'\u00e9t\u00e9 {\\"u} \n two lines'})
+        self.assertSameAsBibtexparser(db)
+
+    def test_interpolated_strings(self):
+        db = bibtexparser.bparser.BibTexParser(interpolate_strings=False).parse(TestFastParser.bibtex)
+        self.assertSameAsBibtexparser(db)
+
+    def test_roundtrip(self):
+        db = parse_bibtex(TestFastParser.bibtex)
+        bibtex = format_bibtex(db)
+        db2 = parse_bibtex(bibtex)
+        key = lambda e: e['ID'].lower()
+        self.assertEqual(db2.entries, sorted(db.entries, key=key))  # written sorted by key
+        self.assertEqual(format_bibtex(db2), bibtex)
+
+    def test_entries(self):
+        db = parse_bibtex(TestFastParser.bibtex)
+        self.assertEqual(format_entries(db.entries), bibtexparser.dumps(parse_bibtex(format_entries(db.entries))))
+        self.assertEqual(format_entry(db.entries[0]), format_entries(db.entries[:1]))
+        self.assertRaises(TypeError, format_entry, {'ENTRYTYPE': 'article', 'ID': 'k', 'year': 2000})
+
+
+class TempCache(object):
+    """ mixin: cache directory (config.cache) in a temporary directory, also
+    for the papers commands run by the test (XDG_CACHE_HOME)
+    """
+    def setUp(self):
+        self._cache, self._cache_home = config.cache, os.environ.get('XDG_CACHE_HOME')
+        self.cache_home = tempfile.mkdtemp(prefix='papers.cache')
+        os.environ['XDG_CACHE_HOME'] = self.cache_home
+        config.cache = os.path.join(self.cache_home, 'papers')
+        os.makedirs(config.cache)
+
+    def tearDown(self):
+        config.cache = self._cache
+        if self._cache_home is None:
+            del os.environ['XDG_CACHE_HOME']
+        else:
+            os.environ['XDG_CACHE_HOME'] = self._cache_home
+        shutil.rmtree(self.cache_home)
+
+
+class TestSnapshot(TempCache, unittest.TestCase):
+
+    bibtex = """@article{Perrette_2011,
+ author = {M. Perrette and A. Yool and G. D. Quartly and E. E. Popova},
+ doi = {10.5194/bg-8-515-2011},
+ title = {Near-ubiquity of ice-edge blooms in the Arctic},
+ year = {2011}
+}"""
+
+    def setUp(self):
+        super(TestSnapshot, self).setUp()
+        fd, self.mybib = tempfile.mkstemp(prefix='papers.bib')
+        os.close(fd)
+        open(self.mybib, 'w').write(self.bibtex)
+
+    def tearDown(self):
+        os.remove(self.mybib)
+        super(TestSnapshot, self).tearDown()
+
+    def test_snapshot(self):
+        my = Biblio.load(self.mybib, '')
+        self.assertTrue(os.path.exists(snapshot_file(self.mybib)))
+        self.assertEqual(read_snapshot(self.mybib)['entries'], my.entries)
+        self.assertEqual(Biblio.load(self.mybib, '').entries, my.entries)
+
+    def test_edited_same_size(self):
+        Biblio.load(self.mybib, '')
+        open(self.mybib, 'w').write(self.bibtex.replace('2011}', '2012}'))
+        self.assertIsNone(read_snapshot(self.mybib))
+        self.assertEqual(Biblio.load(self.mybib, '').entries[0]['year'], '2012')
+
+    def test_edited(self):
+        Biblio.load(self.mybib, '')
+        open(self.mybib, 'w').write(self.bibtex.replace('Arctic', 'Antarctic'))
+        self.assertIsNone(read_snapshot(self.mybib))
+        self.assertEqual(Biblio.load(self.mybib, '').entries[0]['title'], 'Near-ubiquity of ice-edge blooms in the Antarctic')
+
+    def test_save(self):
+        my = Biblio.load(self.mybib, '')
+        my.entries[0]['year'] = '2000'
+        my.save(self.mybib)
+        self.assertEqual(read_snapshot(self.mybib)['entries'][0]['year'], '2000')
+
+
+class TestModified(TempCache, unittest.TestCase):
+
+    bibtex = TestSnapshot.bibtex + '\n\n' + TestSnapshot.bibtex.replace('Perrette_2011', 'Yool_2011')
+
+    def setUp(self):
+        super(TestModified, self).setUp()
+        self.tmpdir = tempfile.mkdtemp()
+        self.mybib = os.path.join(self.tmpdir, 'papers.bib')
+        open(self.mybib, 'w').write(self.bibtex)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+        super(TestModified, self).tearDown()
+
+    def test_unchanged(self):
+        my = Biblio.load(self.mybib, '')
+        self.assertFalse(my.modified())
+        self.assertFalse(my.save(self.mybib))
+        self.assertFalse(os.path.exists(backupfile(self.mybib)))
+        self.assertTrue(my.modified(self.mybib+'.copy'))
+
+    def test_changed_entries(self):
+        my = Biblio.load(self.mybib, '')
+        my.entries[0]['year'] = '2000'
+        self.assertEqual(my.changed_entries(), ([my.entries[0]], []))
+        removed = my.entries.pop()
+        my.insert_entry({'ID': 'New_2020', 'ENTRYTYPE': 'article'})
+        self.assertEqual(my.count_changes(), 3)
+        self.assertEqual(my.changed_entries()[1], [removed])
+        self.assertTrue(my.save(self.mybib))
+        self.assertFalse(my.modified())
+        self.assertEqual(Biblio.load(self.mybib, '').count_changes(), 0)
+
+    def test_command(self):
+        sp.check_call('papers check --bibtex {} --keys Perrette_2011'.format(self.mybib), shell=True)
+        self.assertEqual(open(self.mybib).read(), self.bibtex)
+        self.assertFalse(os.path.exists(backupfile(self.mybib)))
+
+
+class TestIncrementalSave(TempCache, unittest.TestCase):
+
+    bibtex = TestModified.bibtex
+
+    def setUp(self):
+        super(TestIncrementalSave, self).setUp()
+        self.tmpdir = tempfile.mkdtemp()
+        self.mybib = os.path.join(self.tmpdir, 'papers.bib')
+        open(self.mybib, 'w').write(self.bibtex)
+        my = Biblio.load(self.mybib, '')
+        my.entries[0]['note'] = 'saved'
+        my.save(self.mybib)  # written by save: unchanged entries can be copied
+        self.saved = open(self.mybib).read()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+        super(TestIncrementalSave, self).tearDown()
+
+    def modify(self):
+        my = Biblio.load(self.mybib, '')
+        my.entries[1]['year'] = '2000'
+        my.entries.pop(0)
+        my.insert_entry({'ID': 'New_2020', 'ENTRYTYPE': 'article', 'doi': '10.1000/new'})
+        my.save(self.mybib)
+        return my
+
+    def test_save(self):
+        my = self.modify()
+        data = open(self.mybib, 'rb').read()
+        self.assertEqual(data.decode('utf-8'), my.format())
+        self.assertEqual(open(backupfile(self.mybib)).read(), self.saved)
+        self.assertTrue(os.path.exists(journal_file(self.mybib)))
+        other = os.path.join(self.tmpdir, 'other.bib')
+        expected = write_index(other, data, file_stamp(self.mybib), b'')
+        os.remove(index_file(other))
+        self.assertEqual(read_index(self.mybib, data)['keys'], expected['keys'])
+        self.assertEqual(read_index(self.mybib, data)['dois'], expected['dois'])
+        self.assertEqual(lookup_entries(self.mybib, dois=['10.1000/new'])[0]['ID'], 'New_2020')
+
+    def test_journal(self):
+        my = self.modify()
+        self.assertEqual(read_snapshot(self.mybib)['entries'], my.entries)
+        self.assertEqual(Biblio.load(self.mybib, '').entries, Biblio.load(self.mybib, '', snapshot=False).entries)
+
+    def test_journal_order(self):
+        # saved out of order (list --edit) or renamed, then saved incrementally
+        my = Biblio.load(self.mybib, '')
+        my.db.entries = my.entries[::-1]
+        my.entries[0]['ID'] = 'Zzz_2011'
+        my.save(self.mybib)
+        for i in range(2):
+            my = Biblio.load(self.mybib, '')
+            my.entries[0]['year'] = str(2000+i)
+            my.insert_entry({'ID': 'New_{}'.format(i), 'ENTRYTYPE': 'article', 'year': '2020'})
+            my.save(self.mybib)
+        self.assertTrue(os.path.exists(journal_file(self.mybib)))
+        self.assertEqual(Biblio.load(self.mybib, '').entries, parse_bibtex(open(self.mybib).read()).entries)
+
+    def test_journal_not_following(self):
+        self.modify()
+        journal = open(journal_file(self.mybib), 'rb').read()
+        my = Biblio.load(self.mybib, '')
+        write_snapshot(self.mybib, my.snapshot(), file_stamp(self.mybib), checksum(self.mybib))
+        open(journal_file(self.mybib), 'wb').write(journal)  # base: the file before modify()
+        self.assertEqual(read_snapshot(self.mybib)['entries'], my.entries)
+
+
+class TestIndex(TempCache, unittest.TestCase):
+
+    bibtex = TestSnapshot.bibtex
+
+    other = """
+
+@article{Other_2000,
+ doi = {10.1000/other},
+ title = {Another paper},
+ year = {2000}
+}
+"""
+
+    def setUp(self):
+        super(TestIndex, self).setUp()
+        fd, self.mybib = tempfile.mkstemp(prefix='papers.bib')
+        os.close(fd)
+        open(self.mybib, 'w').write(self.bibtex)
+        Biblio.load(self.mybib, '')
+
+    def tearDown(self):
+        os.remove(self.mybib)
+        super(TestIndex, self).tearDown()
+
+    def test_lookup(self):
+        self.assertTrue(os.path.exists(index_file(self.mybib)))
+        entries = lookup_entries(self.mybib, keys=['perrette_2011'])
+        self.assertEqual(entries, Biblio.load(self.mybib, '').entries)
+        self.assertEqual(lookup_entries(self.mybib, dois=['10.5194/BG-8-515-2011']), entries)
+        self.assertEqual(lookup_entries(self.mybib, keys=['Unknown']), [])
+
+    def test_appended(self):
+        open(self.mybib, 'a').write(self.other)
+        self.assertEqual(lookup_entries(self.mybib, keys=['Other_2000'])[0]['title'], 'Another paper')
+        self.assertEqual(count_entries(self.mybib), 2)
+
+    def test_edited(self):
+        open(self.mybib, 'w').write(self.other + self.bibtex.replace('2011}', '2012}'))
+        self.assertEqual(lookup_entries(self.mybib, keys=['Perrette_2011'])[0]['year'], '2012')
+        self.assertEqual(count_entries(self.mybib), 2)
+
+    def test_strings(self):
+        open(self.mybib, 'w').write('@string{arctic = "Arctic"}\n' + self.bibtex)
+        self.assertIsNone(lookup_entries(self.mybib, keys=['Perrette_2011']))
+
+    def test_list_key(self):
+        open(self.mybib, 'a').write(self.other)
+        out = run('papers list --bibtex {} --key Other_2000'.format(self.mybib))
+        self.assertEqual(parse_bibtex(out).entries[0]['ID'], 'Other_2000')
+        self.assertEqual(len(parse_bibtex(out).entries), 1)
+
+
+class TestKeyIndex(unittest.TestCase):
+
+    def entry(self, key):
+        return {'ID': key, 'ENTRYTYPE': 'article', 'title': key}
+
+    def test_insert_remove(self):
+        my = Biblio()
+        for key in ['B2000', 'A2000', 'C2000', 'A2000']:
+            my.insert_entry(self.entry(key), update_key=True)
+        self.assertEqual([e['ID'] for e in my.entries], ['A2000', 'A2000b', 'B2000', 'C2000'])
+        my.remove_entry(my.entries[1])
+        self.assertEqual(my.index_sorted(self.entry('B2000')), 1)
+        self.assertEqual(my.append_abc_to_key(self.entry('a2000')), 'a2000b')
+
+    def test_set_key(self):
+        my = Biblio()
+        for key in ['a2000', 'b2000']:
+            my.insert_entry(self.entry(key))
+        my.set_key(my.entries[0], 'c2000')
+        self.assertEqual([e['ID'] for e in my.entries], ['b2000', 'c2000'])  # still sorted
+        self.assertEqual(my.append_abc_to_key(self.entry('c2000')), 'c2000b')
+        self.assertEqual(my.append_abc_to_key(self.entry('a2000')), 'a2000b')
+        self.assertRaises(ValueError, my.remove_entry, self.entry('b2000'))
+
+    def test_direct_change(self):
+        my = Biblio()
+        my.insert_entry(self.entry('a2000'))
+        my.db.entries.append(self.entry('b2000'))
+        self.assertEqual(my.index_sorted(self.entry('c2000')), 2)
+
+
+class TestDuplicateCandidates(unittest.TestCase):
+    """blocking index gives the same duplicates as a full scan
+    """
+    def setUp(self):
+        import random
+        rng = random.Random(0)
+        authors = ['', 'Perrette, M.', 'Yool, A. and Quartly, G.', 'Popova, E. E.']
+        titles = ['', 'Arctic blooms', 'Ice edge', 'Sea level']
+        dois = ['', '10.1000/a', '10.1000/b', '10.1000/B']
+        self.entries = []
+        for i in range(300):
+            e = {'ID': 'Key{}'.format(rng.randint(0, 50)), 'ENTRYTYPE': 'article'}
+            for field, values in [('author', authors), ('title', titles), ('doi', dois)]:
+                value = rng.choice(values)
+                if value:
+                    e[field] = value
+            self.entries.append(e)
+
+    def test_equivalence(self):
+        for similarity in ['EXACT', 'GOOD', 'FAIR', 'PARTIAL']:
+            my = Biblio(similarity=similarity)
+            for e in self.entries[:200]:
+                my.insert_entry(dict(e), update_key=True)
+            my.remove_entry(my.entries[10])
+            for e in self.entries[200:]:
+                expected = [c for c in my.entries if my.eq(c, e)]
+                self.assertEqual([c for c in my.duplicate_candidates(e) if my.eq(c, e)], expected)
+
+    def test_groupby_blocks(self):
+        for similarity in ['EXACT', 'GOOD', 'FAIR', 'PARTIAL']:
+            eq = lambda a, b: are_duplicates(a, b, similarity=similarity)
+            entries = self.entries[:150]
+            self.assertEqual(groupby_equal(entries, eq, blocks=duplicate_blocks), groupby_equal(entries, eq))
+
+    def test_groupby_fuzzy(self):
+        import random
+        rng = random.Random(1)
+        titles = ['Arctic blooms', 'Arctic bloom', 'Ice edge blooms', 'Sea level rise', 'Sea-level rise', 'Regional sea level']
+        authors = ['Perrette, M.', 'Perrette, M. and Yool, A.', 'Popova, E. E.']
+        entries = [{'ID': 'Key{}'.format(i), 'ENTRYTYPE': 'article', 'title': rng.choice(titles),
+            'author': rng.choice(authors), 'doi': '10.1000/{}'.format(rng.randint(0, 100))} for i in range(100)]
+        eq = lambda a, b: are_duplicates(a, b, similarity='FUZZY')
+        partial = lambda a, b: are_duplicates(a, b, similarity='PARTIAL')
+        self.assertEqual(groupby_equal(entries, partial, blocks=duplicate_blocks,
+            equal_pairs=fuzzy_duplicate_pairs(entries)), groupby_equal(entries, eq))
+
+    def test_groupby_transitive(self):
+        eq = lambda a, b: abs(a-b) <= 1
+        self.assertEqual(groupby_equal([0, 5, 2, 1], eq), [(0, [0, 2, 1]), (1, [5])])
+        self.assertEqual(groupby_equal([0, 5, 2, 1], eq, blocks=lambda e: [e//2, (e+1)//2]),
+            [(0, [0, 2, 1]), (1, [5])])
+
+
+class TestNearDuplicates(TempCache, unittest.TestCase):
+
+    bibtex = """@article{Perrette_2011,
+ title = {Near-ubiquity of ice-edge blooms in the Arctic},
+ year = {2011}
+}
+
+@article{Perrette_2011b,
+ title = {Near ubiquity of ice edge blooms in the {A}rctic: a subtitle},
+ year = {2011}
+}
+
+@article{Other_2000,
+ title = {Another paper},
+ year = {2000}
+}
+"""
+
+    def setUp(self):
+        super(TestNearDuplicates, self).setUp()
+        fd, self.mybib = tempfile.mkstemp(prefix='papers.bib')
+        os.close(fd)
+        open(self.mybib, 'w').write(self.bibtex)
+
+    def tearDown(self):
+        os.remove(self.mybib)
+        super(TestNearDuplicates, self).tearDown()
+
+    def test_pairs(self):
+        entries = parse_bibtex(self.bibtex).entries
+        self.assertEqual(near_duplicate_pairs(entries, self.mybib), [(1, 0)])
+        self.assertTrue(os.path.exists(lsh_file(self.mybib)))
+        self.assertEqual(near_duplicate_pairs(entries, self.mybib), [(1, 0)])
+
+    def test_list(self):
+        out = run('papers list --bibtex {} --duplicates-near'.format(self.mybib))
+        self.assertEqual(sorted(e['ID'] for e in parse_bibtex(out).entries), ['Perrette_2011', 'Perrette_2011b'])
+
+
+class TestEntryCache(unittest.TestCase):
+
+    def test_invalidation(self):
+        cache = EntryCache()
+        e = {'ID': 'Perrette2011', 'title': 'Arctic blooms', 'author': 'Perrette, M.'}
+        self.assertEqual(cached_entry_id(e, cache), entry_id(e))
+        e['title'] = 'Ice-edge blooms'
+        self.assertEqual(cached_entry_id(e, cache), entry_id(e))
+        e['doi'] = '10.5194/bg-8-515-2011'
+        self.assertEqual(cached_entry_id(e, cache), entry_id(e))
+        self.assertEqual(cache.score(e), score(e))
+
+    def test_bestentry(self):
+        cache = EntryCache()
+        entries = [{'ID': 'a', 'title': 't'}, {'ID': 'b', 'title': 't', 'doi': '10.5194/bg-8-515-2011'}]
+        self.assertIs(bestentry(entries, cache), entries[1])
+        del entries[1]['doi']
+        entries[0]['file'] = 'file.pdf'
+        self.assertIs(bestentry(entries, cache), entries[0])
+
+
+class TestNames(unittest.TestCase):
+
+    names = ['M. Perrette and A. Yool and G. D. Quartly', 'Perrette, Mahé and Yool, A.',
+        'Ludwig van Beethoven', 'Jan van der Berg', 'de la Fuente, José', 'John Smith jr',
+        '{European Space Agency}', r'{M{\"u}ller}, K. and Garc{\'\i}a, M.', 'J.R.R. Tolkien',
+        r'{Schr{\"o}dinger}, Erwin', 'Nguyen Van Anh', "O'Brien, T.", 'A. {de Gaulle}']
+
+    def reference(self, author):
+        # former implementation based on bibtexparser.customization.getnames
+        names = []
+        for name in bibtexparser.customization.getnames([strip_outmost_brackets(nm) for nm in author.split(' and ')]):
+            family, given = name.split(',')
+            family = strip_outmost_brackets(family.strip())
+            names.append(', '.join([family.strip(), given.strip()]))
+        return ' and '.join(names)
+
+    def test_standard_name(self):
+        for author in self.names + [' and '.join(self.names)]:
+            self.assertEqual(standard_name(author), self.reference(author))
+            self.assertEqual(family_names(author),
+                [latex_to_unicode(nm.split(',')[0]) for nm in self.reference(author).split(' and ')])
+
+    def test_parse_names(self):
+        self.assertEqual(parse_names('Jan van der Berg and Smith, John'),
+            (('Berg', 'Jan van', 'der', ''), ('Smith', 'John', '', '')))
+        self.assertEqual(parse_names('John Smith jr'), (('Smith', 'John', '', 'jr'),))
+
+    def test_unbalanced(self):
+        self.assertRaises(ValueError, standard_name, 'John {Smith} {Doe')
+
+
+class TestLatexToUnicode(unittest.TestCase):
+
+    pairs = list(unicode_to_crappy_latex1) + list(unicode_to_latex)
+
+    def reference(self, string):
+        # former implementation: replace every pattern in turn
+        for k, v in self.pairs:
+            if v in string:
+                string = string.replace(v, k)
+        return string
+
+    def test_all_patterns(self):
+        for k, v in self.pairs:
+            for string in [v, 'a'+v+'b', v+' '+v, '{'+v+'}']:
+                self.assertEqual(_replace_latex(string), self.reference(string), repr(string))
+
+    def test_combinations(self):
+        import random
+        rng = random.Random(0)
+        for _ in range(5000):
+            string = ''.join(rng.choice(self.pairs)[1] + rng.choice(['', ' ', 'e', '{', '}', "'", '\\'])
+                for _ in range(3))
+            self.assertEqual(_replace_latex(string), self.reference(string), repr(string))
+
+    def test_created_patterns(self):
+        # ascii replacements (here a backslash) may form new latex sequences
+        for string in [r"\textbackslash'{e}", r'M{\"u}ller \textbackslash ~n', r'\textbackslash\textbackslash']:
+            self.assertEqual(_replace_latex(string), self.reference(string))
+
+    def test_first_strings(self):
+        # converted pattern by pattern, before the matcher is built
+        for string in [r"\textbackslash'{e}", r'M{\"u}ller \textbackslash ~n', r'{\'e}t{\'e} $\alpha$']:
+            self.assertEqual(_replace_latex_each(string), self.reference(string))
+            self.assertEqual(_replace_latex_each(string), _replace_latex(string))
+
+    def test_latex_to_unicode(self):
+        self.assertEqual(latex_to_unicode(r'M{\"u}ller and Garc{\'\i}a'), u'M\xfcller and Garc\xeda')
+
+
+class TestLatexEncoding(unittest.TestCase):
+
+    chars = [k for k, v in unicode_to_latex] + list('ab {}')
+
+    def test_string_to_latex(self):
+        # former implementation: character-wise lookup
+        reference = lambda s: ''.join(c if c in ' {}' else unicode_to_latex_map.get(c, c) for c in s)
+        import random
+        rng = random.Random(0)
+        for _ in range(2000):
+            string = ''.join(rng.choice(self.chars) for _ in range(6))
+            self.assertEqual(string_to_latex(string), reference(string), repr(string))
+
+    def test_encode_latex(self):
+        self.assertEqual(encode_latex(u'M\xfcller, {\\AA}$x$ \u2264 1'), u'M{\\"u}ller, {\\AA}$x$ \\leq  1')
+        ascii = r'M{\"u}ller \% {CO2}'
+        self.assertIs(encode_latex(ascii), ascii)
+        strings = [u'Garc\xeda', ascii, u'', u'\xc5land']
+        self.assertEqual(encode_latex_strings(strings), [encode_latex(s) for s in strings])
+
+    def test_encode_entries(self):
+        entries = [{'ID': u'M\xfcller2000', 'ENTRYTYPE': 'article', 'author': u'M\xfcller, K.',
+            'abstract': u'\xe9t\xe9', 'title': 'Ocean'}]
+        encode_entries_latex(entries)
+        self.assertEqual(entries[0], {'ID': u'M\xfcller2000', 'ENTRYTYPE': 'article',
+            'author': u'M{\\"u}ller, K.', 'abstract': u'\xe9t\xe9', 'title': 'Ocean'})
+
+    def test_lazy_tables(self):
+        out = run('python -c "import sys, papers.bib; print(\'papers.latextables\' in sys.modules)"')
+        self.assertEqual(out, 'False')
+
+
+class TestStartup(unittest.TestCase):
+
+    def test_lazy_imports(self):
+        out = run('python -c "import sys, papers.bib; print([m for m in sys.modules if m.split(\'.\')[0] in '
+            '(\'bibtexparser\', \'crossref\', \'requests\')])"')
+        self.assertEqual(out, '[]')
+
+    def test_bibtexparser(self):
+        from bibtexparser.bibdatabase import STANDARD_TYPES as types
+        from papers.encoding import STANDARD_TYPES
+        self.assertEqual(STANDARD_TYPES, types)
+        self.assertEqual(bibtexparser.loads('').entries, [])  # patched on first use
+
+
+class TestServe(unittest.TestCase):
+
+    bibtex = """@article{Perrette_2011,
+ doi = {10.5194/bg-8-515-2011},
+ title = {Near-ubiquity of ice-edge blooms in the Arctic},
+ year = {2011}
+}
+"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.mybib = os.path.join(self.tmpdir, 'papers.bib')
+        open(self.mybib, 'w').write(self.bibtex)
+        self.env = dict(os.environ, XDG_CACHE_HOME=os.path.join(self.tmpdir, 'cache'),
+            XDG_CONFIG_HOME=os.path.join(self.tmpdir, 'config'))
+        self.socket = os.path.join(self.tmpdir, 'cache', 'papers', 'serve.sock')
+        self.server = sp.Popen(['papers', 'serve', '--bibtex', self.mybib, '--info'],
+            env=self.env, stderr=sp.PIPE)
+        for _ in range(100):
+            if os.path.exists(self.socket):
+                break
+            time.sleep(0.1)
+
+    def tearDown(self):
+        if self.server.poll() is None:
+            self.server.kill()
+            self.server.communicate()
+        shutil.rmtree(self.tmpdir)
+
+    def papers(self, cmd):
+        return sp.check_output('papers '+cmd, shell=True, env=self.env, cwd=self.tmpdir).strip().decode()
+
+    def test_serve(self):
+        self.assertTrue(os.path.exists(self.socket))
+        self.assertEqual(self.papers('list --bibtex papers.bib --key Perrette_2011 -f year --no-key'), '2011')
+
+        # reload on change (relative path: the server runs in the client directory)
+        open(self.mybib, 'a').write(self.bibtex.replace('Perrette_2011', 'Other_2012').replace('2011}', '2012}'))
+        self.assertEqual(self.papers('list --bibtex papers.bib -f year --no-key').split(), ['2012', '2011'])
+
+        # commands that modify the library run in the client
+        self.papers('list --bibtex papers.bib --key Other_2012 --delete')
+        self.assertEqual(self.papers('list --bibtex papers.bib -f year --no-key'), '2011')
+
+        self.papers('serve --stop')
+        log = self.server.communicate()[1].decode()
+        self.assertIn('--delete => in client', log)
+        self.assertFalse(os.path.exists(self.socket))
+
+        # no server: in-process
+        self.assertEqual(self.papers('list --bibtex papers.bib -f year --no-key'), '2011')
+
+
+class TestLibraryCache(TempCache, unittest.TestCase):
+
+    bibtex = TestServe.bibtex
+
+    def setUp(self):
+        super(TestLibraryCache, self).setUp()
+        self.tmpdir = tempfile.mkdtemp()
+        self.mybib = os.path.join(self.tmpdir, 'papers.bib')
+        open(self.mybib, 'w').write(self.bibtex)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+        super(TestLibraryCache, self).tearDown()
+
+    def test_reload(self):
+        libraries = LibraryCache()
+        my = libraries.load(Biblio, self.mybib, '')
+        self.assertIs(libraries.load(Biblio, self.mybib, ''), my)
+        open(self.mybib, 'a').write(self.bibtex.replace('Perrette_2011', 'Other_2012'))
+        self.assertEqual(len(libraries.load(Biblio, self.mybib, '').entries), 2)
+
+    def test_same_stamp(self):
+        # modified within the same time stamp, just after loading
+        libraries = LibraryCache()
+        libraries.load(Biblio, self.mybib, '')
+        st = os.stat(self.mybib)
+        open(self.mybib, 'w').write(self.bibtex.replace('2011}', '2012}'))
+        os.utime(self.mybib, (st.st_atime, st.st_mtime))
+        self.assertEqual(libraries.load(Biblio, self.mybib, '').entries[0]['year'], '2012')
+
+
+class TestBatch(TempCache, unittest.TestCase):
+
+    bibtex = TestServe.bibtex + TestServe.bibtex.replace('Perrette_2011', 'Other_2012')
+
+    def setUp(self):
+        super(TestBatch, self).setUp()
+        self.tmpdir = tempfile.mkdtemp()
+        self.mybib = os.path.join(self.tmpdir, 'papers.bib')
+        open(self.mybib, 'w').write(self.bibtex)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+        super(TestBatch, self).tearDown()
+
+    def batch(self, commands):
+        p = sp.Popen('papers batch', shell=True, cwd=self.tmpdir, stdin=sp.PIPE, stdout=sp.PIPE, stderr=sp.PIPE)
+        out, err = p.communicate(commands.encode())
+        return p.returncode, out.decode()
+
+    def test_batch(self):
+        status, out = self.batch("""# comment
+check --bibtex papers.bib --keys Perrette_2011 --tag one --force
+papers check --bibtex papers.bib --keys Perrette_2011 Other_2012 --tag 'two words' --force
+list --bibtex papers.bib --key Other_2012 -f keywords --no-key
+""")
+        self.assertEqual(status, 0)
+        self.assertIn('two words', out)  # later commands see earlier changes
+        keywords = {e['ID']: e.get('keywords', '') for e in Biblio.load(self.mybib, '').entries}
+        self.assertEqual({k: ('one' in v, 'two words' in v) for k, v in keywords.items()},
+            {'Perrette_2011': (True, True), 'Other_2012': (False, True)})
+
+    def test_failure(self):
+        status, out = self.batch("""check --bibtex papers.bib --keys Perrette_2011 --tag one --force
+list --bibtex papers.bib --no-such-option
+""")
+        self.assertEqual(status, 1)
+        self.assertEqual(open(self.mybib).read(), self.bibtex)
+
+    def test_failure_cache(self):
+        # duplicate checks: cache files written only if the batch succeeds
+        check = 'check --bibtex papers.bib --duplicates-near -m s\n'
+        status, out = self.batch(check + 'list --bibtex papers.bib --no-such-option\n')
+        self.assertEqual(status, 1)
+        self.assertFalse(os.path.exists(duplicate_state_file(self.mybib)))
+        self.assertFalse(os.path.exists(lsh_file(self.mybib)))
+        status, out = self.batch(check + check)
+        self.assertEqual(status, 0)
+        self.assertTrue(os.path.exists(duplicate_state_file(self.mybib)))
+        self.assertTrue(os.path.exists(lsh_file(self.mybib)))
+
+    def test_excluded(self):
+        status, out = self.batch("""check --bibtex papers.bib --keys Perrette_2011 --tag one --force
+undo --bibtex papers.bib
+""")
+        self.assertEqual(status, 1)
+        self.assertEqual(open(self.mybib).read(), self.bibtex)
+
+
+class TestPdfPages(unittest.TestCase):
+
+    def test_split_pages(self):
+        chunks = [b'page 1\x0cpa', b'ge 2', b'\x0c', b'\x0cpage 4']
+        self.assertEqual(list(_split_pages(chunks)), [b'page 1\x0c', b'page 2\x0c', b'\x0c', b'page 4'])
+        self.assertEqual(list(_split_pages([])), [])
+
+
+class TestPdfBackend(unittest.TestCase):
+
+    def test_default(self):
+        self.assertEqual(pdf_backend().name, config.pdf_backend)
+        self.assertEqual(pdf_backend('poppler').name, 'poppler')
+
+    def test_auto(self):
+        installed = [b.name for b in PDF_BACKENDS.values() if b.module and b.available()]
+        self.assertEqual(pdf_backend('auto').name, (installed+['poppler'])[0])
+
+    def test_unknown(self):
+        self.assertRaises(ValueError, pdf_backend, 'acrobat')
+
+    def test_not_installed(self):
+        for backend in PDF_BACKENDS.values():
+            if not backend.available():
+                self.assertRaises(ValueError, pdf_backend, backend.name)
+
+    def test_cli_not_installed(self):
+        for backend in PDF_BACKENDS.values():
+            if not backend.available():
+                proc = sp.Popen(['papers', 'doi', '--pdf-backend', backend.name, 'missing.pdf'],
+                    stdout=sp.PIPE, stderr=sp.STDOUT)
+                out = proc.communicate()[0].decode()
+                self.assertEqual(proc.returncode, 1)
+                self.assertEqual(out.strip().splitlines(), [
+                    'papers: error: pdf backend {}: python package {} is not installed (see --pdf-backend)'.format(
+                        backend.name, backend.module)])
+
+    def test_config(self):
+        fd, file = tempfile.mkstemp(prefix='papersconfig.json')
+        os.close(fd)
+        try:
+            Config(file=file, pdf_backend='pypdf').save()
+            cfg = Config(file=file)
+            cfg.load()
+            self.assertEqual(cfg.pdf_backend, 'pypdf')
+        finally:
+            os.remove(file)
+
+
+class TestIngest(TempCache, unittest.TestCase):
+
+    def setUp(self):
+        super(TestIngest, self).setUp()
+        self.libdir = tempfile.mkdtemp(prefix='papers.lib')
+        self.somedir = tempfile.mkdtemp(prefix='papers.somedir')
+        for i, name in enumerate(['b', 'a', 'c']):
+            os.makedirs(os.path.join(self.somedir, name))
+            with open(os.path.join(self.somedir, name, 'refs.bib'), 'w') as f:
+                f.write('@article{{Paper{}_2000,\n title = {{Paper {}}},\n year = {{2000}}\n}}\n'.format(i, i))
+            with open(os.path.join(self.somedir, name, 'broken.pdf'), 'w') as f:
+                f.write('not a pdf')
+        entrydir = os.path.join(self.somedir, 'Entry_2010')
+        os.makedirs(entrydir)
+        with open(os.path.join(entrydir, '.Entry_2010.bib'), 'w') as f:
+            f.write('@article{Entry_2010,\n title = {Entry},\n year = {2010}\n}\n')
+        open(os.path.join(entrydir, 'supplement.txt'), 'w').close()
+
+    def scan(self, jobs):
+        my = Biblio.newbib(os.path.join(self.libdir, 'papers{}.bib'.format(jobs)), '')
+        my.scan_dir(self.somedir, jobs=jobs, on_conflict='r', check_duplicate=True)
+        return [(e['ID'], e['title'], e.get('file')) for e in my.entries]
+
+    def test_scan_files(self):
+        self.assertEqual([(kind, os.path.relpath(path, self.somedir)) for kind, path in scan_files(self.somedir)], [
+            ('entrydir', 'Entry_2010'),
+            ('pdf', 'a/broken.pdf'), ('bib', 'a/refs.bib'),
+            ('pdf', 'b/broken.pdf'), ('bib', 'b/refs.bib'),
+            ('pdf', 'c/broken.pdf'), ('bib', 'c/refs.bib')])
+
+    def test_jobs(self):
+        # same keys, conflicts and order whatever the number of jobs
+        entries = self.scan(jobs=1)
+        self.assertEqual([key for key, _, _ in entries], ['Entry_2010', 'Paper0_2000', 'Paper1_2000', 'Paper2_2000'])
+        self.assertEqual(self.scan(jobs=3), entries)
+
+    def test_ordered_map(self):
+        pool = ThreadPool(4)
+        running = []
+        def work(i):
+            running.append(i)
+            self.assertLessEqual(len(running), 3)
+            time.sleep(0.01*(5-i%5))  # the last submitted complete first
+            running.remove(i)
+            return i*i
+        try:
+            self.assertEqual(list(ordered_map(pool, work, range(20), window=3)), [i*i for i in range(20)])
+        finally:
+            pool.terminate()
+
+    def test_no_doi(self):
+        self.assertRaises(DOIParsingError, parse_doi, 'no doi here', interactive=False)
+
+    def tearDown(self):
+        shutil.rmtree(self.somedir)
+        shutil.rmtree(self.libdir)
+        super(TestIngest, self).tearDown()
+
+
+class TestPdfCache(TempCache, unittest.TestCase):
+
+    def setUp(self):
+        super(TestPdfCache, self).setUp()
+        self.pdf = os.path.join(config.cache, 'paper.pdf')
+        with open(self.pdf, 'w') as f:
+            f.write('not really a pdf')
+
+    def test_digest(self):
+        digest = file_digest(self.pdf)
+        self.assertEqual(digest, hashlib.sha256(b'not really a pdf').hexdigest())
+        with open(self.pdf, 'w') as f:
+            f.write('modified')
+        self.assertEqual(file_digest(self.pdf), hashlib.sha256(b'modified').hexdigest())
+
+    def test_digest_stamp(self):
+        # the content is not read again if (inode, size, mtime) did not change
+        digest = file_digest(self.pdf)
+        past = time.time() - 10
+        os.utime(self.pdf, (past, past))
+        file_digest(self.pdf)
+        with open(self.pdf, 'w') as f:
+            f.write('not really a PDF')  # same size
+        os.utime(self.pdf, (past, past))
+        self.assertEqual(file_digest(self.pdf), digest)
+        os.utime(self.pdf, None)
+        self.assertNotEqual(file_digest(self.pdf), digest)
+
+    def test_same_content(self):
+        other = os.path.join(config.cache, 'copy.pdf')
+        shutil.copy(self.pdf, other)
+        pdf_cache_set(self.pdf, 'doi', 'key', '10.5194/esd-4-11-2013')
+        self.assertEqual(pdf_cache_get(other, 'doi', 'key'), '10.5194/esd-4-11-2013')
+        self.assertIsNone(pdf_cache_get(other, 'doi', 'other key'))
+        self.assertIsNone(pdf_cache_get(other, 'text', 'key'))
+
+    def test_extract(self):
+        # pdftotext is never called for cached values
+        pdf_cache_set(self.pdf, 'text', _pdfhead_key(12, 300, False, None), 'cached text')
+        self.assertEqual(pdfhead(self.pdf), 'cached text')
+        pdf_cache_set(self.pdf, 'doi', _pdfhead_key(12, 300, False, None), '10.5194/esd-4-11-2013')
+        self.assertEqual(extract_pdf_doi(self.pdf), '10.5194/esd-4-11-2013')
+
+    def test_placeholder(self):
+        self.assertTrue(_is_placeholder('@misc{10.1/x,\n doi = {10.1/x},\n}'))
+        self.assertTrue(_is_placeholder('@misc{10.1/x,\n title = "-- check-entry --",\n}'))
+        self.assertFalse(_is_placeholder('@article{X_2000,\n title = {A title},\n}'))
+
+
+
+class PagesBackend(PdfBackend):
+    """ fixed text layer
+    """
+    def __init__(self, name, pages):
+        self.name = name
+        self.pages = pages
+
+    def iter_pages(self, pdf, first=None, last=None):
+        for page in self.pages[(first or 1)-1:last]:
+            yield page
+
+
+class TestOcr(TempCache, unittest.TestCase):
+
+    def setUp(self):
+        super(TestOcr, self).setUp()
+        self.pdf = os.path.join(config.cache, 'scan.pdf')
+        open(self.pdf, 'w').close()
+        PDF_BACKENDS['text'] = PagesBackend('text', ['word '*200+'\f']*3)
+        PDF_BACKENDS['scan'] = PagesBackend('scan', ['\f']*3)
+        PDF_BACKENDS['few'] = PagesBackend('few', ['word '*5+'\f']*3)
+        self._ocr_page = papers.extract._ocr_page
+        self._pdf_page_count = papers.extract.pdf_page_count
+
+    def test_text_layer(self):
+        ocr = extract_stats['ocr']
+        self.assertEqual(pdfhead(self.pdf, backend='text'), ('word '*200+'\f')*2)
+        self.assertEqual(extract_stats['ocr'], ocr)
+        self.assertIsNotNone(pdf_cache_get(self.pdf, 'text', _pdfhead_key(12, 300, False, 'text')))
+
+    @unittest.skipIf(shutil.which('tesseract') and shutil.which('pdftoppm'), 'OCR installed')
+    def test_ocr_not_installed(self):
+        # text layer returned as is, and not cached
+        self.assertEqual(pdfhead(self.pdf, backend='scan'), '\f'*3)
+        self.assertIsNone(pdf_cache_get(self.pdf, 'text', _pdfhead_key(12, 300, False, 'scan')))
+
+    def stub_ocr(self, delay):
+        """ replace _ocr_page: sleeps delay(page, job) seconds, writes in the temporary directory
+        """
+        state = {'running': 0, 'max': 0, 'started': [], 'tmpdirs': set()}
+        lock = threading.Lock()
+        def ocr_page(pdf, page, job):
+            with lock:
+                state['running'] += 1
+                state['max'] = max(state['max'], state['running'])
+                state['started'].append(page)
+                state['tmpdirs'].add(job.tmpdir)
+            try:
+                delay(page, job)
+                with open(os.path.join(job.tmpdir, str(page)+'.txt'), 'w') as f:
+                    f.write('page{} '.format(page)*100)
+                return 'page{} '.format(page)*100 + '\f'
+            finally:
+                with lock:
+                    state['running'] -= 1
+        papers.extract._ocr_page = ocr_page
+        return state
+
+    def test_ocr_order(self):
+        # last pages complete first, concurrently
+        state = self.stub_ocr(lambda page, job: time.sleep(0.02*(9-page)))
+        txt = ''.join(iter_ocr_pages(self.pdf, range(1, 9), jobs=3))
+        self.assertEqual(txt, ''.join('page{} '.format(page)*100 + '\f' for page in range(1, 9)))
+        self.assertEqual(sorted(state['started']), list(range(1, 9)))
+        self.assertEqual(state['max'], 3)
+        self.assertFalse(any(os.path.exists(tmpdir) for tmpdir in state['tmpdirs']))
+
+    def test_ocr_first_page(self):
+        # the header is in the first page: the other pages are not read
+        state = self.stub_ocr(lambda page, job: time.sleep(0.05))
+        self.assertEqual(pdfhead(self.pdf, minwords=100, backend='scan', cache=False, ocr_jobs=4),
+            'page1 '*100 + '\f')
+        self.assertEqual(state['started'], [1])
+        self.assertFalse(any(os.path.exists(tmpdir) for tmpdir in state['tmpdirs']))
+
+    def test_ocr_page_count(self):
+        # the text layer was not read to the end: the page count is not known
+        counted = []
+        def pdf_page_count(pdf):
+            counted.append(pdf)
+            return 3
+        papers.extract.pdf_page_count = pdf_page_count
+        self.stub_ocr(lambda page, job: None)
+        self.assertEqual(pdfhead(self.pdf, minwords=8, backend='few', cache=False), 'page1 '*100 + '\f')
+        self.assertEqual(counted, [self.pdf])
+        counted[:] = []
+        pdfhead(self.pdf, minwords=8, backend='scan', cache=False)
+        self.assertEqual(counted, [])  # all pages read
+
+    def test_ocr_page_count_fails(self):
+        def pdf_page_count(pdf):
+            raise ValueError('no page count')
+        papers.extract.pdf_page_count = pdf_page_count
+        self.stub_ocr(lambda page, job: None)
+        self.assertEqual(pdfhead(self.pdf, minwords=8, backend='few'), ('word '*5+'\f')*2)
+        self.assertIsNone(pdf_cache_get(self.pdf, 'text', _pdfhead_key(12, 8, False, 'few')))
+
+    def test_ocr_stop(self):
+        # pages in progress are stopped (and their programs killed) before cleanup
+        def delay(page, job):
+            if page > 2:
+                job.call(['sleep', '10'])
+        state = self.stub_ocr(delay)
+        pages = iter_ocr_pages(self.pdf, range(1, 9), jobs=4)
+        start = time.time()
+        self.assertEqual([next(pages), next(pages)], ['page{} '.format(page)*100 + '\f' for page in [1, 2]])
+        pages.close()
+        self.assertLess(time.time() - start, 5)
+        self.assertEqual(state['running'], 0)
+        self.assertFalse(any(os.path.exists(tmpdir) for tmpdir in state['tmpdirs']))
+
+    def tearDown(self):
+        del PDF_BACKENDS['text'], PDF_BACKENDS['scan'], PDF_BACKENDS['few']
+        papers.extract._ocr_page = self._ocr_page
+        papers.extract.pdf_page_count = self._pdf_page_count
+        super(TestOcr, self).tearDown()
+
+
 class TestSimple(unittest.TestCase):
 
     def setUp(self):
@@ -258,9 +1259,10 @@ class TestAdd2(TestAdd):
         self.assertTrue(os.path.exists(self.si))
 
 
-class TestAddBib(unittest.TestCase):
+class TestAddBib(TempCache, unittest.TestCase):
 
     def setUp(self):
+        super(TestAddBib, self).setUp()
         self.mybib = tempfile.mktemp(prefix='papers.bib')
         self.somebib = tempfile.mktemp(prefix='papers.somebib.bib')
         self.pdf1, self.doi, self.key1, self.newkey1, self.year, self.bibtex1 = prepare_paper()
@@ -282,6 +1284,7 @@ class TestAddBib(unittest.TestCase):
         os.remove(self.somebib)
         if os.path.exists('.papersconfig.json'):
             os.remove('.papersconfig.json')
+        super(TestAddBib, self).tearDown()
 
 
 class TestAddDir(unittest.TestCase):
@@ -486,15 +1489,17 @@ class TestDuplicatesPartial(SimilarityBase, TestDuplicates):
 
 
 
-class TestDuplicatesAdd(SimilarityBase, TestDuplicates):
+class TestDuplicatesAdd(TempCache, SimilarityBase, TestDuplicates):
 
     def setUp(self):
+        super(TestDuplicatesAdd, self).setUp()
         self.mybib = tempfile.mktemp(prefix='papers.bib')
         self.otherbib = tempfile.mktemp(prefix='papers.otherbib')
 
     def tearDown(self):
         os.remove(self.mybib)
         os.remove(self.otherbib)
+        super(TestDuplicatesAdd, self).tearDown()
 
     def isduplicate(self, a, b):
         """test Biblio's eq method in 'add' mode
@@ -514,7 +1519,7 @@ class TestDuplicatesAdd(SimilarityBase, TestDuplicates):
 
 
 
-class TestAddResolveDuplicate(BibTest):
+class TestAddResolveDuplicate(TempCache, BibTest):
 
     original = """@article{Perrette_2011,
  doi = {10.5194/bg-8-515-2011},
@@ -531,6 +1536,7 @@ class TestAddResolveDuplicate(BibTest):
 
 
     def setUp(self):
+        super(TestAddResolveDuplicate, self).setUp()
         self.mybib = tempfile.mktemp(prefix='papers.bib')
         self.otherbib = tempfile.mktemp(prefix='papers.otherbib')
         open(self.mybib, 'w').write(self.original)
@@ -538,6 +1544,7 @@ class TestAddResolveDuplicate(BibTest):
     def tearDown(self):
         os.remove(self.mybib)
         os.remove(self.otherbib)
+        super(TestAddResolveDuplicate, self).tearDown()
 
     def command(self, mode):
         return 'echo {} | papers add {} --bibtex {} --debug'.format(mode, self.otherbib, self.mybib)
@@ -623,7 +1630,7 @@ class TestAddResolveDuplicateCommand(TestAddResolveDuplicate):
 
 
 
-class TestCheckResolveDuplicate(BibTest):
+class TestCheckResolveDuplicate(TempCache, BibTest):
 
     original = """@article{Perrette_2011,
  doi = {10.5194/bg-8-515-2011},
@@ -640,11 +1647,13 @@ class TestCheckResolveDuplicate(BibTest):
 
 
     def setUp(self):
+        super(TestCheckResolveDuplicate, self).setUp()
         self.mybib = tempfile.mktemp(prefix='papers.bib')
         open(self.mybib, 'w').write(self.original + '\n\n' + self.conflict)
 
     def tearDown(self):
         os.remove(self.mybib)
+        super(TestCheckResolveDuplicate, self).tearDown()
 
     def command(self, mode):
         return 'echo {} | papers check --duplicates --bibtex {} --debug'.format(mode, self.mybib)
@@ -666,7 +1675,7 @@ class TestCheckResolveDuplicate(BibTest):
 
     def test_skip_check(self):
 
-        expected = self.conflict + '\n\n' + self.original
+        expected = self.original + '\n\n' + self.conflict  # not rewritten
 
         sp.check_call(self.command('s'), shell=True)
         self.assertMultiLineEqual(open(self.mybib).read().strip(), expected) # entries did not change
@@ -674,12 +1683,22 @@ class TestCheckResolveDuplicate(BibTest):
 
     def test_not_a_duplicate(self):
 
-        expected = self.conflict + '\n\n' + self.original
+        expected = self.original + '\n\n' + self.conflict  # not rewritten
 
         sp.check_call(self.command('n'), shell=True)
         self.assertMultiLineEqual(open(self.mybib).read().strip(), expected) # entries did not change
 
 
+    def test_not_a_duplicate_remembered(self):
+        sp.check_call(self.command('n'), shell=True)
+        state = DuplicateState.load(duplicate_state_file(self.mybib))  # other settings: keeps pairs
+        pair = frozenset(entry_fingerprint(e) for e in Biblio.load(self.mybib, '').entries)
+        self.assertEqual(len(pair), 2)
+        self.assertIn(pair, state.distinct)
+        # validated pair: not merged
+        sp.check_call('papers check --duplicates -m m --bibtex {}'.format(self.mybib), shell=True)
+        self.assertMultiLineEqual(open(self.mybib).read().strip(), self.original + '\n\n' + self.conflict)
+
     def test_raises(self):
         # update key to new entry, but does not merge...
         func = lambda: sp.check_call(self.command('r'), shell=True)
@@ -703,13 +1722,39 @@ class TestUnicode(BibTest):
     pass
 
 
-class TestUnicodeVsLatexEncoding(BibTest):
-    pass
+class TestUnicodeVsLatexEncoding(TempCache, BibTest):
+
+    bibtex = u"""@article{Muller_2000,
+ author = {M\xfcller, K.},
+ title = {Ocean {CO2} \\% in \xc5land},
+ year = {2000}
+}
+"""
+
+    def setUp(self):
+        super(TestUnicodeVsLatexEncoding, self).setUp()
+        fd, self.mybib = tempfile.mkstemp(prefix='papers.bib')
+        os.close(fd)
+        io.open(self.mybib, 'w', encoding='utf-8').write(self.bibtex)
+
+    def tearDown(self):
+        os.remove(self.mybib)
+        super(TestUnicodeVsLatexEncoding, self).tearDown()
+
+    def test_latex(self):
+        run('papers check --bibtex {} --encoding latex --force'.format(self.mybib))
+        e = Biblio.load(self.mybib, '').entries[0]
+        self.assertEqual(e['author'], r'M{\"u}ller, K.')
+        self.assertEqual(e['title'], r'Ocean {CO2} \% in {\AA}land')
+
+        run('papers check --bibtex {} --encoding unicode --force'.format(self.mybib))
+        e = Biblio.load(self.mybib, '').entries[0]
+        self.assertEqual(e['author'], u'M\xfcller, K.')
 
 
 ## KEEP FOR NOW BUT TRASH ASAP:
 
-class TestAddConflict(BibTest):
+class TestAddConflict(TempCache, BibTest):
     ## TODO: tear down in several smaller tests
 
     bibtex = """@article{Perrette_2011,
@@ -799,6 +1844,7 @@ class TestAddConflict(BibTest):
 
 
     def setUp(self):
+        super(TestAddConflict, self).setUp()
         self.mybib = tempfile.mktemp(prefix='papers.bib')
         self.filesdir = tempfile.mktemp(prefix='papers.files')
         self.otherbib = tempfile.mktemp(prefix='papers.otherbib')
@@ -817,6 +1863,7 @@ class TestAddConflict(BibTest):
             os.remove(self.otherbib)
         if os.path.exists('.papersconfig.json'):
             os.remove('.papersconfig.json')
+        super(TestAddConflict, self).tearDown()
 
 
     def test_add_same(self):